@@ -0,0 +1,107 @@
+"""
+Compare sequential and concurrent provisioning of Restful Booker test data.
+
+Each mode creates, reads back and deletes --count bookings. Sequential mode
+uses clients.BookerClient one request at a time (what a loop over
+created_booking-style fixtures costs); bulk mode uses
+clients.AsyncBookerClient with --concurrency requests in flight.
+
+By default the API is the in-process stand-in with --latency ms added to
+every response, so the numbers show round-trip cost rather than internet
+noise.
+
+Usage:
+    uv run python benchmarks/bench_booker_bulk.py
+    uv run python benchmarks/bench_booker_bulk.py --count 100 --latency 80
+    uv run python benchmarks/bench_booker_bulk.py --base-url https://restful-booker.herokuapp.com
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from clients import BookerClient, run_bulk  # noqa: E402
+from stubs import BookerServer  # noqa: E402
+
+CREDENTIALS = {"username": "admin", "password": "password123"}
+
+
+def make_payloads(count):
+    """Return ``count`` distinct booking payloads."""
+    return [
+        {
+            "firstname": f"Bench{i}",
+            "lastname": "Bulk",
+            "totalprice": i,
+            "depositpaid": True,
+            "bookingdates": {"checkin": "2026-01-01", "checkout": "2026-01-02"},
+        }
+        for i in range(count)
+    ]
+
+
+def run_sequential(base_url, payloads):
+    """Create, read and delete every booking one request at a time."""
+    with BookerClient(base_url) as client:
+        token = client.create_token(**CREDENTIALS)
+        start = time.perf_counter()
+        ids = [client.create_booking(p).json()["bookingid"] for p in payloads]
+        for booking_id in ids:
+            client.get_booking(booking_id)
+        for booking_id in ids:
+            client.delete_booking(booking_id, token=token)
+        return time.perf_counter() - start
+
+
+def run_concurrent(base_url, payloads, concurrency):
+    """Create, read and delete every booking in three concurrent batches."""
+
+    async def flow(client):
+        token = await client.create_token(**CREDENTIALS)
+        start = time.perf_counter()
+        created = await client.create_bookings(payloads)
+        ids = [response.json()["bookingid"] for response in created]
+        await client.get_bookings(ids)
+        await client.delete_bookings(ids, token=token)
+        return time.perf_counter() - start
+
+    return run_bulk(base_url, flow, concurrency=concurrency)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument(
+        "--latency", type=int, default=50, help="Per-response delay in ms"
+    )
+    parser.add_argument(
+        "--base-url", default=None, help="API URL (default: local stand-in)"
+    )
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = BookerServer(latency=args.latency / 1000).start()
+        base_url = server.url
+
+    payloads = make_payloads(args.count)
+    sequential = run_sequential(base_url, payloads)
+    concurrent = run_concurrent(base_url, payloads, args.concurrency)
+
+    if server is not None:
+        server.stop()
+
+    print(f"{args.count} bookings created, read and deleted against {base_url}")
+    print(f"sequential  {sequential * 1000:8.1f} ms")
+    print(f"concurrent  {concurrent * 1000:8.1f} ms   (concurrency {args.concurrency})")
+    print(f"speedup: {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Compare fresh-context-per-test against the pooled contexts of --context-pool.
+
+Each iteration mimics the fixture work of one short test: get a context and
+page, open the login page, then give the context back. Fresh mode creates and
+closes a context every time (pytest-playwright's default); pooled mode uses
+utils.ContextPool exactly as the conftest context fixture does.
+
+By default the pages are served by the local Sauce Demo stand-in, so the
+numbers measure browser overhead rather than internet latency.
+
+Usage:
+    uv run python benchmarks/bench_context_pool.py
+    uv run python benchmarks/bench_context_pool.py --iterations 50 --browser firefox
+    uv run python benchmarks/bench_context_pool.py --base-url https://www.saucedemo.com
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from models import LoginPage  # noqa: E402
+from stubs import SauceDemoServer  # noqa: E402
+from utils import ContextPool  # noqa: E402
+
+
+def run_fresh(browser, base_url, iterations):
+    """Time new_context + new_page + goto + close per iteration."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        context = browser.new_context(base_url=base_url)
+        page = context.new_page()
+        page.goto(LoginPage.PAGE_URL)
+        context.close()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_pooled(browser, base_url, iterations):
+    """Time acquire + goto + release per iteration."""
+    pool = ContextPool(browser, {"base_url": base_url})
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        context = pool.acquire()
+        context.pages[0].goto(LoginPage.PAGE_URL)
+        pool.release(context)
+        timings.append(time.perf_counter() - start)
+    pool.close()
+    return timings, pool.stats()
+
+
+def summarize(label, timings):
+    """Print mean, median and p95 of a list of durations in milliseconds."""
+    ms = sorted(t * 1000 for t in timings)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(
+        f"{label:<8} mean {statistics.mean(ms):8.1f} ms   "
+        f"median {statistics.median(ms):8.1f} ms   p95 {p95:8.1f} ms"
+    )
+    return statistics.mean(ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument(
+        "--base-url", default=None, help="Application URL (default: local stand-in)"
+    )
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        with open(ROOT / "test_data" / "products.json") as f:
+            server = SauceDemoServer(json.load(f)).start()
+        base_url = server.url
+
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch()
+        # Warm up the browser process so neither mode pays for first use
+        run_fresh(browser, base_url, 1)
+
+        fresh = run_fresh(browser, base_url, args.iterations)
+        pooled, stats = run_pooled(browser, base_url, args.iterations)
+        browser.close()
+
+    if server is not None:
+        server.stop()
+
+    print(f"{args.iterations} iterations on {args.browser} against {base_url}")
+    fresh_mean = summarize("fresh", fresh)
+    pooled_mean = summarize("pooled", pooled)
+    print(f"pool stats: {stats}")
+    print(f"speedup: {fresh_mean / pooled_mean:.2f}x per test setup/teardown")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Measure what importing the page object packages costs a fresh process.
+
+Every pytest-xdist worker is a new interpreter that imports conftest.py and,
+through it, the page objects. Each scenario below runs in its own fresh
+interpreter, --iterations times, and reports the median time and the number
+of modules it imported (interpreter startup excluded):
+
+- "import models": the package alone; page classes load on first access
+- "from models import LoginPage": one page (and its base classes)
+- "all pages": every exported class, what the package used to import eagerly
+- "check transitions": the page transition check run before the tests
+- the same for models.aio
+
+Usage:
+    uv run python benchmarks/bench_models_import.py
+    uv run python benchmarks/bench_models_import.py --iterations 50
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import models": "import models",
+    "from models import LoginPage": "from models import LoginPage",
+    "all pages": "import models\nfor name in models.__all__: getattr(models, name)",
+    "check transitions": "import models.transitions\nmodels.transitions.check_transitions()",
+    "import models.aio": "import models.aio",
+    "all async pages": (
+        "import models.aio\nfor name in models.aio.__all__: getattr(models.aio, name)"
+    ),
+}
+
+# Times the statement in the child, so interpreter startup is left out
+PROBE = """
+import json, sys, time
+before = len(sys.modules)
+start = time.perf_counter()
+exec(compile({statement!r}, "<scenario>", "exec"))
+print(json.dumps([time.perf_counter() - start, len(sys.modules) - before]))
+"""
+
+
+def measure(statement):
+    """Run ``statement`` in a fresh interpreter; return (seconds, modules)."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"median of {args.iterations} fresh interpreters per scenario")
+    print(f"{'time':>9}  {'modules':>7}  scenario")
+    for name, statement in SCENARIOS.items():
+        runs = [measure(statement) for _ in range(args.iterations)]
+        seconds = statistics.median(run[0] for run in runs)
+        modules = max(run[1] for run in runs)
+        print(f"{seconds * 1000:>7.1f}ms  {modules:>7}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Measure page-object throughput against the local Sauce Demo stand-in.
+
+Each iteration drives one full purchase through the page objects in models/
+(login, add two products, cart, checkout form, overview, finish) in a fresh
+context. The stand-in removes internet round trips, so the result reflects
+the cost of the page objects and the browser; --latency adds a fixed delay
+per response to see how the flow degrades on a slower host.
+
+With --concurrency N the same flow runs through the async page objects in
+models/aio/, N contexts at a time on one browser in one process.
+
+Usage:
+    uv run python benchmarks/bench_page_objects.py
+    uv run python benchmarks/bench_page_objects.py --iterations 20 --latency 50
+    uv run python benchmarks/bench_page_objects.py --iterations 40 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from playwright.async_api import async_playwright
+from playwright.sync_api import sync_playwright
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from models import LoginPage  # noqa: E402
+from models.aio import LoginPage as AsyncLoginPage  # noqa: E402
+from stubs import SauceDemoServer  # noqa: E402
+
+
+def purchase_flow(page, users, checkout):
+    """Drive one complete purchase through the page objects."""
+    user = users["standard_user"]
+    customer = checkout["valid_customer"]
+
+    login_page = LoginPage(page).navigate()
+    inventory = login_page.login(user["username"], user["password"])
+    for name in checkout["expected_cart_items"]:
+        inventory.add_to_cart_by_name(name)
+    cart = inventory.click_cart()
+    step_one = cart.proceed_to_checkout()
+    step_two = step_one.submit_form(
+        customer["first_name"], customer["last_name"], customer["postal_code"]
+    )
+    step_two.get_item_names()
+    step_two.verify_calculations()
+    complete = step_two.finish_order()
+    assert complete.is_success(), "Benchmark flow did not complete the order"
+
+
+async def async_purchase_flow(page, users, checkout):
+    """Drive one complete purchase through the async page objects."""
+    user = users["standard_user"]
+    customer = checkout["valid_customer"]
+
+    login_page = await AsyncLoginPage(page).navigate()
+    inventory = await login_page.login(user["username"], user["password"])
+    for name in checkout["expected_cart_items"]:
+        await inventory.add_to_cart_by_name(name)
+    cart = await inventory.click_cart()
+    step_one = await cart.proceed_to_checkout()
+    step_two = await step_one.submit_form(
+        customer["first_name"], customer["last_name"], customer["postal_code"]
+    )
+    await step_two.get_item_names()
+    await step_two.verify_calculations()
+    complete = await step_two.finish_order()
+    assert await complete.is_success(), "Benchmark flow did not complete the order"
+
+
+def run_sync(args, base_url, data):
+    """Run the flows one after another.
+
+    Returns:
+        tuple: Per-flow timings (warm-up flow first) and the measured
+            flows' total time
+    """
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch()
+        timings = []
+        for _ in range(args.iterations + 1):
+            context = browser.new_context(base_url=base_url)
+            page = context.new_page()
+            start = time.perf_counter()
+            purchase_flow(page, data["users"], data["checkout"])
+            timings.append(time.perf_counter() - start)
+            context.close()
+        browser.close()
+    return timings, sum(timings[1:])
+
+
+async def run_concurrent(args, base_url, data):
+    """Run the flows --concurrency at a time.
+
+    Returns:
+        tuple: Per-flow timings (warm-up flow first) and the wall-clock time
+            of the measured flows
+    """
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, args.browser).launch()
+        slots = asyncio.Semaphore(args.concurrency)
+
+        async def one_flow():
+            async with slots:
+                context = await browser.new_context(base_url=base_url)
+                page = await context.new_page()
+                start = time.perf_counter()
+                await async_purchase_flow(page, data["users"], data["checkout"])
+                elapsed = time.perf_counter() - start
+                await context.close()
+                return elapsed
+
+        # Warm-up flow first, on its own, like the sync run
+        timings = [await one_flow()]
+        start = time.perf_counter()
+        timings += await asyncio.gather(*(one_flow() for _ in range(args.iterations)))
+        wall = time.perf_counter() - start
+        await browser.close()
+    return timings, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument(
+        "--latency", type=int, default=0, help="Per-response delay in ms"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Flows in flight at once (above 1, uses the async page objects)",
+    )
+    args = parser.parse_args()
+
+    data = {}
+    for name in ("users", "products", "checkout"):
+        with open(ROOT / "test_data" / f"{name}.json") as f:
+            data[name] = json.load(f)
+
+    with SauceDemoServer(data["products"], latency=args.latency / 1000) as server:
+        if args.concurrency > 1:
+            timings, wall = asyncio.run(run_concurrent(args, server.url, data))
+        else:
+            timings, wall = run_sync(args, server.url, data)
+
+    # Drop the first iteration: it pays for browser warm-up
+    timings = timings[1:]
+    print(
+        f"{args.iterations} purchase flows on {args.browser}, "
+        f"{args.latency} ms added latency, concurrency {args.concurrency}"
+    )
+    print(
+        f"mean {statistics.mean(timings) * 1000:.1f} ms   "
+        f"median {statistics.median(timings) * 1000:.1f} ms   "
+        f"throughput {args.iterations / wall:.2f} flows/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
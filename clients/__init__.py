@@ -0,0 +1,10 @@
+from .booker import BookerClient, Booking, BookingDates
+from .booker_async import AsyncBookerClient, run_bulk
+
+__all__ = [
+    "AsyncBookerClient",
+    "BookerClient",
+    "Booking",
+    "BookingDates",
+    "run_bulk",
+]
@@ -0,0 +1,171 @@
+from typing import NotRequired, TypedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class BookingDates(TypedDict):
+    checkin: str
+    checkout: str
+
+
+class Booking(TypedDict):
+    firstname: str
+    lastname: str
+    totalprice: int
+    depositpaid: bool
+    bookingdates: BookingDates
+    additionalneeds: NotRequired[str]
+
+
+class BookerClient:
+    """Restful Booker API client on one pooled, keep-alive ``requests.Session``.
+
+    Every call goes through the same session, so the TCP/TLS connection to
+    the API is opened once per pool slot and reused for later requests
+    instead of once per call. Responses are returned as-is so tests can
+    assert on status codes, including the negative cases.
+
+    Transient failures (connection errors and 429/502/503/504) are retried
+    with exponential backoff for idempotent methods only (GET, PUT, DELETE,
+    ...); POST and PATCH are never replayed, so a retry cannot create a
+    duplicate booking.
+
+    Authenticated calls take the token explicitly and send it as a
+    per-request cookie; it is never stored on the session, so unauthenticated
+    calls stay unauthenticated.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float | tuple[float, float] = (3.05, 10),
+        retries: int = 3,
+        backoff_factor: float = 0.2,
+        pool_maxsize: int = 10,
+    ):
+        """
+        Args:
+            base_url: API root, e.g. https://restful-booker.herokuapp.com
+            timeout: Seconds, or (connect, read) seconds, for every request
+            retries: Retry attempts for idempotent requests
+            backoff_factor: Backoff base in seconds between retries
+            pool_maxsize: Connections kept open to the API host
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/json"})
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the session and every pooled connection."""
+        self.session.close()
+
+    # -------------------------------------------------------------------------
+    # Endpoints
+    # -------------------------------------------------------------------------
+
+    def ping(self) -> requests.Response:
+        """GET /ping - health check (201 when the API is up)."""
+        return self._request("GET", "/ping")
+
+    def auth(self, username: str, password: str) -> requests.Response:
+        """POST /auth - request a token for the given credentials."""
+        return self._request(
+            "POST", "/auth", json={"username": username, "password": password}
+        )
+
+    def create_token(self, username: str, password: str) -> str:
+        """Return a token for the credentials, raising if none is issued."""
+        response = self.auth(username, password)
+        response.raise_for_status()
+        token = response.json().get("token")
+        if not token:
+            raise RuntimeError(f"Booker auth did not return a token: {response.text}")
+        return token
+
+    def get_booking_ids(self, **filters: str) -> requests.Response:
+        """GET /booking - booking ids, optionally filtered.
+
+        Args:
+            **filters: Any of firstname, lastname, checkin, checkout
+        """
+        return self._request("GET", "/booking", params=filters or None)
+
+    def get_booking(self, booking_id: int) -> requests.Response:
+        """GET /booking/{id} - a single booking."""
+        return self._request("GET", f"/booking/{booking_id}")
+
+    def create_booking(self, booking: Booking) -> requests.Response:
+        """POST /booking - create a booking."""
+        return self._request("POST", "/booking", json=booking)
+
+    def update_booking(
+        self, booking_id: int, booking: Booking, token: str | None = None
+    ) -> requests.Response:
+        """PUT /booking/{id} - replace a booking."""
+        return self._request("PUT", f"/booking/{booking_id}", json=booking, token=token)
+
+    def partial_update_booking(
+        self, booking_id: int, fields: dict, token: str | None = None
+    ) -> requests.Response:
+        """PATCH /booking/{id} - update only the given fields."""
+        return self._request(
+            "PATCH", f"/booking/{booking_id}", json=fields, token=token
+        )
+
+    def delete_booking(
+        self, booking_id: int, token: str | None = None
+    ) -> requests.Response:
+        """DELETE /booking/{id} - delete a booking."""
+        return self._request("DELETE", f"/booking/{booking_id}", token=token)
+
+    # -------------------------------------------------------------------------
+    # Connection statistics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        """Return request and connection counts for this client.
+
+        ``requests`` counts every request sent on the wire, retries
+        included; ``connections`` counts the connections opened for them.
+        Everything else went over an already open connection.
+        """
+        pools = self._adapter.poolmanager.pools
+        sent = opened = 0
+        # The pool container refuses plain iteration; keys() takes a locked copy
+        for key in pools.keys():
+            pool = pools[key]
+            sent += pool.num_requests
+            opened += pool.num_connections
+        return {
+            "requests": sent,
+            "connections": opened,
+            "reused": max(sent - opened, 0),
+        }
+
+    def _request(self, method, path, token=None, **kwargs) -> requests.Response:
+        if token is not None:
+            kwargs["cookies"] = {"token": token}
+        return self.session.request(
+            method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs
+        )
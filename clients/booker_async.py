@@ -0,0 +1,134 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+
+import httpx
+
+from .booker import Booking
+
+
+class AsyncBookerClient:
+    """Asyncio Restful Booker client for bulk create/read/delete.
+
+    Built on ``httpx.AsyncClient`` for data-heavy setup: the bulk methods
+    send all requests at once, bounded by ``concurrency`` (both in-flight
+    requests and open connections), so provisioning N bookings costs about
+    N / concurrency round trips instead of N.
+
+    Like BookerClient, responses are returned as-is and the token is sent
+    per request as a cookie. Connection failures are retried by the
+    transport; HTTP errors are left to the caller.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        concurrency: int = 10,
+        timeout: float = 10.0,
+        retries: int = 3,
+    ):
+        """
+        Args:
+            base_url: API root, e.g. https://restful-booker.herokuapp.com
+            concurrency: Maximum requests in flight (and connections open)
+            timeout: Seconds for every request
+            retries: Retry attempts for failed connection attempts
+        """
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client = httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            headers={"Accept": "application/json"},
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=concurrency, max_keepalive_connections=concurrency
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=retries),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close every pooled connection."""
+        await self._client.aclose()
+
+    # -------------------------------------------------------------------------
+    # Single requests
+    # -------------------------------------------------------------------------
+
+    async def create_token(self, username: str, password: str) -> str:
+        """Return a token for the credentials, raising if none is issued."""
+        response = await self._request(
+            "POST", "/auth", json={"username": username, "password": password}
+        )
+        response.raise_for_status()
+        token = response.json().get("token")
+        if not token:
+            raise RuntimeError(f"Booker auth did not return a token: {response.text}")
+        return token
+
+    async def create_booking(self, booking: Booking) -> httpx.Response:
+        """POST /booking - create a booking."""
+        return await self._request("POST", "/booking", json=booking)
+
+    async def get_booking(self, booking_id: int) -> httpx.Response:
+        """GET /booking/{id} - a single booking."""
+        return await self._request("GET", f"/booking/{booking_id}")
+
+    async def delete_booking(
+        self, booking_id: int, token: str | None = None
+    ) -> httpx.Response:
+        """DELETE /booking/{id} - delete a booking."""
+        return await self._request("DELETE", f"/booking/{booking_id}", token=token)
+
+    # -------------------------------------------------------------------------
+    # Bulk requests (results are in input order)
+    # -------------------------------------------------------------------------
+
+    async def create_bookings(
+        self, bookings: Iterable[Booking]
+    ) -> list[httpx.Response]:
+        """Create every booking concurrently."""
+        return await asyncio.gather(*(self.create_booking(b) for b in bookings))
+
+    async def get_bookings(self, booking_ids: Iterable[int]) -> list[httpx.Response]:
+        """Fetch every booking concurrently."""
+        return await asyncio.gather(*(self.get_booking(i) for i in booking_ids))
+
+    async def delete_bookings(
+        self, booking_ids: Iterable[int], token: str | None = None
+    ) -> list[httpx.Response]:
+        """Delete every booking concurrently."""
+        return await asyncio.gather(
+            *(self.delete_booking(i, token=token) for i in booking_ids)
+        )
+
+    async def _request(self, method, path, token=None, **kwargs) -> httpx.Response:
+        if token is not None:
+            # httpx deprecates per-request cookies; send the header directly
+            kwargs["headers"] = {"Cookie": f"token={token}"}
+        async with self._semaphore:
+            return await self._client.request(method, path, **kwargs)
+
+
+def run_bulk[T](
+    base_url: str,
+    operation: Callable[[AsyncBookerClient], Awaitable[T]],
+    **client_args,
+) -> T:
+    """Run ``operation`` with a fresh AsyncBookerClient from synchronous code.
+
+    Fixtures and tests are synchronous, so each batch gets its own event
+    loop and client; the client is closed before returning.
+
+    Example:
+        responses = run_bulk(url, lambda client: client.create_bookings(payloads))
+    """
+
+    async def main():
+        async with AsyncBookerClient(base_url, **client_args) as client:
+            return await operation(client)
+
+    return asyncio.run(main())
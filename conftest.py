@@ -1,16 +1,381 @@
-import json
+import dataclasses
 import os
+import subprocess
+import time
 from pathlib import Path
 
 import pytest
 from dotenv import load_dotenv
-from playwright.sync_api import Page
+from playwright.sync_api import BrowserContext, Page
 
 # Load environment variables from .env file if it exists
 env_path = Path(__file__).parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
 
+# Feature plugins with their own options, fixtures, hooks and summary sections
+pytest_plugins = ["utils.plugins.async_pages", "utils.plugins.scheduling"]
+
+
+def pytest_addoption(parser):
+    """Register project command-line options."""
+    group = parser.getgroup("saucedemo", "Sauce Demo test options")
+    group.addoption(
+        "--context-pool",
+        action="store_true",
+        default=False,
+        help="Reuse warm browser contexts between tests within each worker.",
+    )
+    group.addoption(
+        "--asset-blocking",
+        choices=("on", "off"),
+        default="on",
+        help="Stub images and block fonts, media and third-party requests "
+        "(default: on). Tests marked full_assets always load everything.",
+    )
+    group.addoption(
+        "--record-har",
+        metavar="PATH",
+        default=None,
+        help="Record all application traffic into a HAR archive.",
+    )
+    group.addoption(
+        "--replay-har",
+        metavar="PATH",
+        default=None,
+        help="Serve all application traffic from a recorded HAR archive "
+        "(no network). Requests missing from the archive are reported.",
+    )
+    group.addoption(
+        "--local-app",
+        action="store_true",
+        default=False,
+        help="Run UI tests against the bundled local Sauce Demo stand-in "
+        "(overrides --base-url).",
+    )
+    group.addoption(
+        "--local-app-latency",
+        metavar="MS",
+        type=int,
+        default=0,
+        help="Delay every response of the local stand-in by MS milliseconds.",
+    )
+    group.addoption(
+        "--booker-url",
+        metavar="URL",
+        default=os.getenv("BOOKER_URL", "https://restful-booker.herokuapp.com"),
+        help="Restful Booker instance the API tests run against "
+        "(default: $BOOKER_URL or the public herokuapp host).",
+    )
+    group.addoption(
+        "--local-booker",
+        action="store_true",
+        default=False,
+        help="Run API tests against the bundled in-process Restful Booker "
+        "stand-in (overrides --booker-url).",
+    )
+    group.addoption(
+        "--local-booker-latency",
+        metavar="MS",
+        type=int,
+        default=0,
+        help="Delay every response of the local Booker stand-in by MS milliseconds.",
+    )
+    group.addoption(
+        "--local-booker-error-rate",
+        metavar="RATE",
+        type=float,
+        default=0.0,
+        help="Fraction (0-1) of local Booker stand-in responses that fail with 503.",
+    )
+    group.addoption(
+        "--hard-sleeps",
+        choices=("report", "fail", "allow"),
+        default="report",
+        help="What to do with fixed sleeps (page.wait_for_timeout, time.sleep, "
+        "asyncio.sleep) in tests and page objects: list them in the summary "
+        "(default), fail the test, or allow them silently.",
+    )
+    group.addoption(
+        "--timings-db",
+        metavar="PATH",
+        default=".test-timings.db",
+        help="SQLite timing history every run is appended to, read by "
+        "scripts/timing_report.py (default: .test-timings.db; 'off' disables).",
+    )
+    group.addoption(
+        "--timings-keep",
+        metavar="N",
+        type=int,
+        default=200,
+        help="Keep only the latest N runs in --timings-db, deleting older ones "
+        "after each run (default: 200; 0 keeps every run).",
+    )
+    group.addoption(
+        "--action-timings",
+        metavar="PATH",
+        default=None,
+        help="Time every public page object method and write call counts, "
+        "cumulative and p95 latency and the slowest call sites to PATH as "
+        "JSON (also shown in the HTML report). Off by default.",
+    )
+    group.addoption(
+        "--rpc-profile",
+        metavar="PATH",
+        default=None,
+        help="Count and time every Playwright driver round trip per test, "
+        "page object method and call site, flag chatty methods and write "
+        "the results to PATH as JSON. Off by default.",
+    )
+    group.addoption(
+        "--rpc-speedscope",
+        metavar="PATH",
+        default=None,
+        help="Like --rpc-profile, and write the round trips as a speedscope "
+        "profile (https://www.speedscope.app) to PATH.",
+    )
+    group.addoption(
+        "--checkout-cases",
+        metavar="N",
+        type=int,
+        default=10,
+        help="Number of generated checkout cases for tests using "
+        "checkout_cases (default: 10).",
+    )
+    group.addoption(
+        "--checkout-seed",
+        metavar="SEED",
+        type=int,
+        default=0,
+        help="Seed of the generated checkout cases (default: 0). The same "
+        "seed always generates the same cases.",
+    )
+    group.addoption(
+        "--checkout-cases-per-test",
+        metavar="K",
+        type=int,
+        default=1,
+        help="Generated checkout cases run by each collected test (default: 1). "
+        "Raise it for large --checkout-cases runs: collection makes one test "
+        "per K cases.",
+    )
+
+
+def pytest_configure(config):
+    """Validate option combinations and page transitions, and load the test
+    data registry.
+
+    The xdist controller configures before its workers start, so it is the
+    one process that parses test_data/*.json; the workers unpickle its cache.
+    """
+    if config.getoption("--record-har") and config.getoption("--replay-har"):
+        raise pytest.UsageError("--record-har and --replay-har are exclusive")
+    if not 0 <= config.getoption("--local-booker-error-rate") <= 1:
+        raise pytest.UsageError("--local-booker-error-rate must be between 0 and 1")
+    if config.getoption("--checkout-cases") < 0:
+        raise pytest.UsageError("--checkout-cases must be at least 0")
+    if config.getoption("--checkout-cases-per-test") < 1:
+        raise pytest.UsageError("--checkout-cases-per-test must be at least 1")
+    if config.getoption("--timings-keep") < 0:
+        raise pytest.UsageError("--timings-keep must be at least 0")
+    if not hasattr(config, "workerinput"):
+        # Once per run: xdist workers start from the same sources
+        _check_page_transitions()
+    _test_data.append(_load_test_data(config))
+
+    if config.getoption("--action-timings"):
+        from utils import ActionTimer
+
+        sync_base, async_base = _page_object_bases()
+        timer = ActionTimer(config.rootpath)
+        timer.install(sync_base)
+        timer.install(async_base, prefix="aio.")
+        _action_timers.append(timer)
+
+    if config.getoption("--rpc-profile") or config.getoption("--rpc-speedscope"):
+        from utils import RpcProfiler, RpcProfilerError
+
+        sync_base, async_base = _page_object_bases()
+        root = config.rootpath
+        profiler = RpcProfiler(
+            root,
+            roots=(
+                root / "tests",
+                root / "models",
+                root / "utils",
+                root / "conftest.py",
+            ),
+        )
+        try:
+            profiler.install(sync_base)
+        except RpcProfilerError as exc:
+            raise pytest.UsageError(f"--rpc-profile: {exc}") from None
+        profiler.install(async_base, prefix="aio.")
+        _rpc_profilers.append(profiler)
+
+
+def _check_page_transitions():
+    """Fail the run when a page object method navigates to a page that does
+    not exist or is missing from models/transitions.py (sync and async)."""
+    import models.aio.transitions
+    import models.transitions
+
+    problems = (
+        models.transitions.check_transitions()
+        + models.aio.transitions.check_transitions()
+    )
+    if problems:
+        raise pytest.UsageError(
+            "page transitions do not match models/transitions.py:\n  "
+            + "\n  ".join(problems)
+        )
+
+
+def _page_object_bases():
+    """Return models.BasePage and models.aio.BasePage with every page class
+    imported, so wrapping their subclasses covers all pages (the models
+    packages import page classes on first use)."""
+    import models
+    import models.aio
+
+    for package in (models, models.aio):
+        for name in package.__all__:
+            getattr(package, name)
+    return models.BasePage, models.aio.BasePage
+
+
+def pytest_unconfigure(config):
+    """Put back the page object methods --action-timings and the RPC
+    profiler wrapped (in reverse order, as the profiler wraps the timer's
+    wrappers)."""
+    for profiler in _rpc_profilers:
+        profiler.uninstall()
+    for timer in _action_timers:
+        timer.uninstall()
+
+
+def pytest_sessionstart(session):
+    """Note when the run started, for the timing history."""
+    _timings["started"] = time.time()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Merge the per-context HAR fragments of a --record-har run and add this
+    run's test timings to the timing history.
+
+    Runs once all contexts are closed: on the xdist controller, or in the
+    only process when running without xdist. On an xdist worker, hands the
+    Booker client connection counts, cleanup results, page object cache and
+    context pool counts, fixture setup times, page object action timings and Playwright
+    round trips to the controller instead.
+    """
+    from models.base import page_objects
+    from utils import HarRouter
+
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["booker_connections"] = _booker_connections
+        session.config.workeroutput["booker_cleanup"] = _booker_cleanup
+        session.config.workeroutput["page_objects"] = page_objects.stats()
+        session.config.workeroutput["context_pool"] = _context_pool_counts
+        session.config.workeroutput["fixture_setups"] = _fixture_setups
+        if _action_timers:
+            session.config.workeroutput["action_timings"] = _action_timers[0].stats()
+        if _rpc_profilers:
+            session.config.workeroutput["rpc_profile"] = _rpc_profilers[0].stats()
+        return
+
+    for key, value in page_objects.stats().items():
+        _page_object_counts[key] += value
+
+    record_path = session.config.getoption("--record-har")
+    if record_path:
+        HarRouter(record_path, "record").merge_fragments()
+
+    if _action_timers:
+        _action_timers[0].write_json(
+            session.config.rootpath / session.config.getoption("--action-timings")
+        )
+
+    if _rpc_profilers:
+        rpc_profile = session.config.getoption("--rpc-profile")
+        speedscope = session.config.getoption("--rpc-speedscope")
+        if rpc_profile:
+            _rpc_profilers[0].write_json(session.config.rootpath / rpc_profile)
+        if speedscope:
+            _rpc_profilers[0].write_speedscope(session.config.rootpath / speedscope)
+
+    timings_db = session.config.getoption("--timings-db")
+    if _timings["phases"] and timings_db != "off":
+        from utils import TimingStore
+
+        with TimingStore(session.config.rootpath / timings_db) as store:
+            store.record_run(
+                _timings["started"],
+                _timings["phases"],
+                _fixture_setups,
+                revision=_git_revision(session.config.rootpath),
+                workers=_timings["workers"] or 1,
+                exitstatus=int(exitstatus),
+            )
+            keep = session.config.getoption("--timings-keep")
+            if keep:
+                store.prune(keep)
+
+
+def _git_revision(root):
+    """Return the short commit hash of the tree under test, or None."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Time every fixture setup for the timing history."""
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    totals = _fixture_setups.setdefault(
+        fixturedef.argname, [fixturedef.scope, 0, 0.0, 0.0]
+    )
+    totals[1] += 1
+    totals[2] += elapsed
+    totals[3] = max(totals[3], elapsed)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect the counters of a finished xdist worker for the run summary."""
+    for key, value in node.workeroutput.get("booker_connections", {}).items():
+        _booker_connections[key] += value
+    for key, value in node.workeroutput.get("page_objects", {}).items():
+        _page_object_counts[key] += value
+    for key, value in node.workeroutput.get("context_pool", {}).items():
+        _context_pool_counts[key] += value
+    for name, (scope, calls, total, slowest) in node.workeroutput.get(
+        "fixture_setups", {}
+    ).items():
+        totals = _fixture_setups.setdefault(name, [scope, 0, 0.0, 0.0])
+        totals[1] += calls
+        totals[2] += total
+        totals[3] = max(totals[3], slowest)
+    if _action_timers and "action_timings" in node.workeroutput:
+        _action_timers[0].merge(node.workeroutput["action_timings"])
+    if _rpc_profilers and "rpc_profile" in node.workeroutput:
+        _rpc_profilers[0].merge(node.workeroutput["rpc_profile"])
+    _timings["workers"] += 1
+    cleanup = node.workeroutput.get("booker_cleanup", {})
+    _booker_cleanup["deleted"] += cleanup.get("deleted", 0)
+    _booker_cleanup["leftovers"].extend(cleanup.get("leftovers", []))
+
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args(browser_type_launch_args, pytestconfig):
@@ -44,6 +409,142 @@ def browser_type_launch_args(browser_type_launch_args, pytestconfig):
     return launch_args
 
 
+@pytest.fixture(scope="session")
+def local_app(pytestconfig, test_data):
+    """Start the local Sauce Demo stand-in for this worker.
+
+    Binds to a free port, so every xdist worker runs its own server.
+    """
+    from stubs import SauceDemoServer
+
+    server = SauceDemoServer(
+        {
+            key: dataclasses.asdict(product)
+            for key, product in test_data.products.items()
+        },
+        latency=pytestconfig.getoption("--local-app-latency") / 1000,
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def local_booker(pytestconfig):
+    """Start the in-process Restful Booker stand-in for this worker.
+
+    Binds to a free port, so every xdist worker runs its own server with its
+    own booking store.
+    """
+    from stubs import BookerServer
+
+    server = BookerServer(
+        latency=pytestconfig.getoption("--local-booker-latency") / 1000,
+        error_rate=pytestconfig.getoption("--local-booker-error-rate"),
+    )
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def booker_url(pytestconfig, request) -> str:
+    """Base URL of the Restful Booker instance under test.
+
+    Set with --booker-url or $BOOKER_URL; --local-booker replaces it with the
+    URL of the in-process stand-in.
+    """
+    if pytestconfig.getoption("--local-booker"):
+        return request.getfixturevalue("local_booker").url
+    return pytestconfig.getoption("--booker-url").rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def booker_client(booker_url):
+    """Pooled keep-alive Restful Booker client shared by the worker's API tests.
+
+    Its connection counts are added to the "booker client connections"
+    section of the terminal summary.
+    """
+    from clients import BookerClient
+
+    client = BookerClient(booker_url)
+    yield client
+    for key, value in client.stats().items():
+        _booker_connections[key] += value
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def booker_cleanup(booker_url):
+    """Session queue that deletes Restful Booker test data off the tests' clock.
+
+    Fixtures hand over what they created in their teardown with
+    ``booker_cleanup.add((booking_id, token))`` instead of deleting it
+    there; the queue may delete a booking as soon as it is added. Bookings
+    are deleted concurrently in the background and at session end, with
+    retries; anything that could not be deleted is listed in the "booker
+    cleanup" section of the terminal summary.
+    """
+    import asyncio
+
+    from clients import run_bulk
+    from utils import CleanupQueue
+
+    def delete(items):
+        by_token = {}
+        for booking_id, token in items:
+            by_token.setdefault(token, []).append(booking_id)
+
+        async def delete_all(client):
+            batches = await asyncio.gather(
+                *(client.delete_bookings(ids, token) for token, ids in by_token.items())
+            )
+            failed = []
+            for (token, ids), responses in zip(by_token.items(), batches):
+                for booking_id, response in zip(ids, responses):
+                    # 404/405 mean the booking is already gone (the API answers
+                    # DELETE of an unknown id with 405)
+                    if response.status_code not in (200, 201, 204, 404, 405):
+                        failed.append((booking_id, token))
+            return failed
+
+        return run_bulk(booker_url, delete_all)
+
+    queue = CleanupQueue(delete).start()
+    yield queue
+    leftovers = queue.close()
+    _booker_cleanup["deleted"] += queue.deleted
+    _booker_cleanup["leftovers"].extend(booking_id for booking_id, _ in leftovers)
+
+
+@pytest.fixture(scope="session")
+def base_url(base_url, pytestconfig, request):
+    """Base URL every page object path and expected URL is resolved against.
+
+    Set with ``base_url`` in pytest.ini or --base-url; --local-app replaces
+    it with the URL of the local stand-in. pytest-playwright passes it to
+    every browser context, so ``page.goto("/cart.html")`` and
+    ``expect(page).to_have_url("/cart.html")`` follow it.
+    """
+    if pytestconfig.getoption("--local-app"):
+        return request.getfixturevalue("local_app").url
+    return base_url.rstrip("/")
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, pytestconfig):
+    """Extend pytest-playwright's context arguments for HAR record/replay.
+
+    Service workers bypass Playwright's routing, so they are blocked while
+    recording or replaying a HAR archive.
+    """
+    context_args = browser_context_args.copy()
+    if pytestconfig.getoption("--record-har") or pytestconfig.getoption("--replay-har"):
+        context_args["service_workers"] = "block"
+    return context_args
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Capture screenshot on test failure and attach to report."""
@@ -80,6 +581,203 @@ def pytest_runtest_makereport(item, call):
                 print(f"\nFailed to capture screenshot: {e}")
 
 
+# Asset blocking totals, collected from test reports (also on the xdist controller)
+_asset_totals = {"tests": 0, "blocked_requests": 0, "bytes_saved": 0}
+
+# Requests a --replay-har archive could not answer, with the first test to hit each
+_har_unmatched = {}
+_booker_connections = {"requests": 0, "connections": 0, "reused": 0}
+_booker_cleanup = {"deleted": 0, "leftovers": []}
+_page_object_counts = {"hits": 0, "misses": 0, "invalidations": 0}
+_context_pool_counts = {"created": 0, "reused": 0, "discarded": 0}
+
+# Timing history of this run: every phase report as (nodeid, browser, phase,
+# outcome, seconds), and the number of xdist workers
+_timings = {"started": 0.0, "phases": [], "workers": 0}
+
+# Fixture setup times: [scope, calls, total seconds, slowest] by fixture name
+_fixture_setups = {}
+
+# Hard sleeps caught by sleep_guard, by test
+_hard_sleeps = {}
+
+# The --action-timings timer of this process (merges the workers' on the
+# xdist controller)
+_action_timers = []
+
+# The --rpc-profile / --rpc-speedscope profiler of this process, likewise
+_rpc_profilers = []
+
+# The test data registry of this process (see _load_test_data)
+_test_data = []
+
+
+def _load_test_data(config):
+    """Load test_data/*.json through the registry cache in .pytest_cache."""
+    from utils import DataError, load_registry
+
+    cache = getattr(config, "cache", None)
+    try:
+        return load_registry(
+            config.rootpath / "test_data",
+            cache.mkdir("test_data") if cache is not None else None,
+        )
+    except DataError as exc:
+        raise pytest.UsageError(f"test data: {exc}") from None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Attribute Playwright round trips from here on to this test (--rpc-profile).
+
+    Covers its fixture setup, call and teardown; an async page test's round
+    trips follow it onto the page scheduler.
+    """
+    if _rpc_profilers:
+        _rpc_profilers[0].begin_test(item.nodeid)
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate phase timings and the counters recorded by asset_filter,
+    sleep_guard and the context fixture."""
+    from utils.timings import report_browser
+
+    _timings["phases"].append(
+        (
+            report.nodeid,
+            report_browser(report),
+            report.when,
+            report.outcome,
+            report.duration,
+        )
+    )
+    if report.when != "teardown":
+        return
+    properties = dict(report.user_properties)
+    for request in properties.get("har_unmatched", []):
+        _har_unmatched.setdefault(request, report.nodeid)
+    if "hard_sleeps" in properties:
+        _hard_sleeps[report.nodeid] = properties["hard_sleeps"]
+    if "blocked_requests" in properties:
+        _asset_totals["tests"] += 1
+        _asset_totals["blocked_requests"] += properties["blocked_requests"]
+        _asset_totals["bytes_saved"] += properties["bytes_saved"]
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report asset blocking savings, requests missing from a HAR archive,
+    hard sleeps, page object and context reuse, action timings and round
+    trips, and Booker client connection reuse and cleanup."""
+    if _har_unmatched:
+        terminalreporter.write_sep("-", "requests missing from HAR archive")
+        for request, nodeid in sorted(_har_unmatched.items()):
+            terminalreporter.write_line(f"{request}  (first seen in {nodeid})")
+
+    if _hard_sleeps:
+        terminalreporter.write_sep("-", "hard sleeps")
+        for nodeid, sleeps in sorted(_hard_sleeps.items()):
+            for sleep in sleeps:
+                terminalreporter.write_line(f"{nodeid}: {sleep}", yellow=True)
+
+    if _asset_totals["tests"]:
+        terminalreporter.write_sep("-", "asset blocking")
+        terminalreporter.write_line(
+            f"{_asset_totals['blocked_requests']} requests blocked across "
+            f"{_asset_totals['tests']} tests, "
+            f"~{_asset_totals['bytes_saved'] / 1024:.1f} KiB of assets not "
+            "downloaded"
+        )
+
+    built = _page_object_counts["misses"]
+    reused = _page_object_counts["hits"]
+    if built or reused:
+        terminalreporter.write_sep("-", "page object cache")
+        terminalreporter.write_line(
+            f"{reused} page object constructions avoided, {built} built, "
+            f"{_page_object_counts['invalidations']} invalidated by page loads"
+        )
+
+    created = _context_pool_counts["created"]
+    reused = _context_pool_counts["reused"]
+    if created or reused:
+        terminalreporter.write_sep("-", "context pool")
+        terminalreporter.write_line(
+            f"{reused} of {created + reused} contexts reused, {created} created, "
+            f"{_context_pool_counts['discarded']} discarded after a failed reset "
+            "or with the pool full"
+        )
+
+    if _action_timers and _action_timers[0].calls:
+        summary = _action_timers[0].summary()
+        terminalreporter.write_sep("-", "page object action timings")
+        for entry in summary["methods"][:10]:
+            terminalreporter.write_line(
+                f"{entry['total']:8.2f}s  {entry['calls']:>5} calls  "
+                f"p95 {entry['p95'] * 1000:6.0f}ms  {entry['method']}"
+            )
+        terminalreporter.write_line(
+            f"all {len(summary['methods'])} methods and the slowest call sites: "
+            f"{terminalreporter.config.getoption('--action-timings')}"
+        )
+
+    if _rpc_profilers and _rpc_profilers[0].tests:
+        summary = _rpc_profilers[0].summary(top=5)
+        terminalreporter.write_sep("-", "playwright round trips")
+        for entry in summary["tests"]:
+            terminalreporter.write_line(
+                f"{entry['round_trips']:>6} round trips  {entry['seconds']:7.2f}s  "
+                f"{entry['test']}"
+            )
+        for entry in summary["methods"]:
+            if entry["method"] in summary["chatty"]:
+                terminalreporter.write_line(
+                    f"{entry['method']}: {entry['per_call']:.1f} round trips per call "
+                    f"({entry['round_trips']} over {entry['calls']} calls), "
+                    "candidate for batching",
+                    yellow=True,
+                )
+
+    if _booker_connections["requests"]:
+        sent = _booker_connections["requests"]
+        terminalreporter.write_sep("-", "booker client connections")
+        terminalreporter.write_line(
+            f"{sent} requests over {_booker_connections['connections']} "
+            f"connections ({_booker_connections['reused'] / sent:.0%} reused)"
+        )
+
+    leftovers = _booker_cleanup["leftovers"]
+    if _booker_cleanup["deleted"] or leftovers:
+        terminalreporter.write_sep("-", "booker cleanup")
+        terminalreporter.write_line(
+            f"{_booker_cleanup['deleted']} bookings deleted after their tests"
+        )
+        if leftovers:
+            terminalreporter.write_line(
+                f"{len(leftovers)} bookings left behind: "
+                + ", ".join(str(booking_id) for booking_id in sorted(leftovers)),
+                red=True,
+            )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    """Add a Browser column to the HTML report."""
+    cells.insert(2, "<th>Browser</th>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    """Fill the Browser column from the test's browser parameter."""
+    cells.insert(2, f"<td>{dict(report.user_properties).get('browser', '')}</td>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Add the --action-timings tables to the HTML report."""
+    if _action_timers and _action_timers[0].calls:
+        prefix.append(_action_timers[0].html())
+
+
 # ============================================================================
 # Custom Fixtures
 # ============================================================================
@@ -87,74 +785,386 @@ def pytest_runtest_makereport(item, call):
 
 @pytest.fixture(scope="session")
 def test_data():
-    """We are loading this from some json file for now but it would be better to pull this data from the backend database."""
-    """Load test data from JSON files."""
-    data = {}
+    """The test data registry: typed records of test_data/*.json.
+
+    Parsed once per machine and read as attributes, e.g.
+    ``test_data.users.standard_user.password`` or
+    ``test_data.expected.checkout.tax_rate`` (see utils.DataRegistry).
+    Unknown names are reported when the tests are collected.
+    """
+    return _test_data[0]
+
+
+@pytest.fixture(scope="session")
+def checkout_case_generator(pytestconfig, test_data):
+    """Seeded generator of synthetic checkout cases (--checkout-seed)."""
+    from utils import CheckoutCaseGenerator
+
+    return CheckoutCaseGenerator(
+        test_data.products, seed=pytestconfig.getoption("--checkout-seed")
+    )
+
+
+@pytest.fixture
+def checkout_cases(request, checkout_case_generator):
+    """The generated checkout cases of this test, built one at a time.
+
+    Tests requesting this fixture are parametrized with consecutive ranges of
+    case indices (see pytest_generate_tests), not with the cases themselves,
+    so collection stays cheap however many cases --checkout-cases asks for.
+
+    Example:
+        def test_checkout_form(authenticated_page, checkout_cases):
+            for case in checkout_cases:
+                ...  # case.customer, case.cart, case.error
+    """
+    return checkout_case_generator.cases(request.param)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests using checkout_cases with ranges of case indices.
+
+    Each test covers --checkout-cases-per-test consecutive indices and is
+    named after them ("case7", "cases100-199"), so the same options collect
+    the same tests on every xdist worker.
+    """
+    if "checkout_cases" not in metafunc.fixturenames:
+        return
+    from utils import case_range_id, case_ranges
+
+    config = metafunc.config
+    metafunc.parametrize(
+        "checkout_cases",
+        case_ranges(
+            config.getoption("--checkout-cases"),
+            config.getoption("--checkout-cases-per-test"),
+        ),
+        indirect=True,
+        ids=case_range_id,
+    )
+
 
-    # Load users data
-    users_path = Path(__file__).parent / "test_data" / "users.json"
-    if users_path.exists():
-        with open(users_path) as f:
-            data["users"] = json.load(f)
+@pytest.fixture(autouse=True)
+def sleep_guard(request, pytestconfig):
+    """Catch fixed sleeps in tests and page objects.
+
+    A hard sleep either wastes time once the UI has settled or flakes when it
+    has not; waits should target a UI state instead (expect(), or
+    BasePage.wait_until_settled). With ``--hard-sleeps report`` (the default)
+    every page.wait_for_timeout / time.sleep / asyncio.sleep called from
+    tests/ or models/ is listed in the terminal summary, with
+    ``--hard-sleeps fail`` it fails the test. Tests that genuinely need one
+    are marked ``@pytest.mark.allow_hard_sleep``. An async page test gets
+    its guard uninstalled: the page scheduler installs it in the test's task
+    (see async_page).
+    """
+    from utils import SleepGuard
+
+    mode = pytestconfig.getoption("--hard-sleeps")
+    if mode == "allow" or request.node.get_closest_marker("allow_hard_sleep"):
+        yield None
+        return
 
-    # Load products data
-    products_path = Path(__file__).parent / "test_data" / "products.json"
-    if products_path.exists():
-        with open(products_path) as f:
-            data["products"] = json.load(f)
+    root = pytestconfig.rootpath
 
-    # Load checkout data
-    checkout_path = Path(__file__).parent / "test_data" / "checkout.json"
-    if checkout_path.exists():
-        with open(checkout_path) as f:
-            data["checkout"] = json.load(f)
+    def on_sleep(description, location):
+        if mode == "fail":
+            sleep = f"{description} at {os.path.relpath(location, root)}"
+            pytest.fail(
+                f"hard sleep {sleep}; wait for a UI state instead", pytrace=False
+            )
 
-    # Load expected data
-    expected_path = Path(__file__).parent / "test_data" / "expected_data.json"
-    if expected_path.exists():
-        with open(expected_path) as f:
-            data["expected"] = json.load(f)
+    guard = SleepGuard(on_sleep, roots=(root / "tests", root / "models"))
+    if "async_page" in request.fixturenames:
+        yield guard
+        return
 
-    return data
+    with guard:
+        yield guard
+
+    if guard.reported:
+        request.node.user_properties.append(("hard_sleeps", guard.describe(root)))
 
 
 @pytest.fixture(autouse=True)
-def configure_page(page: Page):
-    """Configure page settings for all tests."""
+def configure_page(request):
+    """Configure the page of every test that uses one.
+
+    Tests without ``page`` in their fixtures - API tests, and async page
+    tests, which configure their own page (see page_scheduler) - are left
+    alone, so they never start Playwright.
+    """
+    if "page" not in request.fixturenames:
+        yield
+        return
+    page = request.getfixturevalue("page")
     page.set_default_timeout(10000)  # 10 seconds timeout
     yield
 
 
+@pytest.fixture(autouse=True)
+def asset_filter(request, pytestconfig):
+    """Apply the asset blocking profile to the test's page.
+
+    Our page objects only assert on text, URLs and visibility, so images are
+    stubbed and fonts, media and third-party requests are blocked (see
+    utils.AssetFilter). Tests that need real pixels opt out with
+    ``@pytest.mark.full_assets``. The bytes saved come from each blocked
+    asset's Content-Length (or the HAR archive with --replay-har). Per-test
+    counts are recorded as user properties, so they appear in the JUnit XML
+    and terminal summary.
+    Tests without a page are skipped. An async page test gets its filter
+    uninstalled: the page scheduler installs it on the test's page (see
+    async_page).
+    """
+    from utils import AssetFilter, record_sizes
+
+    async_test = "async_page" in request.fixturenames
+    if "page" not in request.fixturenames and not async_test:
+        yield None
+        return
+    base_url = request.getfixturevalue("base_url")
+
+    blocking = pytestconfig.getoption("--asset-blocking") == "on"
+    if not blocking or request.node.get_closest_marker("full_assets"):
+        if async_test:
+            yield None
+            return
+        page = request.getfixturevalue("page")
+        listener = record_sizes(page)
+        yield None
+        page.remove_listener("response", listener)
+        return
+
+    asset_filter = AssetFilter(base_url, measure=_measure_assets(request))
+    if async_test:
+        yield asset_filter
+        return
+    asset_filter.install(request.getfixturevalue("page"))
+    yield asset_filter
+
+    summary = asset_filter.summary()
+    request.node.user_properties.append(
+        ("blocked_requests", summary["blocked_requests"])
+    )
+    request.node.user_properties.append(("bytes_saved", summary["bytes_saved"]))
+
+
+def _measure_assets(request):
+    """Whether asset filters may send HEAD requests for asset sizes: not while
+    replaying a HAR archive, whose sizes are known and which must not reach
+    the network."""
+    har_router = request.getfixturevalue("har_router")
+    return har_router is None or har_router.mode != "replay"
+
+
+# Fixtures that hand the test a page which is already logged in
+AUTHENTICATED_FIXTURES = ("authenticated_page", "cart_with_items")
+
+# Default cart_with_items contents (keys of test_data/products.json)
+DEFAULT_CART_ITEMS = ("sauce_labs_backpack", "sauce_labs_bike_light")
+
+
+def _auth_user(request):
+    """Return the user a test wants to be logged in as (default: standard_user).
+
+    Tests pick a different user with ``@pytest.mark.auth_user("problem_user")``.
+    """
+    marker = request.node.get_closest_marker("auth_user")
+    return marker.args[0] if marker else "standard_user"
+
+
+def _cart_items(request):
+    """Return the products a test wants in its seeded cart.
+
+    Tests pick their own cart with
+    ``@pytest.mark.cart_items("sauce_labs_onesie", "sauce_labs_fleece_jacket")``.
+    """
+    marker = request.node.get_closest_marker("cart_items")
+    return marker.args if marker else DEFAULT_CART_ITEMS
+
+
+def _open_authenticated(page: Page, request, auth_state_cache, page_class):
+    """Open page_class on a page whose context carries the cached login.
+
+    Falls back to a UI login when the app rejects the cached state, and drops
+    that state so the next test captures a fresh snapshot.
+    """
+    from models import LoginPage
+
+    target = page_class(page).navigate()
+    login_page = LoginPage(page)
+    # Wait until the app has decided: every logged-in page has the menu, a
+    # rejected state lands on the login form (an instant is_visible() check
+    # would miss a login form that is still rendering)
+    login_page.login_button.or_(target.menu_button).wait_for(state="visible")
+    if login_page.login_button.is_visible():
+        user = _auth_user(request)
+        auth_state_cache.invalidate(user)
+        credentials = auth_state_cache.users[user]
+        login_page.navigate()
+        login_page.login(credentials.username, credentials.password)
+        page.wait_for_url("**/inventory.html")
+        target = page_class(page).navigate()
+    return target
+
+
+@pytest.fixture(scope="session")
+def har_router(pytestconfig):
+    """HAR recorder/replayer for --record-har / --replay-har, or None."""
+    from utils import HarRouter, learn_sizes
+
+    if pytestconfig.getoption("--record-har"):
+        return HarRouter(pytestconfig.getoption("--record-har"), "record")
+    if pytestconfig.getoption("--replay-har"):
+        router = HarRouter(pytestconfig.getoption("--replay-har"), "replay")
+        if router.path.exists():
+            # Sizes of the assets asset filters block, without the network
+            learn_sizes(router.sizes())
+        return router
+    return None
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache(browser, browser_context_args, test_data, har_router):
+    """Per-worker cache of logged-in storage state, keyed by user.
+
+    Each xdist worker logs in through the UI at most once per user; every
+    later authenticated context is created from the captured snapshot.
+    """
+    from utils import AuthStateCache
+
+    return AuthStateCache(
+        browser,
+        browser_context_args,
+        test_data.users,
+        setup_context=har_router.apply if har_router else None,
+    )
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args, pytestconfig):
+    """Per-worker pool of warm browser contexts, or None when disabled.
+
+    Enabled with --context-pool. Pooled contexts bypass pytest-playwright's
+    artifact recording, so the pool stays off when --tracing or --video is on,
+    and while recording a HAR archive (contexts only write it on close).
+    """
+    from utils import ContextPool
+
+    recording = (
+        pytestconfig.getoption("--tracing") != "off"
+        or pytestconfig.getoption("--video") != "off"
+        or pytestconfig.getoption("--record-har")
+    )
+    if not pytestconfig.getoption("--context-pool") or recording:
+        yield None
+        return
+
+    pool = ContextPool(browser, browser_context_args)
+    yield pool
+    for key, value in pool.stats().items():
+        _context_pool_counts[key] += value
+    pool.close()
+
+
+@pytest.fixture
+def context(new_context, request, har_router, base_url) -> BrowserContext:
+    """Create the browser context for a test.
+
+    Overrides pytest-playwright's context fixture so that tests using
+    authenticated_page or cart_with_items start from the cached login state
+    (plus the seeded cart for cart_with_items) instead of a blank context.
+    With --context-pool, all other tests borrow a warm context from the
+    worker's pool unless marked ``@pytest.mark.fresh_context``; otherwise
+    they get an ordinary fresh context. With --record-har/--replay-har the
+    context's traffic is recorded or served from the archive.
+    """
+    from utils import cart_item_ids, with_cart
+
+    authenticated = any(name in request.fixturenames for name in AUTHENTICATED_FIXTURES)
+    pool = None if authenticated else request.getfixturevalue("context_pool")
+    if request.node.get_closest_marker("fresh_context"):
+        pool = None
+
+    if authenticated:
+        cache = request.getfixturevalue("auth_state_cache")
+        user = _auth_user(request)
+        state = cache.get(user)
+        if "cart_with_items" in request.fixturenames:
+            products = request.getfixturevalue("test_data").products
+            item_ids = cart_item_ids(products, _cart_items(request))
+            state = with_cart(state, item_ids, base_url)
+        test_context = new_context(storage_state=state)
+    elif pool is not None:
+        test_context = pool.acquire()
+    else:
+        test_context = new_context()
+
+    if har_router is not None:
+        har_router.apply(test_context)
+        unmatched_before = len(har_router.unmatched)
+
+    yield test_context
+
+    if har_router is not None and len(har_router.unmatched) > unmatched_before:
+        request.node.user_properties.append(
+            ("har_unmatched", har_router.unmatched[unmatched_before:])
+        )
+    if pool is not None:
+        pool.release(test_context)
+    if authenticated and request.node.get_closest_marker("destroys_session"):
+        cache.invalidate(user)
+
+
 @pytest.fixture
-def authenticated_page(page: Page):
+def page(context: BrowserContext) -> Page:
+    """Return the test's page, reusing the warm page of a pooled context."""
+    if context.pages:
+        return context.pages[0]
+    return context.new_page()
+
+
+@pytest.fixture
+def authenticated_page(page: Page, request, auth_state_cache):
     """Fixture that returns a page already logged in as standard_user.
 
     This fixture reduces test setup code by handling login automatically.
     Use this for tests that need to start from an authenticated state.
 
+    The login itself happens once per user per xdist worker (see
+    auth_state_cache); this fixture only opens the inventory page. Use
+    ``@pytest.mark.auth_user(...)`` to log in as another user, and mark tests
+    that log out or otherwise destroy the session with
+    ``@pytest.mark.destroys_session`` so the cached state is dropped after
+    the test.
+
     Example:
         def test_checkout(authenticated_page):
             # Page is already logged in, start testing from inventory page
             inventory = InventoryPage(authenticated_page)
             inventory.add_to_cart_by_name("Sauce Labs Backpack")
     """
-    from models import LoginPage
-
-    login_page = LoginPage(page)
-    login_page.navigate()
-    login_page.login("standard_user", "secret_sauce")
+    from models import InventoryPage
 
+    _open_authenticated(page, request, auth_state_cache, InventoryPage)
     return page
 
 
 @pytest.fixture
-def cart_with_items(authenticated_page: Page):
-    """Fixture that returns a page with items already added to cart.
+def cart_with_items(page: Page, request, auth_state_cache):
+    """Fixture that returns a logged-in page on cart.html with items in the cart.
 
     Pre-loads the cart with two items:
     - Sauce Labs Backpack
     - Sauce Labs Bike Light
 
+    The cart is written straight into the app's localStorage before the first
+    navigation, so no inventory clicks are needed. Use
+    ``@pytest.mark.cart_items(...)`` with keys from test_data/products.json
+    for a different cart. Tests that are about adding to cart should use
+    authenticated_page and InventoryPage.add_to_cart_by_name instead.
+
     Use this for tests that need to start with items in cart (e.g., checkout tests).
 
     Example:
@@ -163,10 +1173,54 @@ def cart_with_items(authenticated_page: Page):
             cart_page = CartPage(cart_with_items)
             cart_page.proceed_to_checkout()
     """
-    from models import InventoryPage
+    from models import CartPage
+
+    _open_authenticated(page, request, auth_state_cache, CartPage)
+    return page
+
+
+def pytest_collection_modifyitems(config, items):
+    """Tag browser tests with their browser, and reject unknown test data."""
+    scanned = set()
+    for item in items:
+        _check_test_data(config, item, scanned)
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        if "browser_name" in params:
+            # Shown as a JUnit property and a column of the HTML report
+            item.user_properties.append(("browser", params["browser_name"]))
+
+
+def _check_test_data(config, item, scanned):
+    """Fail collection on test data a test reads but the registry lacks.
+
+    Covers the auth_user and cart_items markers and every
+    ``test_data.<section>.<name>...`` chain in the test's module (helpers
+    included), so a typo stops the run before any browser starts instead
+    of failing one test after its setup.
+    """
+    from utils import data_references, unknown_reference
 
-    inventory = InventoryPage(authenticated_page)
-    inventory.add_to_cart_by_name("Sauce Labs Backpack")
-    inventory.add_to_cart_by_name("Sauce Labs Bike Light")
+    registry = _test_data[0]
+    references = []
+    marker = item.get_closest_marker("auth_user")
+    if marker is not None:
+        references.append(["users", marker.args[0]])
+    marker = item.get_closest_marker("cart_items")
+    if marker is not None:
+        references.extend(["products", key] for key in marker.args)
+    for path in references:
+        error = unknown_reference(registry, path)
+        if error is not None:
+            raise pytest.UsageError(f"{item.nodeid}: {error}")
 
-    return authenticated_page
+    module = getattr(item, "module", None)
+    if module is None or module in scanned or "test_data" not in item.fixturenames:
+        return
+    scanned.add(module)
+    for path, line in data_references(module):
+        error = unknown_reference(registry, path)
+        if error is not None:
+            location = os.path.relpath(module.__file__, config.rootpath)
+            raise pytest.UsageError(
+                f"{location}:{line}: test_data.{'.'.join(path)}: {error}"
+            )
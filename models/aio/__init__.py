@@ -0,0 +1,60 @@
+# Generated from models/__init__.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+"""Page objects of the Sauce Demo app.
+
+The page classes are imported on first access (``models.CartPage`` or
+``from models import CartPage``), not with the package, so a process only
+imports the pages it uses. The pages a method navigates to are listed in
+models/transitions.py and checked against the code before tests run.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Exported name -> subpackage defining it
+_EXPORTS = {
+    "BasePage": "base",
+    "ItemRow": "base",
+    "LoginPage": "login",
+    "InventoryPage": "inventory",
+    "ProductDetailsPage": "product_details",
+    "CartPage": "cart",
+    "CheckoutStepOnePage": "checkout",
+    "CheckoutStepTwoPage": "checkout",
+    "CheckoutCompletePage": "checkout",
+}
+
+__all__ = [
+    "BasePage",
+    "ItemRow",
+    "LoginPage",
+    "InventoryPage",
+    "ProductDetailsPage",
+    "CartPage",
+    "CheckoutStepOnePage",
+    "CheckoutStepTwoPage",
+    "CheckoutCompletePage",
+]
+
+if TYPE_CHECKING:
+    from .base import BasePage, ItemRow
+    from .cart import CartPage
+    from .checkout import CheckoutCompletePage, CheckoutStepOnePage, CheckoutStepTwoPage
+    from .inventory import InventoryPage
+    from .login import LoginPage
+    from .product_details import ProductDetailsPage
+
+
+def __getattr__(name):
+    try:
+        subpackage = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{subpackage}", __name__), name)
+    # Later lookups find it without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,194 @@
+# Generated from models/base/BasePage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from playwright.async_api import Locator, Page
+
+from models.aio.base.Element import Element, PageObjectMeta
+from models.aio.base.ItemRow import ITEM_ROWS_SCRIPT, ItemRow
+
+# Resolves once the attribute has the expected value and every finite
+# animation or CSS transition on the element (and inside it) has finished.
+# A MutationObserver reports the attribute change the moment the application
+# makes it, instead of re-evaluating a predicate on every animation frame.
+# Reading getAnimations() flushes styles, so transitions started by the
+# change are already listed when it is called from the observer callback.
+ATTRIBUTE_SETTLED_SCRIPT = """
+(element, [name, value, timeout]) => new Promise((resolve, reject) => {
+    let observer = null;
+    const timer = setTimeout(() => {
+        if (observer) observer.disconnect();
+        reject(new Error(
+            `${name}="${value}" did not settle within ${timeout}ms ` +
+            `(currently ${JSON.stringify(element.getAttribute(name))})`
+        ));
+    }, timeout);
+    const settle = () => {
+        const running = element.getAnimations({ subtree: true }).filter(
+            animation => animation.effect.getComputedTiming().endTime !== Infinity
+        );
+        Promise.allSettled(running.map(animation => animation.finished)).then(() => {
+            clearTimeout(timer);
+            resolve();
+        });
+    };
+    if (element.getAttribute(name) === value) {
+        settle();
+        return;
+    }
+    observer = new MutationObserver(() => {
+        if (element.getAttribute(name) !== value) return;
+        observer.disconnect();
+        settle();
+    });
+    observer.observe(element, { attributes: true, attributeFilter: [name] });
+})
+"""
+
+# Time a UI state change may take, matching configure_page's default timeout
+SETTLE_TIMEOUT_MS = 10_000
+
+
+class BasePage(metaclass=PageObjectMeta):
+    """Base page class containing common elements like the menu.
+
+    Locators are declared as Element class attributes and built lazily on
+    first use, so creating a page object on every transition is cheap.
+    """
+
+    __slots__ = ("page", "__weakref__")
+
+    # Path of the page, resolved against the browser context's base_url
+    PAGE_URL = None
+
+    # Menu elements
+    menu_button = Element("#react-burger-menu-btn")
+    menu_close_button = Element("#react-burger-cross-btn")
+    menu_wrap = Element(".bm-menu-wrap")
+    logout_link = Element("#logout_sidebar_link")
+    all_items_link = Element("#inventory_sidebar_link")
+    about_link = Element("#about_sidebar_link")
+    reset_app_link = Element("#reset_sidebar_link")
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    @classmethod
+    def selectors(cls) -> dict[str, str]:
+        """Return every declared locator of the class, inherited ones included.
+
+        Returns:
+            dict: Selector by attribute name
+        """
+        inventory = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Element):
+                    inventory[name] = value.selector
+        return inventory
+
+    async def navigate(self):
+        """Navigate to the page's URL (PAGE_URL relative to the base URL)."""
+        if self.PAGE_URL is None:
+            raise NotImplementedError(
+                f"PAGE_URL not defined for {self.__class__.__name__}"
+            )
+        await self.page.goto(self.PAGE_URL)
+        return self
+
+    async def open_menu(self):
+        """Open the hamburger menu."""
+        await self.menu_button.click()
+        # Returns once aria-hidden is "false" and the slide-in has finished
+        await self.wait_until_settled(self.menu_wrap, "aria-hidden", "false")
+
+    async def close_menu(self):
+        """Close the hamburger menu using the X button."""
+        await self.menu_close_button.click()
+        # Returns once aria-hidden is "true" and the slide-out has finished
+        await self.wait_until_settled(self.menu_wrap, "aria-hidden", "true")
+
+    async def wait_until_settled(
+        self,
+        locator: Locator,
+        name: str,
+        value: str,
+        timeout: float = SETTLE_TIMEOUT_MS,
+    ):
+        """Wait until an element's attribute has a value and its transitions end.
+
+        The wait runs inside the page as a single evaluation and returns as
+        soon as the UI has settled, with no polling interval.
+
+        Args:
+            locator: Element whose attribute changes
+            name: Attribute name, e.g. "aria-hidden"
+            value: Expected attribute value
+            timeout: Milliseconds to wait before failing
+        """
+        await locator.evaluate(ATTRIBUTE_SETTLED_SCRIPT, [name, value, timeout])
+
+    async def is_menu_open(self):
+        """Check if the menu is open by checking the aria-hidden attribute."""
+        # aria-hidden is "false" when open, "true" when closed
+        return await self.menu_wrap.get_attribute("aria-hidden") == "false"
+
+    async def logout(self):
+        """Logout from the application."""
+        from models.aio.login import LoginPage
+
+        await self.open_menu()
+        await self.logout_link.click()
+        return LoginPage(self.page)
+
+    async def click_all_items(self):
+        """Navigate to inventory page via menu."""
+        from models.aio.inventory import InventoryPage
+
+        await self.open_menu()
+        await self.all_items_link.click()
+        return InventoryPage(self.page)
+
+    async def click_about(self):
+        """Click the About link (navigates to external site)."""
+        await self.open_menu()
+        await self.about_link.click()
+
+    async def reset_app_state(self):
+        """Reset the application state (clears cart)."""
+        await self.open_menu()
+        await self.reset_app_link.click()
+        await self.close_menu()
+
+    # Testing utilities
+    async def take_screenshot(self, name: str, path: str = "screenshots"):
+        """Take a screenshot and save it with the given name.
+
+        Args:
+            name: Name for the screenshot file (without extension)
+            path: Directory to save screenshot (default: 'screenshots')
+        """
+        import os
+
+        os.makedirs(path, exist_ok=True)
+        screenshot_path = os.path.join(path, f"{name}.png")
+        await self.page.screenshot(path=screenshot_path, full_page=True)
+        return screenshot_path
+
+    async def snapshot_rows(self, rows: Locator) -> list[ItemRow]:
+        """Read every matched product row in a single page evaluation.
+
+        Args:
+            rows: Locator matching the row elements (e.g. ".cart_item")
+
+        Returns:
+            list[ItemRow]: One record per row, in page order
+        """
+        snapshot = await rows.evaluate_all(ITEM_ROWS_SCRIPT)
+        return [ItemRow.from_snapshot(row) for row in snapshot]
+
+    def get_current_url(self):
+        """Get the current page URL."""
+        return self.page.url
+
+    async def get_page_title(self):
+        """Get the page title."""
+        return await self.page.title()
@@ -0,0 +1,85 @@
+# Generated from models/base/Element.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from playwright.async_api import Locator, Page
+
+from models.aio.base.PageObjectCache import page_objects
+
+
+class Element:
+    """Declarative locator of a page object, resolved lazily per instance.
+
+    Declared once as a class attribute::
+
+        class CartPage(BasePage):
+            checkout_button = Element("[data-test='checkout']")
+
+    The Locator is built from ``instance.page`` on first access and cached in
+    a slot that PageObjectMeta adds to the class, so constructing a page
+    object allocates nothing but the instance, and locators a flow never
+    touches are never built. Locators re-query the DOM on every action, so a
+    cached one stays valid across navigations.
+    """
+
+    __slots__ = ("selector", "name", "_slot")
+
+    def __init__(self, selector: str):
+        """
+        Args:
+            selector: Selector passed to ``page.locator``
+        """
+        self.selector = selector
+        self.name = None
+        self._slot = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self._slot = owner.__dict__[_slot_name(name)]
+
+    def __get__(self, instance, owner=None) -> Locator:
+        if instance is None:
+            return self
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            locator = instance.page.locator(self.selector)
+            self._slot.__set__(instance, locator)
+            return locator
+
+    def __set__(self, instance, value):
+        raise AttributeError(f"'{self.name}' is a declared Element and is read-only")
+
+    def __repr__(self):
+        return f"Element({self.selector!r})"
+
+
+class PageObjectMeta(type):
+    """Metaclass of BasePage: slots page object classes and caches instances.
+
+    A class gets one cache slot per Element it declares, plus whatever
+    ``__slots__`` it lists itself, so page object instances have no
+    ``__dict__``.
+
+    Calling a page object class returns the instance already registered for
+    that Playwright page in ``page_objects`` (see PageObjectCache), and only
+    builds a new one when there is none.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        element_slots = tuple(
+            _slot_name(key)
+            for key, value in namespace.items()
+            if isinstance(value, Element)
+        )
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + element_slots
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+    def __call__(cls, page: Page):
+        instance = page_objects.lookup(cls, page)
+        if instance is None:
+            instance = super().__call__(page)
+            page_objects.store(cls, page, instance)
+        return instance
+
+
+def _slot_name(name):
+    return f"_{name}_locator"
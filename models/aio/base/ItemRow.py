@@ -0,0 +1,65 @@
+# Generated from models/base/ItemRow.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from dataclasses import dataclass
+
+# Reads every field of every matched row inside the page, so a whole list
+# costs one evaluate round trip instead of one inner_text call per field.
+# innerText (not textContent) keeps inner_text()'s rendering of the text.
+ITEM_ROWS_SCRIPT = """
+rows => rows.map(row => {
+    const text = selector => {
+        const element = row.querySelector(selector);
+        return element ? element.innerText : null;
+    };
+    const button = row.querySelector("button");
+    return {
+        name: text(".inventory_item_name"),
+        description: text(".inventory_item_desc"),
+        price: text(".inventory_item_price"),
+        quantity: text(".cart_quantity"),
+        button: button ? button.innerText : null,
+    };
+})
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class ItemRow:
+    """One product row of the inventory, cart or checkout overview list.
+
+    Attributes:
+        name: Product name
+        description: Product description
+        price: Price in dollars
+        quantity: Cart quantity (None on the inventory page)
+        button: Label of the row's button ("Add to cart" / "Remove"),
+            None when the row has no button (checkout overview)
+    """
+
+    name: str
+    description: str
+    price: float
+    quantity: int | None = None
+    button: str | None = None
+
+    @property
+    def price_text(self) -> str:
+        """Price as displayed on the page, e.g. "$29.99"."""
+        return f"${self.price:.2f}"
+
+    @property
+    def in_cart(self) -> bool:
+        """Whether the row's button offers to remove the product."""
+        return self.button == "Remove"
+
+    @classmethod
+    def from_snapshot(cls, row: dict) -> "ItemRow":
+        """Build a row from one entry of ITEM_ROWS_SCRIPT's result."""
+        quantity = row["quantity"]
+        return cls(
+            name=row["name"],
+            description=row["description"],
+            price=float(row["price"].replace("$", "")),
+            quantity=int(quantity) if quantity is not None else None,
+            button=row["button"],
+        )
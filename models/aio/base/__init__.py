@@ -0,0 +1,8 @@
+# Generated from models/base/__init__.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from .BasePage import BasePage
+from .Element import Element
+from .ItemRow import ItemRow
+from .PageObjectCache import PageObjectCache, page_objects
+
+__all__ = ["BasePage", "Element", "ItemRow", "PageObjectCache", "page_objects"]
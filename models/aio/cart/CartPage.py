@@ -0,0 +1,101 @@
+# Generated from models/cart/CartPage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element, ItemRow
+
+
+class CartPage(BasePage):
+    """Page Object Model for the Shopping Cart page."""
+
+    PAGE_URL = "/cart.html"
+
+    cart_list = Element(".cart_list")
+    cart_items = Element(".cart_item")
+    continue_shopping_button = Element("[data-test='continue-shopping']")
+    checkout_button = Element("[data-test='checkout']")
+
+    async def is_loaded(self):
+        """Verify the cart page is loaded."""
+        return await self.cart_list.is_visible()
+
+    async def get_item_count(self):
+        """Get the number of items in the cart."""
+        return await self.cart_items.count()
+
+    async def get_items(self) -> list[ItemRow]:
+        """Get all cart items in a single round trip.
+
+        Returns:
+            list[ItemRow]: Cart items in display order
+        """
+        return await self.snapshot_rows(self.cart_items)
+
+    async def get_item_names(self):
+        """Get list of all item names in cart."""
+        return [item.name for item in await self.get_items()]
+
+    async def get_item_prices(self):
+        """Get list of all item prices in cart."""
+        return [item.price for item in await self.get_items()]
+
+    async def get_item_descriptions(self):
+        """Get list of all item descriptions in cart."""
+        return [item.description for item in await self.get_items()]
+
+    async def get_item_details(self, index: int = 0):
+        """Get details of a specific cart item by index.
+
+        Args:
+            index: Index of the cart item (0-based)
+
+        Returns:
+            dict: Item details including name, description, and price
+        """
+        item = (await self.get_items())[index]
+        return {
+            "name": item.name,
+            "description": item.description,
+            "price": item.price_text,
+        }
+
+    async def remove_item_by_name(self, product_name: str):
+        """Remove an item from cart by product name.
+
+        Args:
+            product_name: Name of the product to remove
+        """
+        # Product names are normalized: lowercase, spaces to hyphens
+        normalized_name = product_name.lower().replace(" ", "-")
+        button = self.page.locator(f"[data-test='remove-{normalized_name}']")
+        await button.click()
+
+    async def remove_item_by_index(self, index: int):
+        """Remove an item from cart by index.
+
+        Args:
+            index: Index of the item to remove (0-based)
+        """
+        remove_button = self.cart_items.nth(index).locator("button")
+        await remove_button.click()
+
+    async def is_cart_empty(self):
+        """Check if the cart is empty."""
+        return await self.cart_items.count() == 0
+
+    async def continue_shopping(self):
+        """Click continue shopping button to return to inventory."""
+        from models.aio.inventory import InventoryPage
+
+        await self.continue_shopping_button.click()
+        return InventoryPage(self.page)
+
+    async def proceed_to_checkout(self):
+        """Click checkout button to proceed to checkout step 1."""
+        from models.aio.checkout import CheckoutStepOnePage
+
+        await self.checkout_button.click()
+        return CheckoutStepOnePage(self.page)
+
+    async def clear_cart(self):
+        """Remove all items from the cart."""
+        while not await self.is_cart_empty():
+            await self.remove_item_by_index(0)
@@ -0,0 +1,5 @@
+# Generated from models/cart/__init__.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from .CartPage import CartPage
+
+__all__ = ["CartPage"]
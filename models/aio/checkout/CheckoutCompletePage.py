@@ -0,0 +1,76 @@
+# Generated from models/checkout/CheckoutCompletePage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element
+
+
+class CheckoutCompletePage(BasePage):
+    """Page Object Model for Checkout Complete - Order Confirmation."""
+
+    complete_header = Element(".complete-header")
+    complete_text = Element(".complete-text")
+    pony_express_image = Element(".pony_express")
+    back_home_button = Element("[data-test='back-to-products']")
+
+    async def is_loaded(self):
+        """Verify the checkout complete page is loaded."""
+        return await self.complete_header.is_visible()
+
+    async def get_header_text(self):
+        """Get the confirmation header text.
+
+        Returns:
+            str: Header text (typically "Thank you for your order!")
+        """
+        return await self.complete_header.inner_text()
+
+    async def get_confirmation_text(self):
+        """Get the confirmation message text.
+
+        Returns:
+            str: Confirmation message text
+        """
+        return await self.complete_text.inner_text()
+
+    async def is_pony_express_visible(self):
+        """Check if the pony express image/icon is visible.
+
+        Returns:
+            bool: True if image is visible, False otherwise
+        """
+        return await self.pony_express_image.is_visible()
+
+    async def is_success(self):
+        """Check if the order was completed successfully.
+
+        Returns:
+            bool: True if success indicators are present
+        """
+        return (
+            await self.is_loaded()
+            and "thank you" in (await self.get_header_text()).lower()
+        )
+
+    async def back_to_home(self):
+        """Click back home button to return to inventory page.
+
+        Returns:
+            InventoryPage: The inventory page object
+        """
+        from models.aio.inventory import InventoryPage
+
+        await self.back_home_button.click()
+        return InventoryPage(self.page)
+
+    async def verify_order_complete(self):
+        """Verify that all order completion elements are present.
+
+        Returns:
+            dict: Verification results
+        """
+        return {
+            "page_loaded": await self.is_loaded(),
+            "header_visible": await self.complete_header.is_visible(),
+            "message_visible": await self.complete_text.is_visible(),
+            "image_visible": await self.is_pony_express_visible(),
+            "button_visible": await self.back_home_button.is_visible(),
+        }
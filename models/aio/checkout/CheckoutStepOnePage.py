@@ -0,0 +1,82 @@
+# Generated from models/checkout/CheckoutStepOnePage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element
+
+
+class CheckoutStepOnePage(BasePage):
+    """Page Object Model for Checkout Step 1 - Customer Information."""
+
+    first_name_input = Element("[data-test='firstName']")
+    last_name_input = Element("[data-test='lastName']")
+    postal_code_input = Element("[data-test='postalCode']")
+    continue_button = Element("[data-test='continue']")
+    cancel_button = Element("[data-test='cancel']")
+    error_message = Element("[data-test='error']")
+
+    async def is_loaded(self):
+        """Verify the checkout step 1 page is loaded."""
+        return await self.first_name_input.is_visible()
+
+    async def fill_customer_info(
+        self, first_name: str, last_name: str, postal_code: str
+    ):
+        """Fill in customer information form.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            postal_code: Customer's postal/zip code
+        """
+        await self.first_name_input.fill(first_name)
+        await self.last_name_input.fill(last_name)
+        await self.postal_code_input.fill(postal_code)
+
+    async def continue_to_step_two(self):
+        """Click continue button to proceed to checkout step 2."""
+        from models.aio.checkout import CheckoutStepTwoPage
+
+        await self.continue_button.click()
+        return CheckoutStepTwoPage(self.page)
+
+    async def cancel_checkout(self):
+        """Click cancel button to return to cart."""
+        from models.aio.cart import CartPage
+
+        await self.cancel_button.click()
+        return CartPage(self.page)
+
+    async def has_error(self):
+        """Check if an error message is displayed."""
+        return await self.error_message.is_visible()
+
+    async def get_error_text(self):
+        """Get the error message text."""
+        return await self.error_message.inner_text()
+
+    async def clear_error(self):
+        """Clear/dismiss the error message."""
+        error_close_button = self.page.locator("[data-test='error'] button")
+        if await error_close_button.is_visible():
+            await error_close_button.click()
+
+    async def submit_form(self, first_name: str, last_name: str, postal_code: str):
+        """Fill and submit the customer information form.
+
+        Args:
+            first_name: Customer's first name
+            last_name: Customer's last name
+            postal_code: Customer's postal/zip code
+
+        Returns:
+            CheckoutStepTwoPage if successful, None if error
+        """
+        await self.fill_customer_info(first_name, last_name, postal_code)
+        await self.continue_button.click()
+
+        # Check if we moved to step 2 or if there's an error
+        if await self.has_error():
+            return None
+
+        from models.aio.checkout import CheckoutStepTwoPage
+
+        return CheckoutStepTwoPage(self.page)
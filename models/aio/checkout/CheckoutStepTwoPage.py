@@ -0,0 +1,124 @@
+# Generated from models/checkout/CheckoutStepTwoPage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element, ItemRow
+
+
+class CheckoutStepTwoPage(BasePage):
+    """Page Object Model for Checkout Step 2 - Order Overview/Summary."""
+
+    cart_items = Element(".cart_item")
+    finish_button = Element("[data-test='finish']")
+    cancel_button = Element("[data-test='cancel']")
+    subtotal_label = Element(".summary_subtotal_label")
+    tax_label = Element(".summary_tax_label")
+    total_label = Element(".summary_total_label")
+    payment_info = Element("[data-test='payment-info-value']")
+    shipping_info = Element("[data-test='shipping-info-value']")
+
+    async def is_loaded(self):
+        """Verify the checkout step 2 page is loaded."""
+        return await self.finish_button.is_visible()
+
+    async def get_item_count(self):
+        """Get the number of items in the order."""
+        return await self.cart_items.count()
+
+    async def get_items(self) -> list[ItemRow]:
+        """Get all order items in a single round trip.
+
+        Returns:
+            list[ItemRow]: Order items in display order
+        """
+        return await self.snapshot_rows(self.cart_items)
+
+    async def get_item_names(self):
+        """Get list of all item names in the order."""
+        return [item.name for item in await self.get_items()]
+
+    async def get_item_prices(self):
+        """Get list of all item prices in the order."""
+        return [item.price for item in await self.get_items()]
+
+    async def get_item_details(self, index: int = 0):
+        """Get details of a specific order item by index.
+
+        Args:
+            index: Index of the order item (0-based)
+
+        Returns:
+            dict: Item details including name, description, price, and quantity
+        """
+        item = (await self.get_items())[index]
+        return {
+            "name": item.name,
+            "description": item.description,
+            "price": item.price_text,
+            "quantity": str(item.quantity),
+        }
+
+    async def get_subtotal(self):
+        """Get the subtotal amount (before tax).
+
+        Returns:
+            float: Subtotal amount
+        """
+        # Format: "Item total: $XX.XX"
+        text = await self.subtotal_label.inner_text()
+        # Extract number after '$'
+        return float(text.split("$")[1])
+
+    async def get_tax(self):
+        """Get the tax amount.
+
+        Returns:
+            float: Tax amount
+        """
+        # Format: "Tax: $X.XX"
+        text = await self.tax_label.inner_text()
+        return float(text.split("$")[1])
+
+    async def get_total(self):
+        """Get the total amount (subtotal + tax).
+
+        Returns:
+            float: Total amount
+        """
+        # Format: "Total: $XX.XX"
+        text = await self.total_label.inner_text()
+        return float(text.split("$")[1])
+
+    async def get_payment_info(self):
+        """Get the payment information text."""
+        return await self.payment_info.inner_text()
+
+    async def get_shipping_info(self):
+        """Get the shipping information text."""
+        return await self.shipping_info.inner_text()
+
+    async def finish_order(self):
+        """Click finish button to complete the order."""
+        from models.aio.checkout import CheckoutCompletePage
+
+        await self.finish_button.click()
+        return CheckoutCompletePage(self.page)
+
+    async def cancel_order(self):
+        """Click cancel button to return to inventory."""
+        from models.aio.inventory import InventoryPage
+
+        await self.cancel_button.click()
+        return InventoryPage(self.page)
+
+    async def verify_calculations(self):
+        """Verify that subtotal + tax equals total.
+
+        Returns:
+            bool: True if calculations are correct, False otherwise
+        """
+        subtotal = await self.get_subtotal()
+        tax = await self.get_tax()
+        total = await self.get_total()
+
+        # Allow small floating point differences
+        calculated_total = round(subtotal + tax, 2)
+        return abs(calculated_total - total) < 0.01
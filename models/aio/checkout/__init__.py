@@ -0,0 +1,7 @@
+# Generated from models/checkout/__init__.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from .CheckoutCompletePage import CheckoutCompletePage
+from .CheckoutStepOnePage import CheckoutStepOnePage
+from .CheckoutStepTwoPage import CheckoutStepTwoPage
+
+__all__ = ["CheckoutStepOnePage", "CheckoutStepTwoPage", "CheckoutCompletePage"]
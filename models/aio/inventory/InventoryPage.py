@@ -0,0 +1,101 @@
+# Generated from models/inventory/InventoryPage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element, ItemRow
+
+
+class InventoryPage(BasePage):
+
+    PAGE_URL = "/inventory.html"
+
+    inventory_list = Element(".inventory_list")
+    shopping_cart = Element("#shopping_cart_container")
+    cart_badge = Element(".shopping_cart_badge")
+    sort_dropdown = Element(".product_sort_container")
+
+    async def is_loaded(self):
+        """Verify the inventory page is loaded."""
+        return await self.inventory_list.is_visible()
+
+    async def get_product_count(self):
+        """Get the number of products displayed."""
+        return await self.page.locator(".inventory_item").count()
+
+    def get_product_list_element(self, position: int):
+        return self.inventory_list[position]
+
+    async def add_to_cart_by_name(self, product_name: str):
+        """Add a product to cart by its name."""
+        # Product names are normalized: lowercase, spaces to hyphens
+        normalized_name = product_name.lower().replace(" ", "-")
+        button = self.page.locator(f"[data-test='add-to-cart-{normalized_name}']")
+        await button.click()
+
+    async def remove_from_cart_by_name(self, product_name: str):
+        """Remove a product from cart by its name."""
+        normalized_name = product_name.lower().replace(" ", "-")
+        button = self.page.locator(f"[data-test='remove-{normalized_name}']")
+        await button.click()
+
+    async def get_cart_badge_count(self):
+        """Get the number displayed on the shopping cart badge."""
+        if not await self.cart_badge.is_visible():
+            return 0
+        return int(await self.cart_badge.inner_text())
+
+    async def is_cart_badge_visible(self):
+        """Check if cart badge is visible."""
+        return await self.cart_badge.is_visible()
+
+    async def click_cart(self):
+        """Click the shopping cart icon."""
+        from models.aio.cart import CartPage
+
+        await self.shopping_cart.click()
+        return CartPage(self.page)
+
+    async def sort_products(self, sort_option: str):
+        """Sort products by given option.
+        Options: 'az' (A to Z), 'za' (Z to A), 'lohi' (low to high), 'hilo' (high to low)
+        """
+        await self.sort_dropdown.select_option(sort_option)
+
+    async def get_products(self) -> list[ItemRow]:
+        """Get all products, including button state, in a single round trip.
+
+        Returns:
+            list[ItemRow]: Products in the current sort order
+        """
+        return await self.snapshot_rows(self.page.locator(".inventory_item"))
+
+    async def get_product_names(self):
+        """Get list of all product names in current order."""
+        return [product.name for product in await self.get_products()]
+
+    async def get_product_prices(self):
+        """Get list of all product prices in current order."""
+        return [product.price for product in await self.get_products()]
+
+    async def click_product_name(self, product_name: str):
+        """Click on a product name to go to product details."""
+        from models.aio.product_details import ProductDetailsPage
+
+        product = self.page.locator(".inventory_item_name", has_text=product_name)
+        await product.click()
+        return ProductDetailsPage(self.page)
+
+    async def click_product_image(self, index: int = 0):
+        """Click on a product image by index."""
+        from models.aio.product_details import ProductDetailsPage
+
+        images = self.page.locator(".inventory_item_img")
+        await images.nth(index).click()
+        return ProductDetailsPage(self.page)
+
+    async def get_product_details(self, index: int):
+        """Get details of a product by index."""
+        product = (await self.get_products())[index]
+        return {
+            "name": product.name,
+            "description": product.description,
+            "price": product.price_text,
+        }
@@ -0,0 +1,30 @@
+# Generated from models/login/LoginPage.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from models.aio.base import BasePage, Element
+
+
+class LoginPage(BasePage):
+
+    PAGE_URL = "/"
+
+    username_input = Element("#user-name")
+    password_input = Element("#password")
+    login_button = Element("#login-button")
+    error_message = Element("[data-test='error']")
+
+    async def has_error(self):
+        """Check if an error message is displayed."""
+        return await self.error_message.is_visible()
+
+    async def get_error_text(self):
+        """Get the error message text."""
+        return await self.error_message.inner_text()
+
+    async def login(self, username, password):
+        from models.aio.inventory import InventoryPage
+
+        await self.username_input.fill(username)
+        await self.password_input.fill(password)
+        await self.login_button.click()
+        # Return the next page after successful login
+        return InventoryPage(self.page)
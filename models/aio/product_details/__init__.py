@@ -0,0 +1,5 @@
+# Generated from models/product_details/__init__.py by scripts/generate_async_models.py.
+# Do not edit: change the sync page object and re-run the script.
+from .ProductDetailsPage import ProductDetailsPage
+
+__all__ = ["ProductDetailsPage"]
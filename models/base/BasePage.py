@@ -1,44 +1,128 @@
-from playwright.sync_api import Page
-
-
-class BasePage:
-    """Base page class containing common elements like the menu."""
-
+from playwright.sync_api import Locator, Page
+
+from models.base.Element import Element, PageObjectMeta
+from models.base.ItemRow import ITEM_ROWS_SCRIPT, ItemRow
+
+# Resolves once the attribute has the expected value and every finite
+# animation or CSS transition on the element (and inside it) has finished.
+# A MutationObserver reports the attribute change the moment the application
+# makes it, instead of re-evaluating a predicate on every animation frame.
+# Reading getAnimations() flushes styles, so transitions started by the
+# change are already listed when it is called from the observer callback.
+ATTRIBUTE_SETTLED_SCRIPT = """
+(element, [name, value, timeout]) => new Promise((resolve, reject) => {
+    let observer = null;
+    const timer = setTimeout(() => {
+        if (observer) observer.disconnect();
+        reject(new Error(
+            `${name}="${value}" did not settle within ${timeout}ms ` +
+            `(currently ${JSON.stringify(element.getAttribute(name))})`
+        ));
+    }, timeout);
+    const settle = () => {
+        const running = element.getAnimations({ subtree: true }).filter(
+            animation => animation.effect.getComputedTiming().endTime !== Infinity
+        );
+        Promise.allSettled(running.map(animation => animation.finished)).then(() => {
+            clearTimeout(timer);
+            resolve();
+        });
+    };
+    if (element.getAttribute(name) === value) {
+        settle();
+        return;
+    }
+    observer = new MutationObserver(() => {
+        if (element.getAttribute(name) !== value) return;
+        observer.disconnect();
+        settle();
+    });
+    observer.observe(element, { attributes: true, attributeFilter: [name] });
+})
+"""
+
+# Time a UI state change may take, matching configure_page's default timeout
+SETTLE_TIMEOUT_MS = 10_000
+
+
+class BasePage(metaclass=PageObjectMeta):
+    """Base page class containing common elements like the menu.
+
+    Locators are declared as Element class attributes and built lazily on
+    first use, so creating a page object on every transition is cheap.
+    """
+
+    __slots__ = ("page", "__weakref__")
+
+    # Path of the page, resolved against the browser context's base_url
     PAGE_URL = None
 
+    # Menu elements
+    menu_button = Element("#react-burger-menu-btn")
+    menu_close_button = Element("#react-burger-cross-btn")
+    menu_wrap = Element(".bm-menu-wrap")
+    logout_link = Element("#logout_sidebar_link")
+    all_items_link = Element("#inventory_sidebar_link")
+    about_link = Element("#about_sidebar_link")
+    reset_app_link = Element("#reset_sidebar_link")
+
     def __init__(self, page: Page):
         self.page = page
-        # Menu elements
-        self.menu_button = page.locator("#react-burger-menu-btn")
-        self.menu_close_button = page.locator("#react-burger-cross-btn")
-        self.menu_wrap = page.locator(".bm-menu-wrap")
-        self.logout_link = page.locator("#logout_sidebar_link")
-        self.all_items_link = page.locator("#inventory_sidebar_link")
-        self.about_link = page.locator("#about_sidebar_link")
-        self.reset_app_link = page.locator("#reset_sidebar_link")
+
+    @classmethod
+    def selectors(cls) -> dict[str, str]:
+        """Return every declared locator of the class, inherited ones included.
+
+        Returns:
+            dict: Selector by attribute name
+        """
+        inventory = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, Element):
+                    inventory[name] = value.selector
+        return inventory
 
     def navigate(self):
-        """Navigate to the base URL of the page."""
+        """Navigate to the page's URL (PAGE_URL relative to the base URL)."""
         if self.PAGE_URL is None:
-            raise NotImplementedError(f"PAGE_URL not defined for {self.__class__.__name__}")
+            raise NotImplementedError(
+                f"PAGE_URL not defined for {self.__class__.__name__}"
+            )
         self.page.goto(self.PAGE_URL)
         return self
-    
+
     def open_menu(self):
         """Open the hamburger menu."""
         self.menu_button.click()
-        # Wait for menu to open (aria-hidden becomes "false")
-        self.page.wait_for_function(
-            "() => document.querySelector('.bm-menu-wrap').getAttribute('aria-hidden') === 'false'"
-        )
+        # Returns once aria-hidden is "false" and the slide-in has finished
+        self.wait_until_settled(self.menu_wrap, "aria-hidden", "false")
 
     def close_menu(self):
         """Close the hamburger menu using the X button."""
         self.menu_close_button.click()
-        # Wait for menu to close (aria-hidden becomes "true")
-        self.page.wait_for_function(
-            "() => document.querySelector('.bm-menu-wrap').getAttribute('aria-hidden') === 'true'"
-        )
+        # Returns once aria-hidden is "true" and the slide-out has finished
+        self.wait_until_settled(self.menu_wrap, "aria-hidden", "true")
+
+    def wait_until_settled(
+        self,
+        locator: Locator,
+        name: str,
+        value: str,
+        timeout: float = SETTLE_TIMEOUT_MS,
+    ):
+        """Wait until an element's attribute has a value and its transitions end.
+
+        The wait runs inside the page as a single evaluation and returns as
+        soon as the UI has settled, with no polling interval.
+
+        Args:
+            locator: Element whose attribute changes
+            name: Attribute name, e.g. "aria-hidden"
+            value: Expected attribute value
+            timeout: Milliseconds to wait before failing
+        """
+        locator.evaluate(ATTRIBUTE_SETTLED_SCRIPT, [name, value, timeout])
 
     def is_menu_open(self):
         """Check if the menu is open by checking the aria-hidden attribute."""
@@ -87,6 +171,18 @@ class BasePage:
         self.page.screenshot(path=screenshot_path, full_page=True)
         return screenshot_path
 
+    def snapshot_rows(self, rows: Locator) -> list[ItemRow]:
+        """Read every matched product row in a single page evaluation.
+
+        Args:
+            rows: Locator matching the row elements (e.g. ".cart_item")
+
+        Returns:
+            list[ItemRow]: One record per row, in page order
+        """
+        snapshot = rows.evaluate_all(ITEM_ROWS_SCRIPT)
+        return [ItemRow.from_snapshot(row) for row in snapshot]
+
     def get_current_url(self):
         """Get the current page URL."""
         return self.page.url
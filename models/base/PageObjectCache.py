@@ -0,0 +1,77 @@
+import weakref
+
+
+class PageObjectCache:
+    """Per-Page registry of page objects, one per (page, class) pair.
+
+    PageObjectMeta routes every page object construction through the shared
+    ``page_objects`` instance, so ``InventoryPage(page)`` hands back the
+    InventoryPage already created for that Playwright page instead of
+    building an equivalent one on every transition.
+
+    Everything is held weakly: pages are keys of a WeakKeyDictionary and page
+    objects are weak references, so a closed page and its page objects are
+    freed as soon as the test drops them. A page's entries are dropped when
+    its main frame loads a new document (``domcontentloaded``) and when it
+    closes. Same-document URL changes keep them, since locators re-resolve
+    on every action anyway.
+
+    ``hits`` counts constructions avoided, ``misses`` page objects built and
+    ``invalidations`` times a page's entries were dropped by a load.
+    """
+
+    def __init__(self):
+        self._pages = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def lookup(self, cls, page):
+        """Return the live page object of ``cls`` for ``page``, or None."""
+        objects = self._pages.get(page)
+        ref = objects.get(cls) if objects else None
+        instance = ref() if ref is not None else None
+        if instance is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return instance
+
+    def store(self, cls, page, instance):
+        """Register a newly built page object of ``cls`` for ``page``."""
+        objects = self._pages.get(page)
+        if objects is None:
+            objects = self._pages[page] = {}
+            self._watch(page)
+        objects[cls] = weakref.ref(instance)
+
+    def stats(self) -> dict:
+        """Return the hit, miss and invalidation counts."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+    def _watch(self, page):
+        # The handlers only hold a weak reference, so listening does not keep
+        # the page (or its entry) alive
+        page_ref = weakref.ref(page)
+
+        def invalidate(*_):
+            loaded = page_ref()
+            objects = self._pages.get(loaded) if loaded is not None else None
+            if objects:
+                objects.clear()
+                self.invalidations += 1
+
+        def forget(*_):
+            closed = page_ref()
+            if closed is not None:
+                self._pages.pop(closed, None)
+
+        page.on("domcontentloaded", invalidate)
+        page.on("close", forget)
+
+
+page_objects = PageObjectCache()
@@ -1,3 +1,6 @@
 from .BasePage import BasePage
+from .Element import Element
+from .ItemRow import ItemRow
+from .PageObjectCache import PageObjectCache, page_objects
 
-__all__ = ["BasePage"]
+__all__ = ["BasePage", "Element", "ItemRow", "PageObjectCache", "page_objects"]
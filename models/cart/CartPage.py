@@ -1,19 +1,15 @@
-from playwright.sync_api import Page
-
-from models.base import BasePage
+from models.base import BasePage, Element, ItemRow
 
 
 class CartPage(BasePage):
     """Page Object Model for the Shopping Cart page."""
 
-    PAGE_URL = "https://www.saucedemo.com/cart.html"
+    PAGE_URL = "/cart.html"
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.cart_list = page.locator(".cart_list")
-        self.cart_items = page.locator(".cart_item")
-        self.continue_shopping_button = page.locator("[data-test='continue-shopping']")
-        self.checkout_button = page.locator("[data-test='checkout']")
+    cart_list = Element(".cart_list")
+    cart_items = Element(".cart_item")
+    continue_shopping_button = Element("[data-test='continue-shopping']")
+    checkout_button = Element("[data-test='checkout']")
 
     def is_loaded(self):
         """Verify the cart page is loaded."""
@@ -23,19 +19,25 @@ class CartPage(BasePage):
         """Get the number of items in the cart."""
         return self.cart_items.count()
 
+    def get_items(self) -> list[ItemRow]:
+        """Get all cart items in a single round trip.
+
+        Returns:
+            list[ItemRow]: Cart items in display order
+        """
+        return self.snapshot_rows(self.cart_items)
+
     def get_item_names(self):
         """Get list of all item names in cart."""
-        return self.page.locator(".inventory_item_name").all_inner_texts()
+        return [item.name for item in self.get_items()]
 
     def get_item_prices(self):
         """Get list of all item prices in cart."""
-        price_elements = self.page.locator(".inventory_item_price").all_inner_texts()
-        # Convert to float for comparison, removing '$' sign
-        return [float(price.replace("$", "")) for price in price_elements]
+        return [item.price for item in self.get_items()]
 
     def get_item_descriptions(self):
         """Get list of all item descriptions in cart."""
-        return self.page.locator(".inventory_item_desc").all_inner_texts()
+        return [item.description for item in self.get_items()]
 
     def get_item_details(self, index: int = 0):
         """Get details of a specific cart item by index.
@@ -46,11 +48,11 @@ class CartPage(BasePage):
         Returns:
             dict: Item details including name, description, and price
         """
-        item = self.cart_items.nth(index)
+        item = self.get_items()[index]
         return {
-            "name": item.locator(".inventory_item_name").inner_text(),
-            "description": item.locator(".inventory_item_desc").inner_text(),
-            "price": item.locator(".inventory_item_price").inner_text(),
+            "name": item.name,
+            "description": item.description,
+            "price": item.price_text,
         }
 
     def remove_item_by_name(self, product_name: str):
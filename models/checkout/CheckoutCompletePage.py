@@ -1,17 +1,13 @@
-from playwright.sync_api import Page
-
-from models.base import BasePage
+from models.base import BasePage, Element
 
 
 class CheckoutCompletePage(BasePage):
     """Page Object Model for Checkout Complete - Order Confirmation."""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.complete_header = page.locator(".complete-header")
-        self.complete_text = page.locator(".complete-text")
-        self.pony_express_image = page.locator(".pony_express")
-        self.back_home_button = page.locator("[data-test='back-to-products']")
+    complete_header = Element(".complete-header")
+    complete_text = Element(".complete-text")
+    pony_express_image = Element(".pony_express")
+    back_home_button = Element("[data-test='back-to-products']")
 
     def is_loaded(self):
         """Verify the checkout complete page is loaded."""
@@ -1,19 +1,15 @@
-from playwright.sync_api import Page
-
-from models.base import BasePage
+from models.base import BasePage, Element
 
 
 class CheckoutStepOnePage(BasePage):
     """Page Object Model for Checkout Step 1 - Customer Information."""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.first_name_input = page.locator("[data-test='firstName']")
-        self.last_name_input = page.locator("[data-test='lastName']")
-        self.postal_code_input = page.locator("[data-test='postalCode']")
-        self.continue_button = page.locator("[data-test='continue']")
-        self.cancel_button = page.locator("[data-test='cancel']")
-        self.error_message = page.locator("[data-test='error']")
+    first_name_input = Element("[data-test='firstName']")
+    last_name_input = Element("[data-test='lastName']")
+    postal_code_input = Element("[data-test='postalCode']")
+    continue_button = Element("[data-test='continue']")
+    cancel_button = Element("[data-test='cancel']")
+    error_message = Element("[data-test='error']")
 
     def is_loaded(self):
         """Verify the checkout step 1 page is loaded."""
@@ -1,21 +1,17 @@
-from playwright.sync_api import Page
-
-from models.base import BasePage
+from models.base import BasePage, Element, ItemRow
 
 
 class CheckoutStepTwoPage(BasePage):
     """Page Object Model for Checkout Step 2 - Order Overview/Summary."""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.cart_items = page.locator(".cart_item")
-        self.finish_button = page.locator("[data-test='finish']")
-        self.cancel_button = page.locator("[data-test='cancel']")
-        self.subtotal_label = page.locator(".summary_subtotal_label")
-        self.tax_label = page.locator(".summary_tax_label")
-        self.total_label = page.locator(".summary_total_label")
-        self.payment_info = page.locator("[data-test='payment-info-value']")
-        self.shipping_info = page.locator("[data-test='shipping-info-value']")
+    cart_items = Element(".cart_item")
+    finish_button = Element("[data-test='finish']")
+    cancel_button = Element("[data-test='cancel']")
+    subtotal_label = Element(".summary_subtotal_label")
+    tax_label = Element(".summary_tax_label")
+    total_label = Element(".summary_total_label")
+    payment_info = Element("[data-test='payment-info-value']")
+    shipping_info = Element("[data-test='shipping-info-value']")
 
     def is_loaded(self):
         """Verify the checkout step 2 page is loaded."""
@@ -25,15 +21,21 @@ class CheckoutStepTwoPage(BasePage):
         """Get the number of items in the order."""
         return self.cart_items.count()
 
+    def get_items(self) -> list[ItemRow]:
+        """Get all order items in a single round trip.
+
+        Returns:
+            list[ItemRow]: Order items in display order
+        """
+        return self.snapshot_rows(self.cart_items)
+
     def get_item_names(self):
         """Get list of all item names in the order."""
-        return self.page.locator(".inventory_item_name").all_inner_texts()
+        return [item.name for item in self.get_items()]
 
     def get_item_prices(self):
         """Get list of all item prices in the order."""
-        price_elements = self.page.locator(".inventory_item_price").all_inner_texts()
-        # Convert to float for comparison, removing '$' sign
-        return [float(price.replace("$", "")) for price in price_elements]
+        return [item.price for item in self.get_items()]
 
     def get_item_details(self, index: int = 0):
         """Get details of a specific order item by index.
@@ -44,12 +46,12 @@ class CheckoutStepTwoPage(BasePage):
         Returns:
             dict: Item details including name, description, price, and quantity
         """
-        item = self.cart_items.nth(index)
+        item = self.get_items()[index]
         return {
-            "name": item.locator(".inventory_item_name").inner_text(),
-            "description": item.locator(".inventory_item_desc").inner_text(),
-            "price": item.locator(".inventory_item_price").inner_text(),
-            "quantity": item.locator(".cart_quantity").inner_text(),
+            "name": item.name,
+            "description": item.description,
+            "price": item.price_text,
+            "quantity": str(item.quantity),
         }
 
     def get_subtotal(self):
@@ -1,16 +1,14 @@
-from playwright.sync_api import Page
-
-from models.base import BasePage
+from models.base import BasePage, Element, ItemRow
 
 
 class InventoryPage(BasePage):
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.inventory_list = page.locator(".inventory_list")
-        self.shopping_cart = page.locator("#shopping_cart_container")
-        self.cart_badge = page.locator(".shopping_cart_badge")
-        self.sort_dropdown = page.locator(".product_sort_container")
+    PAGE_URL = "/inventory.html"
+
+    inventory_list = Element(".inventory_list")
+    shopping_cart = Element("#shopping_cart_container")
+    cart_badge = Element(".shopping_cart_badge")
+    sort_dropdown = Element(".product_sort_container")
 
     def is_loaded(self):
         """Verify the inventory page is loaded."""
@@ -59,16 +57,21 @@ class InventoryPage(BasePage):
         """
         self.sort_dropdown.select_option(sort_option)
 
+    def get_products(self) -> list[ItemRow]:
+        """Get all products, including button state, in a single round trip.
+
+        Returns:
+            list[ItemRow]: Products in the current sort order
+        """
+        return self.snapshot_rows(self.page.locator(".inventory_item"))
+
     def get_product_names(self):
         """Get list of all product names in current order."""
-        names = self.page.locator(".inventory_item_name").all_inner_texts()
-        return names
+        return [product.name for product in self.get_products()]
 
     def get_product_prices(self):
         """Get list of all product prices in current order."""
-        price_elements = self.page.locator(".inventory_item_price").all_inner_texts()
-        # Convert to float for comparison, removing '$' sign
-        return [float(price.replace("$", "")) for price in price_elements]
+        return [product.price for product in self.get_products()]
 
     def click_product_name(self, product_name: str):
         """Click on a product name to go to product details."""
@@ -88,11 +91,9 @@ class InventoryPage(BasePage):
 
     def get_product_details(self, index: int):
         """Get details of a product by index."""
-        items = self.page.locator(".inventory_item")
-        item = items.nth(index)
-
+        product = self.get_products()[index]
         return {
-            "name": item.locator(".inventory_item_name").inner_text(),
-            "description": item.locator(".inventory_item_desc").inner_text(),
-            "price": item.locator(".inventory_item_price").inner_text(),
+            "name": product.name,
+            "description": product.description,
+            "price": product.price_text,
         }
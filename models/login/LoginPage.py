@@ -1,18 +1,14 @@
-from models.inventory import InventoryPage
+from models.base import BasePage, Element
 
-from models.base import BasePage
 
 class LoginPage(BasePage):
 
-    PAGE_URL = "https://www.saucedemo.com/"
+    PAGE_URL = "/"
 
-    def __init__(self, page):
-        super().__init__(page)
-        self.page = page
-        self.username_input = page.locator("#user-name")
-        self.password_input = page.locator("#password")
-        self.login_button = page.locator("#login-button")
-        self.error_message = page.locator("[data-test='error']")
+    username_input = Element("#user-name")
+    password_input = Element("#password")
+    login_button = Element("#login-button")
+    error_message = Element("[data-test='error']")
 
     def has_error(self):
         """Check if an error message is displayed."""
@@ -23,6 +19,8 @@ class LoginPage(BasePage):
         return self.error_message.inner_text()
 
     def login(self, username, password):
+        from models.inventory import InventoryPage
+
         self.username_input.fill(username)
         self.password_input.fill(password)
         self.login_button.click()
@@ -0,0 +1,55 @@
+from models.base import BasePage, Element
+
+
+class ProductDetailsPage(BasePage):
+    """Page Object Model for the details page of a single product."""
+
+    # The product is chosen by ?id=<item id>; opened from the inventory page
+    PAGE_URL = "/inventory-item.html"
+
+    name_label = Element(".inventory_details_name")
+    description_label = Element(".inventory_details_desc")
+    price_label = Element(".inventory_details_price")
+    add_to_cart_button = Element("[data-test='add-to-cart']")
+    remove_button = Element("[data-test='remove']")
+    back_button = Element("[data-test='back-to-products']")
+
+    def is_loaded(self):
+        """Verify the product details page is loaded."""
+        return self.name_label.is_visible()
+
+    def get_name(self):
+        """Get the product name."""
+        return self.name_label.inner_text()
+
+    def get_description(self):
+        """Get the product description."""
+        return self.description_label.inner_text()
+
+    def get_price(self):
+        """Get the product price.
+
+        Returns:
+            float: Price in dollars
+        """
+        # Format: "$XX.XX"
+        return float(self.price_label.inner_text().replace("$", ""))
+
+    def add_to_cart(self):
+        """Add the product to the cart."""
+        self.add_to_cart_button.click()
+
+    def remove_from_cart(self):
+        """Remove the product from the cart."""
+        self.remove_button.click()
+
+    def is_in_cart(self):
+        """Check if the product is in the cart (its Remove button is shown)."""
+        return self.remove_button.is_visible()
+
+    def back_to_products(self):
+        """Click Back to products to return to the inventory page."""
+        from models.inventory import InventoryPage
+
+        self.back_button.click()
+        return InventoryPage(self.page)
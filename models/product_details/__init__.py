@@ -0,0 +1,3 @@
+from .ProductDetailsPage import ProductDetailsPage
+
+__all__ = ["ProductDetailsPage"]
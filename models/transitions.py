@@ -0,0 +1,167 @@
+"""The page transition graph, and its check against the page objects.
+
+A page object method that navigates returns the page object of where it
+lands, importing that class inside the method (page modules never import
+each other at module level, so importing one page never drags in the rest).
+TRANSITIONS declares every such method; check_transitions() reads the page
+object sources and reports where the two disagree, so a transition to a
+page that does not exist fails before the first test instead of halfway
+through one.
+"""
+
+import ast
+from pathlib import Path
+
+from . import _EXPORTS
+
+# Page class -> {method: page class the method returns}. Methods are listed
+# under the class that defines them (BasePage's are inherited by every page).
+TRANSITIONS = {
+    "BasePage": {
+        "logout": "LoginPage",
+        "click_all_items": "InventoryPage",
+    },
+    "LoginPage": {
+        "login": "InventoryPage",
+    },
+    "InventoryPage": {
+        "click_cart": "CartPage",
+        "click_product_name": "ProductDetailsPage",
+        "click_product_image": "ProductDetailsPage",
+    },
+    "ProductDetailsPage": {
+        "back_to_products": "InventoryPage",
+    },
+    "CartPage": {
+        "continue_shopping": "InventoryPage",
+        "proceed_to_checkout": "CheckoutStepOnePage",
+    },
+    "CheckoutStepOnePage": {
+        "continue_to_step_two": "CheckoutStepTwoPage",
+        "cancel_checkout": "CartPage",
+        "submit_form": "CheckoutStepTwoPage",
+    },
+    "CheckoutStepTwoPage": {
+        "finish_order": "CheckoutCompletePage",
+        "cancel_order": "InventoryPage",
+    },
+    "CheckoutCompletePage": {
+        "back_to_home": "InventoryPage",
+    },
+}
+
+PACKAGE = __name__.rpartition(".")[0]
+PACKAGE_DIR = Path(__file__).resolve().parent
+# Shown in messages, e.g. "models/login/LoginPage.py"
+PACKAGE_PATH = PACKAGE.replace(".", "/")
+
+
+def check_transitions() -> list[str]:
+    """Compare TRANSITIONS with the page object sources, without importing them.
+
+    Returns:
+        list: One message per problem (empty when the graph matches): a
+        transition the graph lacks or the code lacks, an import of a page
+        that does not exist, a page imported at module level, or a graph
+        entry naming an unknown page or method
+    """
+    modules = {}
+    for path in sorted(PACKAGE_DIR.rglob("*.py")):
+        relative = path.relative_to(PACKAGE_DIR)
+        # The async page objects are generated from these and checked alone
+        if relative.parts[0] == "aio":
+            continue
+        modules[relative] = ast.parse(path.read_text(), str(path))
+
+    classes = {}
+    for relative, tree in modules.items():
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+                classes[node.name] = (relative, node, bases)
+
+    def is_page(name):
+        while name in classes:
+            if name == "BasePage":
+                return True
+            bases = classes[name][2]
+            name = bases[0] if bases else None
+        return False
+
+    problems = []
+    for name, subpackage in _EXPORTS.items():
+        if name not in classes or classes[name][0].parts[0] != subpackage:
+            problems.append(f"{PACKAGE}.{name}: not defined in {PACKAGE}.{subpackage}")
+
+    found = {}
+    for relative, tree in modules.items():
+        for node in tree.body:
+            # Package __init__ files re-export their pages; base defines none
+            if (
+                isinstance(node, ast.ImportFrom)
+                and relative.name != "__init__.py"
+                and relative.parts[0] != "base"
+            ):
+                for alias in node.names:
+                    if is_page(alias.name) and alias.name != "BasePage":
+                        problems.append(
+                            f"{PACKAGE_PATH}/{relative.as_posix()}:{node.lineno}: "
+                            f"{alias.name} imported at module level; import it "
+                            "in the methods that return it"
+                        )
+        for classdef in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+            for method in classdef.body:
+                if not isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    continue
+                for node in ast.walk(method):
+                    if not isinstance(node, ast.ImportFrom) or not _in_package(node):
+                        continue
+                    for alias in node.names:
+                        problem = _check_import(node.module, alias.name, classes)
+                        if problem:
+                            problems.append(f"{classdef.name}.{method.name}: {problem}")
+                        else:
+                            found[classdef.name, method.name] = alias.name
+
+    declared = {
+        (page, method): target
+        for page, methods in TRANSITIONS.items()
+        for method, target in methods.items()
+    }
+    for (page, method), target in declared.items():
+        where = f"{page}.{method}"
+        if target not in _EXPORTS:
+            problems.append(f"{where}: transition to {target}, which is not exported")
+        elif (page, method) not in found:
+            problems.append(
+                f"{where}: declared as a transition to {target}, but "
+                "does not import a page to return"
+            )
+        elif found[page, method] != target:
+            problems.append(
+                f"{where}: declared as a transition to {target}, but "
+                f"returns {found[page, method]}"
+            )
+    for (page, method), target in found.items():
+        if (page, method) not in declared and is_page(target):
+            problems.append(
+                f"{page}.{method}: returns {target}, add it to TRANSITIONS "
+                f"({PACKAGE_PATH}/transitions.py)"
+            )
+    return problems
+
+
+def _in_package(node):
+    module = node.module or ""
+    return module == PACKAGE or module.startswith(f"{PACKAGE}.")
+
+
+def _check_import(module, name, classes):
+    """Return why ``from <module> import <name>`` fails, or None."""
+    parts = module.split(".")[len(PACKAGE.split(".")) :]
+    target = PACKAGE_DIR.joinpath(*parts)
+    if not (target.with_suffix(".py").exists() or (target / "__init__.py").exists()):
+        return f"imports {name} from {module}, which does not exist"
+    if name not in classes or (parts and classes[name][0].parts[0] != parts[0]):
+        return f"imports {name} from {module}, which does not define it"
+    return None
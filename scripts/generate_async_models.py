@@ -0,0 +1,419 @@
+"""
+Generate the async page objects in models/aio/ from the sync ones in models/.
+
+The sync page objects are the single source of truth. Every module under
+models/ (except models/aio/ itself) is copied to the same path under
+models/aio/ with three mechanical changes:
+
+- ``playwright.sync_api`` imports become ``playwright.async_api`` and
+  ``models.*`` imports point at ``models.aio.*``;
+- calls to Playwright methods that are coroutines in the async API
+  (``click``, ``is_visible``, ``inner_text``, ...) are awaited when made on
+  a Playwright object: ``self.page``, a declared Element, a parameter
+  annotated as a Page or Locator, a variable assigned from one of those, or
+  a locator built from any of them;
+- a function becomes ``async def`` when it makes such a call or calls a
+  method of its own class that became async, and those calls are awaited.
+
+Edits are spliced into the original text, so comments, docstrings and
+layout carry over; the result is then formatted with black, since an added
+``await`` can push a line past its length. Run with --check (pre-commit and CI do) to fail
+when models/aio/ is out of date instead of rewriting it.
+
+Usage:
+    uv run python scripts/generate_async_models.py
+    uv run python scripts/generate_async_models.py --check
+"""
+
+import argparse
+import ast
+import re
+import sys
+from pathlib import Path
+
+import black
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "models"
+TARGET = SOURCE / "aio"
+
+# Page, Frame and Locator methods used by page objects that return a
+# coroutine in playwright.async_api. Builders such as locator(), nth() and
+# get_by_*() stay synchronous and are not listed. Names like count() and
+# title() are common on other types too, so they are only awaited on a
+# Playwright receiver (see playwright_receivers).
+AWAITABLE_METHODS = frozenset(
+    {
+        "all_inner_texts",
+        "all_text_contents",
+        "check",
+        "clear",
+        "click",
+        "count",
+        "dblclick",
+        "evaluate",
+        "evaluate_all",
+        "fill",
+        "focus",
+        "get_attribute",
+        "go_back",
+        "go_forward",
+        "goto",
+        "hover",
+        "inner_html",
+        "inner_text",
+        "input_value",
+        "is_checked",
+        "is_disabled",
+        "is_editable",
+        "is_enabled",
+        "is_hidden",
+        "is_visible",
+        "press",
+        "reload",
+        "screenshot",
+        "select_option",
+        "set_input_files",
+        "text_content",
+        "title",
+        "type",
+        "uncheck",
+        "wait_for",
+        "wait_for_function",
+        "wait_for_load_state",
+        "wait_for_selector",
+        "wait_for_timeout",
+        "wait_for_url",
+    }
+)
+
+# Parameter annotations that mark a Playwright object
+PLAYWRIGHT_TYPES = frozenset(
+    {"Page", "Frame", "Locator", "FrameLocator", "ElementHandle"}
+)
+
+NESTED_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+
+IMPORT_REWRITES = (
+    (re.compile(r"\bplaywright\.sync_api\b"), "playwright.async_api"),
+    (re.compile(r"^(\s*from\s+)models\b(?!\.aio)", re.MULTILINE), r"\1models.aio"),
+)
+
+HEADER = (
+    "# Generated from models/{source} by scripts/generate_async_models.py.\n"
+    "# Do not edit: change the sync page object and re-run the script.\n"
+)
+
+
+def source_modules():
+    """Yield every sync model module, relative to models/."""
+    for path in sorted(SOURCE.rglob("*.py")):
+        relative = path.relative_to(SOURCE)
+        if relative.parts[0] != TARGET.name:
+            yield relative
+
+
+def collect_classes(trees):
+    """Map class name to (ClassDef, base class names) across all modules."""
+    classes = {}
+    for tree in trees:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                bases = [base.id for base in node.bases if isinstance(base, ast.Name)]
+                classes[node.name] = (node, bases)
+    return classes
+
+
+def is_self_call(call):
+    func = call.func
+    return (
+        isinstance(func, ast.Attribute)
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "self"
+    )
+
+
+def is_playwright_call(call, is_playwright):
+    func = call.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr in AWAITABLE_METHODS
+        and is_playwright(func.value)
+    )
+
+
+def element_names(classes):
+    """Map class name to the Element attributes it declares or inherits."""
+    declared = {}
+    for name, (classdef, _) in classes.items():
+        declared[name] = {
+            target.id
+            for node in classdef.body
+            if isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "Element"
+            for target in node.targets
+            if isinstance(target, ast.Name)
+        }
+
+    def inherited(name):
+        names = set(declared[name])
+        for base in classes[name][1]:
+            if base in classes:
+                names |= inherited(base)
+        return names
+
+    return {name: inherited(name) for name in classes}
+
+
+def annotation_name(annotation):
+    if isinstance(annotation, ast.Name):
+        return annotation.id
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        return annotation.value
+    return None
+
+
+def playwright_receivers(method, elements):
+    """Return a predicate telling whether an expression in ``method`` is a
+    Playwright object (page, frame or locator).
+
+    Those are ``self.page``, the class's Elements, parameters annotated with
+    a Playwright type, local variables assigned from a Playwright object,
+    and whatever is reached from one through attributes (``page.keyboard``)
+    or builder calls (``locator(...).nth(0)``).
+    """
+    arguments = method.args.posonlyargs + method.args.args + method.args.kwonlyargs
+    names = {
+        argument.arg
+        for argument in arguments
+        if annotation_name(argument.annotation) in PLAYWRIGHT_TYPES
+    }
+
+    def is_playwright(node):
+        if isinstance(node, ast.Name):
+            return node.id in names
+        if isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name) and node.value.id == "self":
+                return node.attr == "page" or node.attr in elements
+            return is_playwright(node.value)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            return node.func.attr not in AWAITABLE_METHODS and is_playwright(
+                node.func.value
+            )
+        return False
+
+    assignments = [
+        node
+        for node in body_nodes(method)
+        if isinstance(node, ast.Assign)
+        and len(node.targets) == 1
+        and isinstance(node.targets[0], ast.Name)
+    ]
+    # Until no assignment adds a name (a variable may be assigned from another)
+    changed = True
+    while changed:
+        changed = False
+        for node in assignments:
+            name = node.targets[0].id
+            if name not in names and is_playwright(node.value):
+                names.add(name)
+                changed = True
+    return is_playwright
+
+
+def body_nodes(function):
+    """Yield the nodes of a function's own body, skipping nested scopes."""
+    pending = list(ast.iter_child_nodes(function))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, NESTED_SCOPES):
+            continue
+        yield node
+        pending.extend(ast.iter_child_nodes(node))
+
+
+def body_calls(function):
+    """Yield the calls a function makes itself, skipping nested scopes."""
+    for node in body_nodes(function):
+        if isinstance(node, ast.Call):
+            yield node
+
+
+def own_methods(classdef):
+    return [
+        node
+        for node in classdef.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+
+
+def async_methods(classes):
+    """Resolve, per class, the names of methods that become coroutines.
+
+    Iterates to a fixed point, since a method that calls an async method of
+    its class (inherited ones included) becomes async itself.
+    """
+    resolved = {name: set() for name in classes}
+    elements = element_names(classes)
+
+    def visible(name):
+        # Async names of a class: its own, plus inherited ones it does not
+        # override with a method that stays synchronous
+        classdef, bases = classes[name]
+        defined = {method.name for method in own_methods(classdef)}
+        names = set(resolved[name])
+        for base in bases:
+            if base in classes:
+                names |= visible(base) - defined
+        return names
+
+    changed = True
+    while changed:
+        changed = False
+        for name, (classdef, _) in classes.items():
+            awaitable = visible(name)
+            for method in own_methods(classdef):
+                if method.name in resolved[name]:
+                    continue
+                is_playwright = playwright_receivers(method, elements[name])
+                for node in body_calls(method):
+                    if is_playwright_call(node, is_playwright) or (
+                        is_self_call(node) and node.func.attr in awaitable
+                    ):
+                        resolved[name].add(method.name)
+                        changed = True
+                        break
+    return {name: visible(name) for name in classes}
+
+
+def needs_parentheses(call, parent):
+    """Whether ``await call`` must be parenthesised where it appears."""
+    if isinstance(parent, (ast.Attribute, ast.Subscript)):
+        return parent.value is call
+    if isinstance(parent, ast.Call):
+        return parent.func is call
+    return False
+
+
+def asyncify(text, tree, awaitable_by_class, elements):
+    """Return the async version of one module's source text."""
+    encoded = text.encode()
+    line_starts = [0]
+    for line in encoded.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+
+    def offset(lineno, col):
+        # ast column offsets are UTF-8 byte offsets
+        return line_starts[lineno - 1] + col
+
+    parents = {}
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+
+    # (offset, order, text); at one offset, outer openings go first and
+    # outer closings last
+    insertions = []
+
+    def depth(node):
+        level = 0
+        while node in parents:
+            node = parents[node]
+            level += 1
+        return level
+
+    for classdef in (n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)):
+        awaitable = awaitable_by_class[classdef.name]
+        for method in own_methods(classdef):
+            if method.name not in awaitable:
+                continue
+            start = offset(method.lineno, method.col_offset)
+            insertions.append((start, 0, "async "))
+            is_playwright = playwright_receivers(method, elements[classdef.name])
+            for node in body_calls(method):
+                if not (
+                    is_playwright_call(node, is_playwright)
+                    or (is_self_call(node) and node.func.attr in awaitable)
+                ):
+                    continue
+                level = depth(node)
+                start = offset(node.lineno, node.col_offset)
+                end = offset(node.end_lineno, node.end_col_offset)
+                if needs_parentheses(node, parents[node]):
+                    insertions.append((start, level, "(await "))
+                    insertions.append((end, -level, ")"))
+                else:
+                    insertions.append((start, level, "await "))
+
+    output = bytearray()
+    position = 0
+    for at, _, insert in sorted(insertions):
+        output += encoded[position:at] + insert.encode()
+        position = at
+    output += encoded[position:]
+
+    result = output.decode()
+    for pattern, replacement in IMPORT_REWRITES:
+        result = pattern.sub(replacement, result)
+    return result
+
+
+def generate():
+    """Return the generated text of every async module, by path."""
+    sources = {
+        relative: (SOURCE / relative).read_text() for relative in source_modules()
+    }
+    trees = {relative: ast.parse(text) for relative, text in sources.items()}
+    classes = collect_classes(trees.values())
+    awaitable_by_class = async_methods(classes)
+    elements = element_names(classes)
+
+    generated = {}
+    for relative, text in sources.items():
+        body = asyncify(text, trees[relative], awaitable_by_class, elements)
+        generated[TARGET / relative] = black.format_str(
+            HEADER.format(source=relative.as_posix()) + body, mode=black.Mode()
+        )
+    return generated
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if models/aio/ differs from what would be generated",
+    )
+    args = parser.parse_args()
+
+    generated = generate()
+    expected = set(generated)
+    existing = {path for path in TARGET.rglob("*.py")} if TARGET.exists() else set()
+    stale = sorted(existing - expected)
+    changed = sorted(
+        path
+        for path, text in generated.items()
+        if not path.exists() or path.read_text() != text
+    )
+
+    if args.check:
+        for path in changed + stale:
+            print(f"out of date: {path.relative_to(ROOT)}")
+        if changed or stale:
+            print("run: uv run python scripts/generate_async_models.py")
+            sys.exit(1)
+        return
+
+    for path in changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generated[path])
+        print(f"wrote {path.relative_to(ROOT)}")
+    for path in stale:
+        path.unlink()
+        print(f"removed {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
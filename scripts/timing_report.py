@@ -0,0 +1,191 @@
+"""
+Report trends, slow tests and regressions from the test timing history.
+
+Every pytest run appends its per-test, per-phase and per-browser durations
+and its fixture setup times to .test-timings.db (see utils.TimingStore).
+This script summarises them:
+
+- trends: tests, wall time, total test time and p50/p95 test duration per run
+- slowest: the slowest tests (p50/p95 over recent runs, per phase) and fixtures
+- regressions: tests of the latest run that got slower than their baseline;
+  exits with status 1 when there are any, so CI can gate on it
+
+Usage:
+    uv run python scripts/timing_report.py trends --runs 20
+    uv run python scripts/timing_report.py slowest --top 15
+    uv run python scripts/timing_report.py regressions --threshold 0.25
+    uv run python scripts/timing_report.py regressions --baseline 42
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from utils.timings import TimingStore, percentile  # noqa: E402
+
+
+def trends(store, args):
+    runs = store.runs(args.runs)
+    durations = store.test_durations(run[0] for run in runs)
+    print(
+        f"{'run':>5}  {'date':16}  {'revision':10}  {'workers':>7}  {'tests':>5}  "
+        f"{'wall':>8}  {'work':>8}  {'p50':>7}  {'p95':>7}  status"
+    )
+    for run_id, started, wall, revision, workers, exitstatus in runs:
+        tests = list(durations[run_id].values())
+        p50 = percentile(tests, 50) if tests else 0.0
+        p95 = percentile(tests, 95) if tests else 0.0
+        print(
+            f"{run_id:>5}  {time.strftime('%Y-%m-%d %H:%M', time.localtime(started)):16}  "
+            f"{revision or '-':10}  {workers:>7}  {len(tests):>5}  "
+            f"{wall:>7.1f}s  {sum(tests):>7.1f}s  {p50:>6.2f}s  {p95:>6.2f}s  "
+            f"{'ok' if exitstatus == 0 else f'exit {exitstatus}'}"
+        )
+
+
+def slowest(store, args):
+    run_ids = [run[0] for run in store.runs(args.runs)]
+
+    by_test = {}
+    for durations in store.test_durations(run_ids).values():
+        for nodeid, seconds in durations.items():
+            by_test.setdefault(nodeid, []).append(seconds)
+    by_phase = {}
+    for (nodeid, _, phase), values in store.phase_durations(run_ids).items():
+        by_phase[nodeid, phase] = percentile(values, 50)
+
+    ranked = sorted(by_test.items(), key=lambda entry: -percentile(entry[1], 50))
+    print(f"slowest tests over the last {len(run_ids)} runs")
+    print(
+        f"{'p50':>7}  {'p95':>7}  {'setup':>7}  {'call':>7}  {'teardown':>8}  "
+        f"{'runs':>4}  test"
+    )
+    for nodeid, values in ranked[: args.top]:
+        phases = [
+            by_phase.get((nodeid, phase), 0.0)
+            for phase in ("setup", "call", "teardown")
+        ]
+        print(
+            f"{percentile(values, 50):>6.2f}s  {percentile(values, 95):>6.2f}s  "
+            f"{phases[0]:>6.2f}s  {phases[1]:>6.2f}s  {phases[2]:>7.2f}s  "
+            f"{len(values):>4}  {nodeid}"
+        )
+
+    fixtures = store.fixture_totals(run_ids)
+    ranked = sorted(
+        fixtures.items(),
+        key=lambda entry: -statistics.median(total for _, total, _ in entry[1]),
+    )
+    print()
+    print("slowest fixtures (setup time per run)")
+    print(f"{'p50':>7}  {'calls':>5}  {'slowest':>8}  {'scope':8}  fixture")
+    for (name, scope), totals in ranked[: args.top]:
+        print(
+            f"{statistics.median(total for _, total, _ in totals):>6.2f}s  "
+            f"{round(statistics.median(calls for calls, _, _ in totals)):>5}  "
+            f"{max(worst for _, _, worst in totals):>7.2f}s  {scope:8}  {name}"
+        )
+
+
+def regressions(store, args):
+    latest = 1 if args.baseline is not None else args.baseline_runs + 1
+    runs = [run[0] for run in store.runs(latest)]
+    if not runs:
+        print("no runs recorded")
+        return 0
+    current = runs[-1]
+    baseline_runs = [args.baseline] if args.baseline is not None else runs[:-1]
+    if not baseline_runs:
+        print("only one run recorded, nothing to compare against")
+        return 0
+
+    measured = store.test_durations([current])[current]
+    history = {}
+    for durations in store.test_durations(baseline_runs).values():
+        for nodeid, seconds in durations.items():
+            history.setdefault(nodeid, []).append(seconds)
+
+    found = []
+    for nodeid, seconds in measured.items():
+        if nodeid not in history:
+            continue
+        baseline = statistics.median(history[nodeid])
+        if (
+            seconds > baseline * (1 + args.threshold)
+            and seconds - baseline >= args.min_delta
+        ):
+            found.append((seconds - baseline, baseline, seconds, nodeid))
+
+    described = (
+        f"run {args.baseline}"
+        if args.baseline is not None
+        else f"the median of {len(baseline_runs)} earlier runs"
+    )
+    if not found:
+        print(f"run {current}: no regressions against {described}")
+        return 0
+    print(
+        f"run {current}: {len(found)} tests more than {args.threshold:.0%} "
+        f"(and {args.min_delta}s) slower than {described}"
+    )
+    print(f"{'baseline':>9}  {'now':>7}  {'change':>7}  test")
+    for _, baseline, seconds, nodeid in sorted(found, reverse=True):
+        # A baseline rounded to 0.0s has no meaningful relative change
+        change = f"{seconds / baseline - 1:>+7.0%}" if baseline else f"{'n/a':>7}"
+        print(f"{baseline:>8.2f}s  {seconds:>6.2f}s  {change}  {nodeid}")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--db", default=str(ROOT / ".test-timings.db"), help="Timing history database"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    trends_parser = commands.add_parser("trends", help="Per-run totals and percentiles")
+    trends_parser.add_argument("--runs", type=int, default=10)
+
+    slowest_parser = commands.add_parser("slowest", help="Slowest tests and fixtures")
+    slowest_parser.add_argument("--runs", type=int, default=10)
+    slowest_parser.add_argument("--top", type=int, default=10)
+
+    regressions_parser = commands.add_parser(
+        "regressions", help="Tests of the latest run slower than their baseline"
+    )
+    regressions_parser.add_argument(
+        "--baseline", type=int, default=None, help="Compare against this run id"
+    )
+    regressions_parser.add_argument(
+        "--baseline-runs",
+        type=int,
+        default=5,
+        help="Without --baseline, compare against the median of this many earlier runs",
+    )
+    regressions_parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Relative slowdown, e.g. 0.25"
+    )
+    regressions_parser.add_argument(
+        "--min-delta", type=float, default=0.25, help="Absolute slowdown in seconds"
+    )
+
+    args = parser.parse_args()
+    if not Path(args.db).exists():
+        sys.exit(f"no timing history at {args.db}; run the tests first")
+
+    with TimingStore(args.db) as store:
+        if args.command == "trends":
+            trends(store, args)
+        elif args.command == "slowest":
+            slowest(store, args)
+        else:
+            sys.exit(regressions(store, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from .booker import BookerServer
+from .saucedemo import SauceDemoServer
+
+__all__ = ["BookerServer", "SauceDemoServer"]
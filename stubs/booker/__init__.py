@@ -0,0 +1,3 @@
+from .server import BookerServer
+
+__all__ = ["BookerServer"]
@@ -0,0 +1,330 @@
+import json
+import random
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+ADMIN_CREDENTIALS = {"username": "admin", "password": "password123"}
+
+# Authorization header value the real API accepts instead of a token cookie
+ADMIN_BASIC_AUTH = "Basic YWRtaW46cGFzc3dvcmQxMjM="
+
+REQUIRED_FIELDS = ("firstname", "lastname", "totalprice", "depositpaid", "bookingdates")
+
+SEED_BOOKINGS = [
+    ("Sally", "Brown", 111, True, "2025-01-10", "2025-01-14", "Breakfast"),
+    ("Jim", "Wilson", 542, False, "2025-03-02", "2025-03-09", None),
+    ("Mark", "Jones", 206, True, "2025-05-18", "2025-05-20", "Late checkout"),
+    ("Mary", "Ericsson", 873, False, "2025-08-01", "2025-08-11", None),
+    ("Eric", "Smith", 330, True, "2025-10-05", "2025-10-06", "Lunch"),
+]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    # socketserver's default backlog of 5 drops connections when a bulk
+    # client opens many at once, and each dropped SYN costs a 1 s retransmit
+    request_queue_size = 128
+
+
+class BookerServer:
+    """In-process stand-in for the Restful Booker API.
+
+    Implements the endpoints used by tests/api: ``/ping``, ``/auth``,
+    ``/booking`` with its firstname/lastname/checkin/checkout filters, and
+    GET/PUT/PATCH/DELETE on ``/booking/{id}`` with cookie token or basic
+    auth. Status codes and bodies follow the public API, including its
+    quirks (200 for failed auth, 201 for DELETE, 405 for unknown ids on
+    mutation).
+
+    The server speaks HTTP/1.1 keep-alive, runs in a background thread and
+    binds to a free port by default. ``latency`` delays every response and
+    ``error_rate`` answers that fraction of requests with a 503, so client
+    behaviour can be measured under load. ``connections`` and ``requests``
+    count what the server has seen.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            latency: Seconds to wait before answering each request
+            error_rate: Fraction (0-1) of requests answered with 503
+            seed: Seed for the error injection, for reproducible runs
+            host: Interface to bind to
+            port: Port to bind to (0 picks a free port)
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.connections = 0
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = set()
+        self._bookings = {}
+        self._next_id = 1
+        for first, last, price, paid, checkin, checkout, needs in SEED_BOOKINGS:
+            booking = {
+                "firstname": first,
+                "lastname": last,
+                "totalprice": price,
+                "depositpaid": paid,
+                "bookingdates": {"checkin": checkin, "checkout": checkout},
+            }
+            if needs:
+                booking["additionalneeds"] = needs
+            self._create(booking)
+
+        self._httpd = _Server((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the running server, without a trailing slash."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="booker-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # -------------------------------------------------------------------------
+    # Booking store
+    # -------------------------------------------------------------------------
+
+    def _create(self, booking):
+        with self._lock:
+            booking_id = self._next_id
+            self._next_id += 1
+            self._bookings[booking_id] = booking
+        return booking_id
+
+    def _search(self, params):
+        """Return the ids of bookings matching the query filters."""
+        with self._lock:
+            bookings = list(self._bookings.items())
+
+        def matches(booking):
+            dates = booking["bookingdates"]
+            checks = (
+                ("firstname", lambda v: booking["firstname"] == v),
+                ("lastname", lambda v: booking["lastname"] == v),
+                ("checkin", lambda v: dates["checkin"] >= v),
+                ("checkout", lambda v: dates["checkout"] <= v),
+            )
+            return all(check(params[key]) for key, check in checks if key in params)
+
+        return [{"bookingid": booking_id} for booking_id, b in bookings if matches(b)]
+
+    # -------------------------------------------------------------------------
+    # HTTP handling
+    # -------------------------------------------------------------------------
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out as separate writes; with Nagle on, every
+            # keep-alive response would wait for the client's delayed ACK
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_PUT(self):
+                self._dispatch("PUT")
+
+            def do_PATCH(self):
+                self._dispatch("PATCH")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+            def _dispatch(self, method):
+                body = self._read_body()
+                with server._lock:
+                    server.requests += 1
+                    fail = server._random.random() < server.error_rate
+                if server.latency:
+                    time.sleep(server.latency)
+                if fail:
+                    return self._text(503, "Service Unavailable")
+
+                parts = urlsplit(self.path)
+                segments = [s for s in parts.path.split("/") if s]
+                params = {k: v[0] for k, v in parse_qs(parts.query).items()}
+
+                if segments == ["ping"] and method == "GET":
+                    return self._text(201, "Created")
+                if segments == ["auth"] and method == "POST":
+                    return self._auth(body)
+                if segments == ["booking"] and method == "GET":
+                    return self._json(200, server._search(params))
+                if segments == ["booking"] and method == "POST":
+                    return self._create_booking(body)
+                if len(segments) == 2 and segments[0] == "booking":
+                    return self._booking(method, segments[1], body)
+                return self._text(404, "Not Found")
+
+            # -- endpoints ----------------------------------------------------
+
+            def _auth(self, body):
+                credentials = body if isinstance(body, dict) else {}
+                if (
+                    credentials.get("username") != ADMIN_CREDENTIALS["username"]
+                    or credentials.get("password") != ADMIN_CREDENTIALS["password"]
+                ):
+                    # The real API reports bad credentials with a 200
+                    return self._json(200, {"reason": "Bad credentials"})
+                token = secrets.token_hex(8)[:15]
+                with server._lock:
+                    server._tokens.add(token)
+                return self._json(200, {"token": token})
+
+            def _create_booking(self, body):
+                if not _is_valid(body):
+                    return self._text(500, "Internal Server Error")
+                booking = _normalize(body)
+                booking_id = server._create(booking)
+                return self._json(200, {"bookingid": booking_id, "booking": booking})
+
+            def _booking(self, method, raw_id, body):
+                booking_id = int(raw_id) if raw_id.isdigit() else None
+                with server._lock:
+                    booking = server._bookings.get(booking_id)
+
+                if method == "GET":
+                    if booking is None:
+                        return self._text(404, "Not Found")
+                    return self._json(200, booking)
+
+                if method not in ("PUT", "PATCH", "DELETE"):
+                    return self._text(404, "Not Found")
+                if not self._authorized():
+                    return self._text(403, "Forbidden")
+                if booking is None:
+                    return self._text(405, "Method Not Allowed")
+
+                if method == "DELETE":
+                    with server._lock:
+                        server._bookings.pop(booking_id, None)
+                    return self._text(201, "Created")
+
+                if method == "PUT":
+                    if not _is_valid(body):
+                        return self._text(400, "Bad Request")
+                    updated = _normalize(body)
+                else:
+                    if not isinstance(body, dict):
+                        return self._text(400, "Bad Request")
+                    updated = dict(booking)
+                    for key, value in body.items():
+                        if key == "bookingdates" and isinstance(value, dict):
+                            updated[key] = {**booking["bookingdates"], **value}
+                        else:
+                            updated[key] = value
+
+                with server._lock:
+                    server._bookings[booking_id] = updated
+                return self._json(200, updated)
+
+            # -- helpers ------------------------------------------------------
+
+            def _authorized(self):
+                if self.headers.get("Authorization") == ADMIN_BASIC_AUTH:
+                    return True
+                cookies = self.headers.get("Cookie", "")
+                for cookie in cookies.split(";"):
+                    name, _, value = cookie.strip().partition("=")
+                    if name == "token":
+                        with server._lock:
+                            return value in server._tokens
+                return False
+
+            def _read_body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if not length:
+                    return None
+                raw = self.rfile.read(length)
+                try:
+                    return json.loads(raw)
+                except ValueError:
+                    return None
+
+            def _json(self, status, payload):
+                self._send(
+                    status, "application/json; charset=utf-8", json.dumps(payload)
+                )
+
+            def _text(self, status, text):
+                self._send(status, "text/plain; charset=utf-8", text)
+
+            def _send(self, status, content_type, text):
+                body = text.encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep test output clean
+                pass
+
+        return Handler
+
+
+def _is_valid(body):
+    """Check a full booking payload has every required field."""
+    return (
+        isinstance(body, dict)
+        and all(field in body for field in REQUIRED_FIELDS)
+        and isinstance(body["bookingdates"], dict)
+        and {"checkin", "checkout"} <= body["bookingdates"].keys()
+    )
+
+
+def _normalize(body):
+    """Keep only the fields the API stores, in its field order."""
+    booking = {field: body[field] for field in REQUIRED_FIELDS}
+    booking["bookingdates"] = {
+        "checkin": body["bookingdates"]["checkin"],
+        "checkout": body["bookingdates"]["checkout"],
+    }
+    if "additionalneeds" in body:
+        booking["additionalneeds"] = body["additionalneeds"]
+    return booking
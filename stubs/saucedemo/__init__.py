@@ -0,0 +1,3 @@
+from .server import SauceDemoServer
+
+__all__ = ["SauceDemoServer"]
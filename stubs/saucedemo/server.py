@@ -0,0 +1,138 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+# Paths that render a page of the app (the login page is served for "/")
+PAGE_PATHS = (
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+)
+
+STATIC_FILES = {
+    "/static/app.js": ("app.js", "application/javascript"),
+    "/static/app.css": ("app.css", "text/css"),
+}
+
+# 1x1 transparent GIF served for every product and decoration image
+PLACEHOLDER_IMAGE = bytes.fromhex(
+    "47494638396101000100800000000000ffffff21f90401000000002c00000000010001000002024401003b"
+)
+
+
+class SauceDemoServer:
+    """Local stand-in for the Sauce Demo storefront.
+
+    Serves a small single-page app (stubs/saucedemo/static) with the same
+    pages, selectors, messages and client-side state (session cookie and
+    cart localStorage) the page objects in models/ rely on, so the UI suite
+    can run without an internet round trip.
+
+    The server binds to port 0 by default, so every xdist worker gets its own
+    free port. ``latency`` adds a fixed delay to every response to emulate a
+    remote host.
+    """
+
+    def __init__(
+        self,
+        products: dict,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            products: Product records keyed by name, as in test_data/products.json
+            latency: Seconds to wait before answering each request
+            host: Interface to bind to
+            port: Port to bind to (0 picks a free port)
+        """
+        self.latency = latency
+        self._page = (
+            (STATIC_DIR / "index.html")
+            .read_text()
+            .replace("{products}", json.dumps(list(products.values())))
+            .encode()
+        )
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of the running server, without a trailing slash."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="saucedemo-stub", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._respond(send_body=True)
+
+            def do_HEAD(self):
+                # Asset filters read the size of blocked assets this way
+                self._respond(send_body=False)
+
+            def _respond(self, send_body):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                path = self.path.split("?", 1)[0]
+                if path in PAGE_PATHS:
+                    status, content_type, body = (
+                        200,
+                        "text/html; charset=utf-8",
+                        server._page,
+                    )
+                elif path in STATIC_FILES:
+                    name, content_type = STATIC_FILES[path]
+                    status, body = 200, (STATIC_DIR / name).read_bytes()
+                elif path.startswith("/static/media/"):
+                    status, content_type, body = 200, "image/gif", PLACEHOLDER_IMAGE
+                else:
+                    status, content_type, body = 404, "text/plain", b"Not Found"
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # Keep test output clean
+                pass
+
+        return Handler
@@ -0,0 +1,426 @@
+// Local stand-in for the Sauce Demo storefront.
+//
+// Renders each page synchronously from window.PRODUCTS (injected by the
+// server) so the DOM is complete by the load event, like the real app. State
+// lives where the real app keeps it: the "session-username" cookie and the
+// "cart-contents" localStorage entry (a JSON list of numeric item ids).
+(function () {
+  "use strict";
+
+  var PASSWORD = "secret_sauce";
+  var USERS = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user",
+  ];
+  var TAX_RATE = 0.08;
+  var root = document.getElementById("root");
+
+  // -------------------------------------------------------------------------
+  // State
+  // -------------------------------------------------------------------------
+
+  function currentUser() {
+    var match = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+    return match ? decodeURIComponent(match[1]) : null;
+  }
+
+  function setUser(name) {
+    if (name === null) {
+      document.cookie = "session-username=; path=/; max-age=0";
+    } else {
+      document.cookie =
+        "session-username=" + encodeURIComponent(name) + "; path=/; max-age=3600";
+    }
+  }
+
+  function cart() {
+    try {
+      return JSON.parse(localStorage.getItem("cart-contents")) || [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function saveCart(ids) {
+    if (ids.length) {
+      localStorage.setItem("cart-contents", JSON.stringify(ids));
+    } else {
+      localStorage.removeItem("cart-contents");
+    }
+  }
+
+  function product(id) {
+    for (var i = 0; i < window.PRODUCTS.length; i++) {
+      if (window.PRODUCTS[i].item_id === id) return window.PRODUCTS[i];
+    }
+    return null;
+  }
+
+  function go(path) {
+    window.location.href = path;
+  }
+
+  // -------------------------------------------------------------------------
+  // DOM helpers
+  // -------------------------------------------------------------------------
+
+  function el(tag, attrs, children) {
+    var node = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (key) {
+      if (key === "text") node.textContent = attrs[key];
+      else if (key === "onclick") node.addEventListener("click", attrs[key]);
+      else node.setAttribute(key, attrs[key]);
+    });
+    (children || []).forEach(function (child) {
+      if (child) node.appendChild(child);
+    });
+    return node;
+  }
+
+  function price(value) {
+    return "$" + value.toFixed(2);
+  }
+
+  function errorBanner(message, onClose) {
+    return el("div", { class: "error-message-container error" }, [
+      el("h3", { "data-test": "error" }, [
+        document.createTextNode(message),
+        el("button", { class: "error-button", "data-test": "error-button", onclick: onClose }, [
+          document.createTextNode("x"),
+        ]),
+      ]),
+    ]);
+  }
+
+  // -------------------------------------------------------------------------
+  // Shared header and menu
+  // -------------------------------------------------------------------------
+
+  function header(title) {
+    var wrap = el("div", { class: "bm-menu-wrap", "aria-hidden": "true" }, [
+      el("nav", { class: "bm-item-list" }, [
+        el("a", { id: "inventory_sidebar_link", class: "bm-item menu-item", href: "#", text: "All Items",
+          onclick: function (e) { e.preventDefault(); go("/inventory.html"); } }),
+        el("a", { id: "about_sidebar_link", class: "bm-item menu-item", href: "https://saucelabs.com/", text: "About" }),
+        el("a", { id: "logout_sidebar_link", class: "bm-item menu-item", href: "#", text: "Logout",
+          onclick: function (e) { e.preventDefault(); setUser(null); go("/"); } }),
+        el("a", { id: "reset_sidebar_link", class: "bm-item menu-item", href: "#", text: "Reset App State",
+          onclick: function (e) { e.preventDefault(); saveCart([]); renderBadge(); } }),
+      ]),
+      el("div", { class: "bm-cross-button" }, [
+        el("button", { id: "react-burger-cross-btn", type: "button", text: "Close Menu",
+          onclick: function () { wrap.setAttribute("aria-hidden", "true"); } }),
+      ]),
+    ]);
+
+    var badgeHolder = el("a", { class: "shopping_cart_link", "data-test": "shopping-cart-link", href: "/cart.html" });
+    var bar = el("div", { class: "primary_header" }, [
+      el("div", { class: "bm-burger-button" }, [
+        el("button", { id: "react-burger-menu-btn", type: "button", text: "Open Menu",
+          onclick: function () { wrap.setAttribute("aria-hidden", "false"); } }),
+      ]),
+      wrap,
+      el("div", { class: "app_logo", text: "Swag Labs" }),
+      el("div", { id: "shopping_cart_container", class: "shopping_cart_container" }, [badgeHolder]),
+    ]);
+    var secondary = el("div", { class: "header_secondary_container" }, [
+      el("span", { class: "title", "data-test": "title", text: title }),
+    ]);
+    return el("div", { id: "header_container", class: "header_container" }, [bar, secondary]);
+  }
+
+  function renderBadge() {
+    var link = document.querySelector(".shopping_cart_link");
+    if (!link) return;
+    link.innerHTML = "";
+    var count = cart().length;
+    if (count) {
+      link.appendChild(el("span", { class: "shopping_cart_badge", "data-test": "shopping-cart-badge", text: String(count) }));
+    }
+  }
+
+  function cartButton(item) {
+    var inCart = cart().indexOf(item.item_id) !== -1;
+    var button = el("button", {
+      class: "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+      "data-test": (inCart ? "remove-" : "add-to-cart-") + item.id,
+      text: inCart ? "Remove" : "Add to cart",
+    });
+    button.addEventListener("click", function () {
+      var ids = cart();
+      var index = ids.indexOf(item.item_id);
+      if (index === -1) ids.push(item.item_id);
+      else ids.splice(index, 1);
+      saveCart(ids);
+      button.replaceWith(cartButton(item));
+      renderBadge();
+    });
+    return button;
+  }
+
+  // -------------------------------------------------------------------------
+  // Pages
+  // -------------------------------------------------------------------------
+
+  function loginPage(initialError) {
+    var error = initialError || null;
+    var username = el("input", { id: "user-name", name: "user-name", "data-test": "username", placeholder: "Username", type: "text" });
+    var password = el("input", { id: "password", name: "password", "data-test": "password", placeholder: "Password", type: "password" });
+    var errorSlot = el("div", { class: "error-slot" });
+
+    function showError(message) {
+      errorSlot.innerHTML = "";
+      if (message) errorSlot.appendChild(errorBanner(message, function () { showError(null); }));
+    }
+
+    var form = el("form", {}, [
+      el("div", { class: "form_group" }, [username]),
+      el("div", { class: "form_group" }, [password]),
+      errorSlot,
+      el("input", { id: "login-button", "data-test": "login-button", type: "submit", class: "submit-button btn_action", value: "Login" }),
+    ]);
+    form.addEventListener("submit", function (e) {
+      e.preventDefault();
+      var name = username.value;
+      if (!name) return showError("Epic sadface: Username is required");
+      if (!password.value) return showError("Epic sadface: Password is required");
+      if (USERS.indexOf(name) === -1 || password.value !== PASSWORD) {
+        return showError("Epic sadface: Username and password do not match any user in this service");
+      }
+      if (name === "locked_out_user") {
+        return showError("Epic sadface: Sorry, this user has been locked out.");
+      }
+      setUser(name);
+      go("/inventory.html");
+    });
+
+    root.appendChild(el("div", { class: "login_wrapper" }, [
+      el("div", { class: "login_logo", text: "Swag Labs" }),
+      el("div", { class: "login-box" }, [form]),
+    ]));
+    showError(error);
+  }
+
+  function itemRow(item, quantity) {
+    return el("div", { class: "cart_item", "data-test": "inventory-item" }, [
+      el("div", { class: "cart_quantity", "data-test": "item-quantity", text: String(quantity) }),
+      el("div", { class: "cart_item_label" }, [
+        el("div", { class: "inventory_item_name", "data-test": "inventory-item-name", text: item.name }),
+        el("div", { class: "inventory_item_desc", "data-test": "inventory-item-desc", text: item.description }),
+        el("div", { class: "item_pricebar" }, [
+          el("div", { class: "inventory_item_price", "data-test": "inventory-item-price", text: price(item.price) }),
+        ]),
+      ]),
+    ]);
+  }
+
+  function cartItems() {
+    return cart().map(product).filter(Boolean);
+  }
+
+  var SORTS = {
+    az: function (a, b) { return a.name.localeCompare(b.name); },
+    za: function (a, b) { return b.name.localeCompare(a.name); },
+    lohi: function (a, b) { return a.price - b.price; },
+    hilo: function (a, b) { return b.price - a.price; },
+  };
+
+  function inventoryPage() {
+    var list = el("div", { class: "inventory_list", "data-test": "inventory-list" });
+
+    function renderList(order) {
+      list.innerHTML = "";
+      window.PRODUCTS.slice().sort(SORTS[order]).forEach(function (item) {
+        list.appendChild(el("div", { class: "inventory_item", "data-test": "inventory-item" }, [
+          el("div", { class: "inventory_item_img" }, [
+            el("a", { href: "/inventory-item.html?id=" + item.item_id }, [
+              el("img", { class: "inventory_item_img", alt: item.name, src: "/static/media/" + item.image }),
+            ]),
+          ]),
+          el("div", { class: "inventory_item_description" }, [
+            el("div", { class: "inventory_item_label" }, [
+              el("a", { href: "/inventory-item.html?id=" + item.item_id }, [
+                el("div", { class: "inventory_item_name", "data-test": "inventory-item-name", text: item.name }),
+              ]),
+              el("div", { class: "inventory_item_desc", "data-test": "inventory-item-desc", text: item.description }),
+            ]),
+            el("div", { class: "pricebar" }, [
+              el("div", { class: "inventory_item_price", "data-test": "inventory-item-price", text: price(item.price) }),
+              cartButton(item),
+            ]),
+          ]),
+        ]));
+      });
+    }
+
+    var sort = el("select", { class: "product_sort_container", "data-test": "product-sort-container" },
+      [["az", "Name (A to Z)"], ["za", "Name (Z to A)"], ["lohi", "Price (low to high)"], ["hilo", "Price (high to low)"]]
+        .map(function (option) { return el("option", { value: option[0], text: option[1] }); }));
+    sort.addEventListener("change", function () { renderList(sort.value); });
+
+    var head = header("Products");
+    head.querySelector(".header_secondary_container").appendChild(sort);
+    root.appendChild(head);
+    root.appendChild(el("div", { id: "inventory_container" }, [list]));
+    renderList("az");
+  }
+
+  function detailsPage() {
+    var item = product(Number(new URLSearchParams(window.location.search).get("id")));
+    root.appendChild(header(""));
+    if (!item) {
+      root.appendChild(el("div", { class: "inventory_details_name", text: "ITEM NOT FOUND" }));
+      return;
+    }
+
+    function button() {
+      var inCart = cart().indexOf(item.item_id) !== -1;
+      return el("button", {
+        class: "btn btn_small btn_inventory " + (inCart ? "btn_secondary" : "btn_primary"),
+        id: inCart ? "remove" : "add-to-cart",
+        "data-test": inCart ? "remove" : "add-to-cart",
+        text: inCart ? "Remove" : "Add to cart",
+        onclick: function () {
+          var ids = cart();
+          var index = ids.indexOf(item.item_id);
+          if (index === -1) ids.push(item.item_id);
+          else ids.splice(index, 1);
+          saveCart(ids);
+          slot.replaceChild(button(), slot.firstChild);
+          renderBadge();
+        },
+      });
+    }
+
+    var slot = el("div", {}, [button()]);
+    root.appendChild(el("div", { class: "inventory_details" }, [
+      el("button", { id: "back-to-products", "data-test": "back-to-products", class: "btn btn_secondary back",
+        text: "Back to products", onclick: function () { go("/inventory.html"); } }),
+      el("div", { class: "inventory_details_container" }, [
+        el("img", { class: "inventory_details_img", alt: item.name, src: "/static/media/" + item.image }),
+        el("div", { class: "inventory_details_desc_container" }, [
+          el("div", { class: "inventory_details_name", "data-test": "inventory-item-name", text: item.name }),
+          el("div", { class: "inventory_details_desc", "data-test": "inventory-item-desc", text: item.description }),
+          el("div", { class: "inventory_details_price", "data-test": "inventory-item-price", text: price(item.price) }),
+          slot,
+        ]),
+      ]),
+    ]));
+  }
+
+  function cartPage() {
+    var list = el("div", { class: "cart_list", "data-test": "cart-list" });
+    cartItems().forEach(function (item) {
+      var row = itemRow(item, 1);
+      row.querySelector(".item_pricebar").appendChild(cartButton(item));
+      row.querySelector("button").addEventListener("click", function () { row.remove(); });
+      list.appendChild(row);
+    });
+    root.appendChild(header("Your Cart"));
+    root.appendChild(el("div", { id: "cart_contents_container" }, [
+      list,
+      el("button", { id: "continue-shopping", "data-test": "continue-shopping", class: "btn btn_secondary back",
+        text: "Continue Shopping", onclick: function () { go("/inventory.html"); } }),
+      el("button", { id: "checkout", "data-test": "checkout", class: "btn btn_action checkout_button",
+        text: "Checkout", onclick: function () { go("/checkout-step-one.html"); } }),
+    ]));
+  }
+
+  function stepOnePage() {
+    var fields = ["firstName", "lastName", "postalCode"].map(function (name) {
+      return el("input", { id: name.replace(/[A-Z]/g, function (c) { return "-" + c.toLowerCase(); }),
+        "data-test": name, name: name, type: "text" });
+    });
+    var errorSlot = el("div", { class: "error-slot" });
+
+    function showError(message) {
+      errorSlot.innerHTML = "";
+      if (message) errorSlot.appendChild(errorBanner(message, function () { showError(null); }));
+    }
+
+    var form = el("form", {}, [
+      el("div", { class: "checkout_info" }, fields),
+      errorSlot,
+      el("button", { id: "cancel", "data-test": "cancel", type: "button", class: "btn btn_secondary cart_cancel_link",
+        text: "Cancel", onclick: function () { go("/cart.html"); } }),
+      el("input", { id: "continue", "data-test": "continue", type: "submit", class: "submit-button btn btn_primary cart_button", value: "Continue" }),
+    ]);
+    form.addEventListener("submit", function (e) {
+      e.preventDefault();
+      var labels = ["First Name", "Last Name", "Postal Code"];
+      for (var i = 0; i < fields.length; i++) {
+        if (!fields[i].value) return showError("Error: " + labels[i] + " is required");
+      }
+      go("/checkout-step-two.html");
+    });
+
+    root.appendChild(header("Checkout: Your Information"));
+    root.appendChild(el("div", { id: "checkout_info_container" }, [form]));
+  }
+
+  function stepTwoPage() {
+    var items = cartItems();
+    var subtotal = items.reduce(function (sum, item) { return sum + item.price; }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    var total = Math.round((subtotal + tax) * 100) / 100;
+
+    root.appendChild(header("Checkout: Overview"));
+    root.appendChild(el("div", { id: "checkout_summary_container" }, [
+      el("div", { class: "cart_list" }, items.map(function (item) { return itemRow(item, 1); })),
+      el("div", { class: "summary_info" }, [
+        el("div", { class: "summary_info_label", text: "Payment Information:" }),
+        el("div", { class: "summary_value_label", "data-test": "payment-info-value", text: "SauceCard #31337" }),
+        el("div", { class: "summary_info_label", text: "Shipping Information:" }),
+        el("div", { class: "summary_value_label", "data-test": "shipping-info-value", text: "Free Pony Express Delivery!" }),
+        el("div", { class: "summary_subtotal_label", "data-test": "subtotal-label", text: "Item total: " + price(subtotal) }),
+        el("div", { class: "summary_tax_label", "data-test": "tax-label", text: "Tax: " + price(tax) }),
+        el("div", { class: "summary_total_label", "data-test": "total-label", text: "Total: " + price(total) }),
+        el("button", { id: "cancel", "data-test": "cancel", class: "btn btn_secondary cart_cancel_link",
+          text: "Cancel", onclick: function () { go("/inventory.html"); } }),
+        el("button", { id: "finish", "data-test": "finish", class: "btn btn_action cart_button",
+          text: "Finish", onclick: function () { saveCart([]); go("/checkout-complete.html"); } }),
+      ]),
+    ]));
+  }
+
+  function completePage() {
+    root.appendChild(header("Checkout: Complete!"));
+    root.appendChild(el("div", { id: "checkout_complete_container", class: "checkout_complete_container" }, [
+      el("img", { class: "pony_express", alt: "Pony Express", src: "/static/media/pony-express.png" }),
+      el("h2", { class: "complete-header", "data-test": "complete-header", text: "Thank you for your order!" }),
+      el("div", { class: "complete-text", "data-test": "complete-text",
+        text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!" }),
+      el("button", { id: "back-to-products", "data-test": "back-to-products", class: "btn btn_primary btn_small",
+        text: "Back Home", onclick: function () { go("/inventory.html"); } }),
+    ]));
+  }
+
+  // -------------------------------------------------------------------------
+  // Routing
+  // -------------------------------------------------------------------------
+
+  var PAGES = {
+    "/inventory.html": inventoryPage,
+    "/inventory-item.html": detailsPage,
+    "/cart.html": cartPage,
+    "/checkout-step-one.html": stepOnePage,
+    "/checkout-step-two.html": stepTwoPage,
+    "/checkout-complete.html": completePage,
+  };
+
+  var path = window.location.pathname;
+  var render = PAGES[path];
+  if (!render) {
+    loginPage();
+  } else if (currentUser() === null) {
+    history.replaceState(null, "", "/");
+    loginPage("Epic sadface: You can only access '" + path + "' when you are logged in.");
+  } else {
+    render();
+    renderBadge();
+  }
+})();
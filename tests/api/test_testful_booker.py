@@ -9,21 +9,30 @@ API Docs: https://restful-booker.herokuapp.com/apidoc/index.html
 
 These tests demonstrate:
   - Session-scoped auth token management (avoids re-auth on every test)
+  - One pooled keep-alive client (clients.BookerClient) for every request
+  - Concurrent bulk provisioning of test data (clients.AsyncBookerClient)
+  - Deferred, batched cleanup of test data (booker_cleanup in conftest.py)
   - Full CRUD lifecycle testing
   - Response schema validation without external libraries
   - Parameterized negative/validation testing
   - Clear separation of API interaction from assertions
 
-Note: In a production project, base_url and credentials would come from
-environment variables or a secrets manager, not be hardcoded.
+The target instance comes from the booker_url fixture in conftest.py: the
+public host by default, --booker-url for another instance, or
+--local-booker for the in-process stand-in in stubs/booker.
+
+Note: In a production project, credentials would come from environment
+variables or a secrets manager, not be hardcoded.
 """
 
+import uuid
+
 import pytest
-import requests
 
+from clients import BookerClient, run_bulk
 
-BASE_URL = "https://restful-booker.herokuapp.com"
 AUTH_CREDENTIALS = {"username": "admin", "password": "password123"}
+BATCH_SIZE = 20
 
 
 # ---------------------------------------------------------------------------
@@ -32,7 +41,7 @@ AUTH_CREDENTIALS = {"username": "admin", "password": "password123"}
 
 
 @pytest.fixture(scope="session")
-def auth_token() -> str:
+def auth_token(booker_client: BookerClient) -> str:
     """
     Obtain and cache an auth token for the test session.
 
@@ -40,32 +49,38 @@ def auth_token() -> str:
     tests run. In a CI environment this avoids hammering the auth endpoint
     and keeps runs fast.
     """
-    response = requests.post(f"{BASE_URL}/auth", json=AUTH_CREDENTIALS)
-    assert response.status_code == 200, (
-        f"Auth failed with status {response.status_code}: {response.text}"
-    )
+    response = booker_client.auth(**AUTH_CREDENTIALS)
+    assert (
+        response.status_code == 200
+    ), f"Auth failed with status {response.status_code}: {response.text}"
     token = response.json().get("token")
     assert token, "Auth response did not include a token"
     return token
 
 
-@pytest.fixture(scope="session")
-def auth_headers(auth_token: str) -> dict:
-    """Return standard headers with auth cookie for mutating requests."""
-    return {
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-        "Cookie": f"token={auth_token}",
-    }
+@pytest.fixture
+def track_booking(booker_cleanup, auth_token: str):
+    """
+    Return a function that marks a booking ID for deletion after the test.
+
+    The IDs are handed to the session's booker_cleanup queue in this
+    fixture's teardown - not when they are tracked, or the queue's
+    background flush could delete a booking the test is still using.
+    Deletion then happens in the background, so it never blocks a test's
+    teardown, and no test data accumulates on the shared API.
+    """
+    tracked = []
+    yield tracked.append
+    for booking_id in tracked:
+        booker_cleanup.add((booking_id, auth_token))
 
 
 @pytest.fixture
-def created_booking(auth_headers: dict) -> dict:
+def created_booking(booker_client: BookerClient, track_booking) -> dict:
     """
-    Create a booking and yield its ID + data for use in a test.
+    Create a booking and return its ID + data for use in a test.
 
-    Cleans up (deletes) the booking after the test completes, ensuring
-    test isolation and avoiding data accumulation on the shared API.
+    The booking is deleted after the test via track_booking.
     """
     payload = {
         "firstname": "Test",
@@ -75,21 +90,61 @@ def created_booking(auth_headers: dict) -> dict:
         "bookingdates": {"checkin": "2026-06-01", "checkout": "2026-06-07"},
         "additionalneeds": "Breakfast",
     }
-    response = requests.post(
-        f"{BASE_URL}/booking",
-        json=payload,
-        headers={"Content-Type": "application/json", "Accept": "application/json"},
-    )
+    response = booker_client.create_booking(payload)
     assert response.status_code == 200
     booking = response.json()
+    track_booking(booking["bookingid"])
 
-    yield {"id": booking["bookingid"], "data": payload}
+    return {"id": booking["bookingid"], "data": payload}
 
-    # Teardown: remove the booking so we don't leave test data behind
-    requests.delete(
-        f"{BASE_URL}/booking/{booking['bookingid']}",
-        headers=auth_headers,
-    )
+
+@pytest.fixture
+def provision_bookings(booker_url: str, track_booking):
+    """
+    Return a function that creates a list of bookings concurrently.
+
+    All requests go out at once through AsyncBookerClient, so a batch costs
+    roughly one round trip instead of one per booking. Everything created is
+    deleted after the test via track_booking.
+    """
+
+    def provision(payloads: list[dict]) -> list[int]:
+        responses = run_bulk(booker_url, lambda c: c.create_bookings(payloads))
+        ids = [r.json()["bookingid"] for r in responses if r.status_code == 200]
+        for booking_id in ids:
+            track_booking(booking_id)
+        assert len(ids) == len(
+            payloads
+        ), f"Only {len(ids)} of {len(payloads)} bookings were created"
+        return ids
+
+    return provision
+
+
+@pytest.fixture
+def booking_batch(provision_bookings) -> dict:
+    """
+    Pre-provision BATCH_SIZE bookings that share a unique last name.
+
+    Yields the last name, the booking IDs and the submitted payloads (in the
+    same order), so tests can look the whole batch up with one filter.
+    """
+    lastname = f"Batch{uuid.uuid4().hex[:8]}"
+    payloads = [
+        {
+            "firstname": f"Guest{i}",
+            "lastname": lastname,
+            "totalprice": 100 + i,
+            "depositpaid": i % 2 == 0,
+            "bookingdates": {"checkin": "2026-10-01", "checkout": "2026-10-05"},
+        }
+        for i in range(BATCH_SIZE)
+    ]
+    return {
+        "lastname": lastname,
+        "ids": provision_bookings(payloads),
+        "data": payloads,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -100,21 +155,20 @@ def created_booking(auth_headers: dict) -> dict:
 class TestAuthentication:
     """Verify the auth endpoint behavior for valid and invalid credentials."""
 
-    def test_auth_returns_token_for_valid_credentials(self):
+    def test_auth_returns_token_for_valid_credentials(
+        self, booker_client: BookerClient
+    ):
         """Valid credentials should return a non-empty token."""
-        response = requests.post(f"{BASE_URL}/auth", json=AUTH_CREDENTIALS)
+        response = booker_client.auth(**AUTH_CREDENTIALS)
 
         assert response.status_code == 200
         body = response.json()
         assert "token" in body, "Response body missing 'token' key"
         assert len(body["token"]) > 0, "Token should not be empty"
 
-    def test_auth_fails_with_invalid_credentials(self):
+    def test_auth_fails_with_invalid_credentials(self, booker_client: BookerClient):
         """Invalid credentials should return an error reason, not a token."""
-        response = requests.post(
-            f"{BASE_URL}/auth",
-            json={"username": "wrong", "password": "wrong"},
-        )
+        response = booker_client.auth(username="wrong", password="wrong")
 
         assert response.status_code == 200  # API returns 200 with error body
         body = response.json()
@@ -130,37 +184,36 @@ class TestAuthentication:
 class TestGetBookings:
     """Tests for retrieving booking data."""
 
-    def test_get_all_bookings_returns_list(self):
+    def test_get_all_bookings_returns_list(self, booker_client: BookerClient):
         """Booking list endpoint should return a non-empty array of IDs."""
-        response = requests.get(f"{BASE_URL}/booking")
+        response = booker_client.get_booking_ids()
 
         assert response.status_code == 200
         bookings = response.json()
         assert isinstance(bookings, list), "Expected a list of bookings"
         assert len(bookings) > 0, "Expected at least one booking to exist"
 
-    def test_get_all_bookings_response_schema(self):
+    def test_get_all_bookings_response_schema(self, booker_client: BookerClient):
         """Each item in the booking list should have a bookingid field."""
-        response = requests.get(f"{BASE_URL}/booking")
+        response = booker_client.get_booking_ids()
         bookings = response.json()
 
         for booking in bookings[:5]:  # Spot-check first 5 to keep it fast
-            assert "bookingid" in booking, (
-                f"Booking missing 'bookingid' field: {booking}"
-            )
-            assert isinstance(booking["bookingid"], int), (
-                f"bookingid should be an int, got: {type(booking['bookingid'])}"
-            )
-
-    def test_get_booking_by_id_returns_correct_data(self, created_booking: dict):
+            assert (
+                "bookingid" in booking
+            ), f"Booking missing 'bookingid' field: {booking}"
+            assert isinstance(
+                booking["bookingid"], int
+            ), f"bookingid should be an int, got: {type(booking['bookingid'])}"
+
+    def test_get_booking_by_id_returns_correct_data(
+        self, booker_client: BookerClient, created_booking: dict
+    ):
         """Fetching a specific booking by ID should return its exact data."""
         booking_id = created_booking["id"]
         expected = created_booking["data"]
 
-        response = requests.get(
-            f"{BASE_URL}/booking/{booking_id}",
-            headers={"Accept": "application/json"},
-        )
+        response = booker_client.get_booking(booking_id)
 
         assert response.status_code == 200
         body = response.json()
@@ -172,12 +225,9 @@ class TestGetBookings:
         assert body["bookingdates"]["checkin"] == expected["bookingdates"]["checkin"]
         assert body["bookingdates"]["checkout"] == expected["bookingdates"]["checkout"]
 
-    def test_get_nonexistent_booking_returns_404(self):
+    def test_get_nonexistent_booking_returns_404(self, booker_client: BookerClient):
         """Requesting a booking ID that doesn't exist should return 404."""
-        response = requests.get(
-            f"{BASE_URL}/booking/999999999",
-            headers={"Accept": "application/json"},
-        )
+        response = booker_client.get_booking(999999999)
         assert response.status_code == 404
 
     @pytest.mark.parametrize(
@@ -192,7 +242,11 @@ class TestGetBookings:
         ],
     )
     def test_get_bookings_with_filter(
-        self, created_booking: dict, filter_params: dict, description: str
+        self,
+        booker_client: BookerClient,
+        created_booking: dict,
+        filter_params: dict,
+        description: str,
     ):
         """
         Verify each filter parameter correctly narrows booking results.
@@ -200,13 +254,13 @@ class TestGetBookings:
         The created_booking fixture ensures at least one matching record exists,
         so we can assert the filtered list is non-empty.
         """
-        response = requests.get(f"{BASE_URL}/booking", params=filter_params)
+        response = booker_client.get_booking_ids(**filter_params)
 
         assert response.status_code == 200, f"Filter by {description} failed"
         results = response.json()
-        assert len(results) > 0, (
-            f"Filter by {description} returned no results — expected at least one match"
-        )
+        assert (
+            len(results) > 0
+        ), f"Filter by {description} returned no results — expected at least one match"
 
 
 # ---------------------------------------------------------------------------
@@ -217,7 +271,9 @@ class TestGetBookings:
 class TestCreateBooking:
     """Tests for the booking creation endpoint."""
 
-    def test_create_booking_returns_201_or_200(self):
+    def test_create_booking_returns_201_or_200(
+        self, booker_client: BookerClient, track_booking
+    ):
         """
         Creating a valid booking should succeed.
 
@@ -231,18 +287,17 @@ class TestCreateBooking:
             "depositpaid": False,
             "bookingdates": {"checkin": "2026-07-01", "checkout": "2026-07-05"},
         }
-        response = requests.post(
-            f"{BASE_URL}/booking",
-            json=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-        )
+        response = booker_client.create_booking(payload)
 
         assert response.status_code in (200, 201)
         body = response.json()
         assert "bookingid" in body
         assert isinstance(body["bookingid"], int)
+        track_booking(body["bookingid"])
 
-    def test_create_booking_response_includes_submitted_data(self):
+    def test_create_booking_response_includes_submitted_data(
+        self, booker_client: BookerClient, track_booking
+    ):
         """The creation response should echo back the submitted booking data."""
         payload = {
             "firstname": "Echo",
@@ -252,14 +307,11 @@ class TestCreateBooking:
             "bookingdates": {"checkin": "2026-08-01", "checkout": "2026-08-03"},
             "additionalneeds": "Late checkout",
         }
-        response = requests.post(
-            f"{BASE_URL}/booking",
-            json=payload,
-            headers={"Content-Type": "application/json", "Accept": "application/json"},
-        )
+        response = booker_client.create_booking(payload)
 
         assert response.status_code in (200, 201)
         body = response.json()
+        track_booking(body["bookingid"])
         booking = body["booking"]
 
         assert booking["firstname"] == payload["firstname"]
@@ -277,7 +329,7 @@ class TestUpdateBooking:
     """Tests for full and partial booking updates."""
 
     def test_full_update_replaces_booking_data(
-        self, created_booking: dict, auth_headers: dict
+        self, booker_client: BookerClient, created_booking: dict, auth_token: str
     ):
         """PUT should replace all booking fields with the new payload."""
         booking_id = created_booking["id"]
@@ -290,10 +342,8 @@ class TestUpdateBooking:
             "additionalneeds": "None",
         }
 
-        response = requests.put(
-            f"{BASE_URL}/booking/{booking_id}",
-            json=updated_payload,
-            headers=auth_headers,
+        response = booker_client.update_booking(
+            booking_id, updated_payload, token=auth_token
         )
 
         assert response.status_code == 200
@@ -303,7 +353,7 @@ class TestUpdateBooking:
         assert body["depositpaid"] is False
 
     def test_partial_update_changes_only_specified_fields(
-        self, created_booking: dict, auth_headers: dict
+        self, booker_client: BookerClient, created_booking: dict, auth_token: str
     ):
         """PATCH should update only the provided fields, leaving others intact."""
         booking_id = created_booking["id"]
@@ -311,10 +361,8 @@ class TestUpdateBooking:
 
         patch_payload = {"firstname": "PatchedFirst"}
 
-        response = requests.patch(
-            f"{BASE_URL}/booking/{booking_id}",
-            json=patch_payload,
-            headers=auth_headers,
+        response = booker_client.partial_update_booking(
+            booking_id, patch_payload, token=auth_token
         )
 
         assert response.status_code == 200
@@ -323,7 +371,9 @@ class TestUpdateBooking:
         # Last name should be unchanged
         assert body["lastname"] == original_lastname
 
-    def test_update_without_auth_is_rejected(self, created_booking: dict):
+    def test_update_without_auth_is_rejected(
+        self, booker_client: BookerClient, created_booking: dict
+    ):
         """PUT without an auth token should be rejected with 403."""
         booking_id = created_booking["id"]
         payload = {
@@ -334,11 +384,7 @@ class TestUpdateBooking:
             "bookingdates": {"checkin": "2026-01-01", "checkout": "2026-01-02"},
         }
 
-        response = requests.put(
-            f"{BASE_URL}/booking/{booking_id}",
-            json=payload,
-            headers={"Content-Type": "application/json"},  # No auth cookie
-        )
+        response = booker_client.update_booking(booking_id, payload)  # No token
 
         assert response.status_code == 403
 
@@ -351,7 +397,9 @@ class TestUpdateBooking:
 class TestDeleteBooking:
     """Tests for the booking deletion endpoint."""
 
-    def test_delete_booking_succeeds_with_auth(self, auth_headers: dict):
+    def test_delete_booking_succeeds_with_auth(
+        self, booker_client: BookerClient, auth_token: str
+    ):
         """
         An authenticated DELETE should remove the booking successfully.
 
@@ -366,27 +414,52 @@ class TestDeleteBooking:
             "depositpaid": False,
             "bookingdates": {"checkin": "2026-01-01", "checkout": "2026-01-02"},
         }
-        create_resp = requests.post(
-            f"{BASE_URL}/booking",
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
+        create_resp = booker_client.create_booking(payload)
         booking_id = create_resp.json()["bookingid"]
 
-        delete_resp = requests.delete(
-            f"{BASE_URL}/booking/{booking_id}",
-            headers=auth_headers,
-        )
+        delete_resp = booker_client.delete_booking(booking_id, token=auth_token)
 
         assert delete_resp.status_code in (200, 201, 204)
 
         # Verify it's gone
-        get_resp = requests.get(f"{BASE_URL}/booking/{booking_id}")
+        get_resp = booker_client.get_booking(booking_id)
         assert get_resp.status_code == 404
 
-    def test_delete_without_auth_is_rejected(self, created_booking: dict):
+    def test_delete_without_auth_is_rejected(
+        self, booker_client: BookerClient, created_booking: dict
+    ):
         """Unauthenticated DELETE should be rejected with 403."""
         booking_id = created_booking["id"]
 
-        response = requests.delete(f"{BASE_URL}/booking/{booking_id}")
-        assert response.status_code == 403
\ No newline at end of file
+        response = booker_client.delete_booking(booking_id)
+        assert response.status_code == 403
+
+
+# ---------------------------------------------------------------------------
+# Bulk Tests
+# ---------------------------------------------------------------------------
+
+
+class TestBookingBatches:
+    """Tests that need many bookings, provisioned concurrently."""
+
+    def test_lastname_filter_returns_whole_batch(
+        self, booker_client: BookerClient, booking_batch: dict
+    ):
+        """Filtering by the batch's last name should return exactly its IDs."""
+        response = booker_client.get_booking_ids(lastname=booking_batch["lastname"])
+
+        assert response.status_code == 200
+        found = {booking["bookingid"] for booking in response.json()}
+        assert found == set(booking_batch["ids"])
+
+    def test_every_batch_booking_is_readable(
+        self, booker_url: str, booking_batch: dict
+    ):
+        """Each provisioned booking should be readable with its own data."""
+        responses = run_bulk(booker_url, lambda c: c.get_bookings(booking_batch["ids"]))
+
+        for response, expected in zip(responses, booking_batch["data"]):
+            assert response.status_code == 200
+            assert response.json()["firstname"] == expected["firstname"]
+            assert response.json()["totalprice"] == expected["totalprice"]
@@ -5,9 +5,10 @@ Tests cover the complete purchase workflow from cart through order confirmation,
 including input validation, error handling, and price verification.
 
 Fixture dependency chain:
-    page → authenticated_page → cart_with_items
+    auth_state_cache → context → page → cart_with_items
 
-The cart_with_items fixture (defined in conftest.py) pre-loads two items:
+The cart_with_items fixture (defined in conftest.py) starts each test on
+cart.html, logged in, with two items seeded into the cart:
   - Sauce Labs Backpack  ($29.99)
   - Sauce Labs Bike Light ($9.99)
   Subtotal: $39.98, Tax: $3.20, Total: $43.18
@@ -22,42 +23,50 @@ from models import (
     CheckoutStepOnePage,
     CheckoutStepTwoPage,
 )
-
+from utils import CART_STORAGE_KEY, DataRegistry, cart_item_ids
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Paths are resolved against the configured base_url by expect().to_have_url
 EXPECTED_URLS = {
-    "cart": "https://www.saucedemo.com/cart.html",
-    "step_one": "https://www.saucedemo.com/checkout-step-one.html",
-    "step_two": "https://www.saucedemo.com/checkout-step-two.html",
-    "complete": "https://www.saucedemo.com/checkout-complete.html",
-    "inventory": "https://www.saucedemo.com/inventory.html",
+    "cart": "/cart.html",
+    "step_one": "/checkout-step-one.html",
+    "step_two": "/checkout-step-two.html",
+    "complete": "/checkout-complete.html",
+    "inventory": "/inventory.html",
 }
 
 
-def do_checkout(page: Page, test_data: dict) -> CheckoutStepTwoPage:
+def do_checkout(page: Page, test_data: DataRegistry) -> CheckoutStepTwoPage:
     """
-    Helper: navigate from a cart-loaded page through step one to the overview.
+    Helper: go from a page on cart.html through step one to the overview.
 
     Returns the CheckoutStepTwoPage so individual tests can assert on it
     or call finish_order() without repeating the setup steps.
     """
-    customer = test_data["checkout"]["valid_customer"]
+    customer = test_data.customers.valid_customer
 
     cart_page = CartPage(page)
-    cart_page.navigate()
     step_one: CheckoutStepOnePage = cart_page.proceed_to_checkout()
 
     step_two: CheckoutStepTwoPage = step_one.submit_form(
-        first_name=customer["first_name"],
-        last_name=customer["last_name"],
-        postal_code=customer["postal_code"],
+        first_name=customer.first_name,
+        last_name=customer.last_name,
+        postal_code=customer.postal_code,
     )
     return step_two
 
 
+def seed_cart(page: Page, item_ids: list[int]):
+    """Helper: replace the cart of a logged-in page with the given items."""
+    page.evaluate(
+        "([key, ids]) => localStorage.setItem(key, JSON.stringify(ids))",
+        [CART_STORAGE_KEY, item_ids],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Happy path — full flow
 # ---------------------------------------------------------------------------
@@ -66,7 +75,7 @@ def do_checkout(page: Page, test_data: dict) -> CheckoutStepTwoPage:
 @pytest.mark.smoke
 @pytest.mark.critical
 @pytest.mark.checkout
-def test_checkout_complete_happy_path(cart_with_items: Page, test_data: dict):
+def test_checkout_complete_happy_path(cart_with_items: Page, test_data: DataRegistry):
     """
     Verify a user can complete a full purchase from cart to confirmation.
 
@@ -87,7 +96,7 @@ def test_checkout_complete_happy_path(cart_with_items: Page, test_data: dict):
 
 @pytest.mark.checkout
 def test_checkout_confirmation_back_home_clears_cart(
-    cart_with_items: Page, test_data: dict
+    cart_with_items: Page, test_data: DataRegistry
 ):
     """
     Verify Back Home after checkout lands on inventory with an empty cart.
@@ -102,9 +111,9 @@ def test_checkout_confirmation_back_home_clears_cart(
     inventory: InventoryPage = complete.back_to_home()
 
     expect(cart_with_items).to_have_url(EXPECTED_URLS["inventory"])
-    assert not inventory.is_cart_badge_visible(), (
-        "Cart badge should not be visible after a completed purchase"
-    )
+    assert (
+        not inventory.is_cart_badge_visible()
+    ), "Cart badge should not be visible after a completed purchase"
 
 
 # ---------------------------------------------------------------------------
@@ -114,7 +123,7 @@ def test_checkout_confirmation_back_home_clears_cart(
 
 @pytest.mark.checkout
 def test_checkout_overview_contains_correct_items(
-    cart_with_items: Page, test_data: dict
+    cart_with_items: Page, test_data: DataRegistry
 ):
     """
     Verify the order overview reflects the items added in cart_with_items.
@@ -122,18 +131,18 @@ def test_checkout_overview_contains_correct_items(
     cart_with_items adds Sauce Labs Backpack and Sauce Labs Bike Light.
     Both should appear in the step-two item list.
     """
-    expected_items = test_data["checkout"]["expected_cart_items"]
+    expected_items = test_data.expected.cart_items
     step_two = do_checkout(cart_with_items, test_data)
 
     overview_items = step_two.get_item_names()
     for expected in expected_items:
-        assert expected in overview_items, (
-            f"Expected '{expected}' in order overview, got: {overview_items}"
-        )
+        assert (
+            expected in overview_items
+        ), f"Expected '{expected}' in order overview, got: {overview_items}"
 
 
 @pytest.mark.checkout
-def test_checkout_total_includes_tax(cart_with_items: Page, test_data: dict):
+def test_checkout_total_includes_tax(cart_with_items: Page, test_data: DataRegistry):
     """
     Verify the displayed total equals subtotal + tax.
 
@@ -150,14 +159,14 @@ def test_checkout_total_includes_tax(cart_with_items: Page, test_data: dict):
     assert subtotal > 0, "Subtotal should be a positive value"
     assert tax > 0, "Tax should be a positive value"
     assert total > 0, "Total should be a positive value"
-    assert step_two.verify_calculations(), (
-        f"Total ${total} should equal subtotal ${subtotal} + tax ${tax}"
-    )
+    assert (
+        step_two.verify_calculations()
+    ), f"Total ${total} should equal subtotal ${subtotal} + tax ${tax}"
 
 
 @pytest.mark.checkout
 def test_checkout_payment_and_shipping_info_displayed(
-    cart_with_items: Page, test_data: dict
+    cart_with_items: Page, test_data: DataRegistry
 ):
     """
     Verify the payment and shipping info labels are populated on step two.
@@ -165,15 +174,15 @@ def test_checkout_payment_and_shipping_info_displayed(
     These come from expected_data.json so the assertion is data-driven
     and will catch changes to the display values.
     """
-    expected = test_data["expected"]["checkout"]
+    expected = test_data.expected.checkout
     step_two = do_checkout(cart_with_items, test_data)
 
-    assert step_two.get_payment_info() == expected["payment_info"], (
-        f"Payment info mismatch: got '{step_two.get_payment_info()}'"
-    )
-    assert step_two.get_shipping_info() == expected["shipping_info"], (
-        f"Shipping info mismatch: got '{step_two.get_shipping_info()}'"
-    )
+    assert (
+        step_two.get_payment_info() == expected.payment_info
+    ), f"Payment info mismatch: got '{step_two.get_payment_info()}'"
+    assert (
+        step_two.get_shipping_info() == expected.shipping_info
+    ), f"Shipping info mismatch: got '{step_two.get_shipping_info()}'"
 
 
 # ---------------------------------------------------------------------------
@@ -190,20 +199,19 @@ def test_cancel_from_step_one_returns_to_cart(cart_with_items: Page):
     Items should be preserved — cart state must survive an abandoned checkout.
     """
     cart_page = CartPage(cart_with_items)
-    cart_page.navigate()
     step_one: CheckoutStepOnePage = cart_page.proceed_to_checkout()
 
     returned_cart: CartPage = step_one.cancel_checkout()
 
     expect(cart_with_items).to_have_url(EXPECTED_URLS["cart"])
-    assert returned_cart.get_item_count() > 0, (
-        "Cart should still contain items after cancelling from step one"
-    )
+    assert (
+        returned_cart.get_item_count() > 0
+    ), "Cart should still contain items after cancelling from step one"
 
 
 @pytest.mark.checkout
 def test_cancel_from_step_two_returns_to_inventory(
-    cart_with_items: Page, test_data: dict
+    cart_with_items: Page, test_data: DataRegistry
 ):
     """
     Verify Cancel on step two returns to the inventory page.
@@ -252,7 +260,6 @@ def test_checkout_form_validation(
     keeping this test resilient to minor DOM changes.
     """
     cart_page = CartPage(cart_with_items)
-    cart_page.navigate()
     step_one: CheckoutStepOnePage = cart_page.proceed_to_checkout()
 
     # submit_form returns None when a validation error is shown
@@ -279,21 +286,20 @@ def test_checkout_form_error_can_be_dismissed(cart_with_items: Page):
     a page reload, allowing the user to correct and resubmit.
     """
     cart_page = CartPage(cart_with_items)
-    cart_page.navigate()
     step_one: CheckoutStepOnePage = cart_page.proceed_to_checkout()
 
     step_one.submit_form("", "", "")
     assert step_one.has_error(), "Error banner should be visible after empty submit"
 
     step_one.clear_error()
-    assert not step_one.has_error(), (
-        "Error banner should be hidden after clicking the dismiss button"
-    )
+    assert (
+        not step_one.has_error()
+    ), "Error banner should be hidden after clicking the dismiss button"
 
 
 @pytest.mark.checkout
 def test_checkout_accepts_special_characters_in_name(
-    cart_with_items: Page, test_data: dict
+    cart_with_items: Page, test_data: DataRegistry
 ):
     """
     Verify the form accepts international characters and apostrophes.
@@ -303,19 +309,64 @@ def test_checkout_accepts_special_characters_in_name(
     triggering a validation error — we don't assert on display since
     we don't control the app's rendering of those characters.
     """
-    special = test_data["checkout"]["special_characters"]
+    special = test_data.customers.special_characters
 
     cart_page = CartPage(cart_with_items)
-    cart_page.navigate()
     step_one: CheckoutStepOnePage = cart_page.proceed_to_checkout()
 
     step_two = step_one.submit_form(
-        first_name=special["first_name"],
-        last_name=special["last_name"],
-        postal_code=special["postal_code"],
+        first_name=special.first_name,
+        last_name=special.last_name,
+        postal_code=special.postal_code,
     )
 
-    assert step_two is not None, (
-        "Special characters in name fields should not trigger a validation error"
-    )
-    expect(cart_with_items).to_have_url(EXPECTED_URLS["step_two"])
\ No newline at end of file
+    assert (
+        step_two is not None
+    ), "Special characters in name fields should not trigger a validation error"
+    expect(cart_with_items).to_have_url(EXPECTED_URLS["step_two"])
+
+
+# ---------------------------------------------------------------------------
+# Generated inputs
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.checkout
+def test_checkout_generated_cases(
+    authenticated_page: Page, checkout_cases, test_data: DataRegistry
+):
+    """
+    Run generated customers and carts through checkout step one.
+
+    Cases come from the seeded generator behind checkout_cases
+    (--checkout-cases, --checkout-seed): empty fields must show the error
+    of the first empty field, anything else must reach the overview with
+    the generated cart. Several cases per test share the login and
+    replace the cart before each one.
+    """
+    page = authenticated_page
+    for case in checkout_cases:
+        seed_cart(page, cart_item_ids(test_data.products, case.cart))
+        step_one: CheckoutStepOnePage = CartPage(page).navigate().proceed_to_checkout()
+        customer = case.customer
+        step_two = step_one.submit_form(
+            customer.first_name, customer.last_name, customer.postal_code
+        )
+
+        if case.error is not None:
+            assert step_two is None, f"{case.id}: {customer} should be rejected"
+            assert (
+                step_one.get_error_text() == test_data.expected.errors[case.error]
+            ), f"{case.id}: wrong error for {customer}"
+            continue
+
+        assert (
+            step_two is not None
+        ), f"{case.id}: {customer} rejected with '{step_one.get_error_text()}'"
+        products = [test_data.products[key] for key in case.cart]
+        assert sorted(step_two.get_item_names()) == sorted(
+            product.name for product in products
+        ), f"{case.id}: overview items differ from the cart {case.cart}"
+        assert step_two.get_subtotal() == pytest.approx(
+            sum(product.price for product in products)
+        ), f"{case.id}: subtotal differs from the cart {case.cart}"
@@ -30,17 +30,17 @@ def test_happy_path_complete_purchase(page: Page, test_data):
         - Back to home button is available
     """
     # Get URLs from expected data
-    urls = test_data["expected"]["urls"]
+    urls = test_data.expected.urls
 
     # Step 1: Login as standard_user
-    user = test_data["users"]["standard_user"]
-    page.goto(urls["login"])
+    user = test_data.users.standard_user
+    page.goto(urls.login)
 
     login_page = LoginPage(page)
-    inventory_page = login_page.login(user["username"], user["password"])
+    inventory_page = login_page.login(user.username, user.password)
 
     # Verify we're on inventory page
-    expect(page).to_have_url(urls["inventory"])
+    expect(page).to_have_url(urls.inventory)
     assert inventory_page.is_loaded(), "Inventory page should be loaded"
 
     # Step 2: Add Sauce Labs Backpack to cart
@@ -51,7 +51,7 @@ def test_happy_path_complete_purchase(page: Page, test_data):
 
     # Step 3: Click on cart and verify the correct item is listed
     cart_page = inventory_page.click_cart()
-    expect(page).to_have_url(urls["cart"])
+    expect(page).to_have_url(urls.cart)
     assert cart_page.is_loaded(), "Cart page should be loaded"
 
     # Verify cart contains the correct item
@@ -66,36 +66,35 @@ def test_happy_path_complete_purchase(page: Page, test_data):
     # Verify item details
     item_details = cart_page.get_item_details(0)
     assert (
-        item_details["name"] == test_data["products"]["sauce_labs_backpack"]["name"]
+        item_details["name"] == test_data.products.sauce_labs_backpack.name
     ), "Item name should be Sauce Labs Backpack"
     assert (
-        str(test_data["products"]["sauce_labs_backpack"]["price"])
-        in item_details["price"]
+        str(test_data.products.sauce_labs_backpack.price) in item_details["price"]
     ), "Item price should be $29.99"
     assert (
         item_details["description"]
-        == test_data["products"]["sauce_labs_backpack"]["description"]
+        == test_data.products.sauce_labs_backpack.description
     ), "Item should have a description"
 
     # Step 4: Click checkout
     checkout_step_one = cart_page.proceed_to_checkout()
-    expect(page).to_have_url(urls["checkout_step_one"])
+    expect(page).to_have_url(urls.checkout_step_one)
     assert checkout_step_one.is_loaded(), "Checkout step 1 page should be loaded"
 
     # Step 5: Fill customer information from test data
-    customer = test_data["checkout"]["valid_customer"]
+    customer = test_data.customers.valid_customer
     checkout_step_two = checkout_step_one.submit_form(
-        customer["first_name"], customer["last_name"], customer["postal_code"]
+        customer.first_name, customer.last_name, customer.postal_code
     )
 
-    expect(page).to_have_url(urls["checkout_step_two"])
+    expect(page).to_have_url(urls.checkout_step_two)
     assert checkout_step_two.is_loaded(), "Checkout step 2 page should be loaded"
 
     # Step 6: Verify checkout overview
     # Verify correct item
     order_items = checkout_step_two.get_item_names()
     assert (
-        test_data["products"]["sauce_labs_backpack"]["name"] in order_items
+        test_data.products.sauce_labs_backpack.name in order_items
     ), "Order should contain Sauce Labs Backpack"
 
     # Verify item count
@@ -107,8 +106,8 @@ def test_happy_path_complete_purchase(page: Page, test_data):
     total = checkout_step_two.get_total()
 
     # Get expected values from test data
-    tax_rate = test_data["expected"]["checkout"]["tax_rate"]
-    product_price = test_data["products"]["sauce_labs_backpack"]["price"]
+    tax_rate = test_data.expected.checkout.tax_rate
+    product_price = test_data.products.sauce_labs_backpack.price
 
     # Calculate expected subtotal from product price (1 item in cart)
     expected_subtotal = float(product_price)
@@ -132,8 +131,8 @@ def test_happy_path_complete_purchase(page: Page, test_data):
     # Verify payment and shipping info from expected data
     payment_info = checkout_step_two.get_payment_info()
     shipping_info = checkout_step_two.get_shipping_info()
-    expected_payment = test_data["expected"]["checkout"]["payment_info"]
-    expected_shipping = test_data["expected"]["checkout"]["shipping_info"]
+    expected_payment = test_data.expected.checkout.payment_info
+    expected_shipping = test_data.expected.checkout.shipping_info
 
     assert (
         payment_info == expected_payment
@@ -144,7 +143,7 @@ def test_happy_path_complete_purchase(page: Page, test_data):
 
     # Step 7: Click finish to complete order
     checkout_complete = checkout_step_two.finish_order()
-    expect(page).to_have_url(urls["checkout_complete"])
+    expect(page).to_have_url(urls.checkout_complete)
     assert checkout_complete.is_loaded(), "Checkout complete page should be loaded"
 
     # Step 8: Verify order confirmation
@@ -152,14 +151,14 @@ def test_happy_path_complete_purchase(page: Page, test_data):
 
     # Verify success header using expected data
     header_text = checkout_complete.get_header_text()
-    expected_success_header = test_data["expected"]["checkout"]["success_header"]
+    expected_success_header = test_data.expected.checkout.success_header
     assert (
         header_text == expected_success_header
     ), f"Header should be '{expected_success_header}', got: {header_text}"
 
     # Verify confirmation message using expected data
     confirmation_text = checkout_complete.get_confirmation_text()
-    expected_success_message = test_data["expected"]["checkout"]["success_message"]
+    expected_success_message = test_data.expected.checkout.success_message
     assert (
         expected_success_message in confirmation_text
     ), f"Confirmation should contain '{expected_success_message}', got: {confirmation_text}"
@@ -175,7 +174,7 @@ def test_happy_path_complete_purchase(page: Page, test_data):
 
     # Optional: Navigate back to home
     inventory_page = checkout_complete.back_to_home()
-    expect(page).to_have_url(urls["inventory"])
+    expect(page).to_have_url(urls.inventory)
 
     # Verify cart is cleared after successful purchase
     assert (
@@ -1,25 +1,17 @@
-import json
 import re
 
-import pytest
 from playwright.sync_api import Page, expect
 
 from models import LoginPage
 
 
-@pytest.fixture
-def test_users():
-    with open("test_data/users.json") as f:
-        return json.load(f)
-
-
-def test_login(page: Page, test_users):
-    user = test_users["standard_user"]
+def test_login(page: Page, test_data):
+    user = test_data.users.standard_user
     login_page = LoginPage(page)
     login_page.navigate()
 
     # Login returns the InventoryPage
-    inventory_page = login_page.login(user["username"], user["password"])
+    inventory_page = login_page.login(user.username, user.password)
 
     # Verify we're on the inventory page
     expect(page).to_have_url(re.compile(".*inventory.html"))
@@ -32,12 +24,12 @@ def test_login(page: Page, test_users):
     ), f"Expected products to be displayed, found {product_count}"
 
 
-def test_blocked_login(page: Page, test_users):
-    user = test_users["locked_out_user"]
+def test_blocked_login(page: Page, test_data):
+    user = test_data.users.locked_out_user
     login_page = LoginPage(page)
     login_page.navigate()
 
-    login_page.login(user["username"], user["password"])
+    login_page.login(user.username, user.password)
 
     # Verify error is displayed
     assert login_page.has_error(), "Expected error message to be displayed"
@@ -102,12 +94,12 @@ def test_invalid_username(page: Page):
     ), f"Expected 'not match' in error message, got: {error_text}"
 
 
-def test_invalid_password(page: Page, test_users):
-    user = test_users["standard_user"]
+def test_invalid_password(page: Page, test_data):
+    user = test_data.users.standard_user
     login_page = LoginPage(page)
     login_page.navigate()
 
-    login_page.login(user["username"], "wrong_password")
+    login_page.login(user.username, "wrong_password")
 
     assert login_page.has_error(), "Expected error message to be displayed"
     error_text = login_page.get_error_text()
@@ -116,12 +108,12 @@ def test_invalid_password(page: Page, test_users):
     ), f"Expected 'not match' in error message, got: {error_text}"
 
 
-def test_case_sensitive_username(page: Page, test_users):
-    user = test_users["standard_user"]
+def test_case_sensitive_username(page: Page, test_data):
+    user = test_data.users.standard_user
     login_page = LoginPage(page)
     login_page.navigate()
 
-    login_page.login(user["username"].upper(), user["password"])
+    login_page.login(user.username.upper(), user.password)
 
     assert login_page.has_error(), "Expected error for case-sensitive username"
     error_text = login_page.get_error_text()
@@ -0,0 +1,51 @@
+import re
+
+import pytest
+from playwright.async_api import expect
+
+from models.aio import LoginPage
+
+# Logins the app must reject, with a fragment of the error it shows
+REJECTED_LOGINS = [
+    pytest.param("locked_out_user", "secret_sauce", "locked out", id="locked_out"),
+    pytest.param("", "secret_sauce", "username", id="no_username"),
+    pytest.param("standard_user", "", "password", id="no_password"),
+    pytest.param("invalid_user", "secret_sauce", "not match", id="invalid_username"),
+    pytest.param("standard_user", "wrong_password", "not match", id="invalid_password"),
+    pytest.param("STANDARD_USER", "secret_sauce", "not match", id="case_sensitive"),
+]
+
+# Users that can log in and see the inventory
+ACCEPTED_USERS = [
+    "standard_user",
+    "problem_user",
+    "performance_glitch_user",
+    "visual_user",
+]
+
+
+@pytest.mark.login
+@pytest.mark.parametrize("user", ACCEPTED_USERS)
+async def test_login_reaches_inventory(async_page, test_data, user):
+    credentials = test_data.users[user]
+    login_page = await LoginPage(async_page).navigate()
+
+    inventory_page = await login_page.login(credentials.username, credentials.password)
+
+    await expect(async_page).to_have_url(re.compile(".*inventory.html"))
+    assert await inventory_page.is_loaded(), "Inventory page should be loaded"
+    assert await inventory_page.get_product_count() > 0, "Expected products"
+
+
+@pytest.mark.login
+@pytest.mark.parametrize("username,password,expected", REJECTED_LOGINS)
+async def test_login_is_rejected(async_page, username, password, expected):
+    login_page = await LoginPage(async_page).navigate()
+
+    await login_page.login(username, password)
+
+    assert await login_page.has_error(), "Expected error message to be displayed"
+    error_text = await login_page.get_error_text()
+    assert (
+        expected in error_text.lower()
+    ), f"Expected '{expected}' in error message, got: {error_text}"
@@ -1,59 +1,44 @@
-import json
 import re
 
 import pytest
 from playwright.sync_api import Page, expect
 
-from models import LoginPage
+from models import InventoryPage, LoginPage
 
 
-@pytest.fixture
-def test_users():
-    with open("test_data/users.json") as f:
-        return json.load(f)
-
-
-def test_successful_logout_from_inventory(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_successful_logout_from_inventory(authenticated_page: Page):
     """Test successful logout from the inventory page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
-
-    # Login
-    inventory_page = login_page.login(user["username"], user["password"])
+    page = authenticated_page
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Logout using BasePage method
     login_page = inventory_page.logout()
 
     # Verify we're back on the login page
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    expect(page).to_have_url(LoginPage.PAGE_URL)
     assert (
         login_page.username_input.is_visible()
     ), "Should be on login page after logout"
 
 
-def test_cannot_access_inventory_after_logout(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_cannot_access_inventory_after_logout(authenticated_page: Page, base_url):
     """Test that user cannot access inventory page after logout (session cleared)."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
-
-    # Login
-    inventory_page = login_page.login(user["username"], user["password"])
+    page = authenticated_page
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Logout
-    inventory_page.logout()
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    login_page = inventory_page.logout()
+    expect(page).to_have_url(LoginPage.PAGE_URL)
 
     # Try to directly navigate to inventory page
-    page.goto("https://www.saucedemo.com/inventory.html")
+    page.goto(InventoryPage.PAGE_URL)
 
     # Should be redirected back to login page or see error
-    expect(page).to_have_url(
-        re.compile(".*saucedemo.com/?$|.*saucedemo.com/inventory.html")
-    )
+    expect(page).to_have_url(re.compile(f"^{re.escape(base_url)}/(inventory\\.html)?$"))
 
     # If we're on inventory.html, verify the error message is shown
     if "inventory.html" in page.url:
@@ -68,22 +53,22 @@ def test_cannot_access_inventory_after_logout(page: Page, test_users):
         ), "Should be redirected to login page"
 
 
-def test_login_again_after_logout(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_login_again_after_logout(authenticated_page: Page, test_data):
     """Test that user can login again after logging out."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
+    user = test_data.users.standard_user
+    page = authenticated_page
 
-    # First login
-    inventory_page = login_page.login(user["username"], user["password"])
+    # First login comes from the cached session
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Logout
     login_page = inventory_page.logout()
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    expect(page).to_have_url(LoginPage.PAGE_URL)
 
     # Login again with same credentials
-    inventory_page = login_page.login(user["username"], user["password"])
+    inventory_page = login_page.login(user.username, user.password)
     expect(page).to_have_url(re.compile(".*inventory.html"))
     assert inventory_page.is_loaded(), "Should be able to login again after logout"
 
@@ -92,13 +77,10 @@ def test_login_again_after_logout(page: Page, test_users):
     assert product_count > 0, "Products should be visible after logging in again"
 
 
-def test_menu_opens_and_closes_on_inventory(page: Page, test_users):
+def test_menu_opens_and_closes_on_inventory(authenticated_page: Page):
     """Test that the hamburger menu opens and closes properly on inventory page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
-
-    inventory_page = login_page.login(user["username"], user["password"])
+    page = authenticated_page
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Menu should be closed initially
@@ -110,18 +92,13 @@ def test_menu_opens_and_closes_on_inventory(page: Page, test_users):
 
     # Close menu
     inventory_page.close_menu()
-    # Wait a bit for animation
-    page.wait_for_timeout(300)
     assert not inventory_page.is_menu_open(), "Menu should be closed after closing"
 
 
-def test_menu_links_accessible_when_open(page: Page, test_users):
+def test_menu_links_accessible_when_open(authenticated_page: Page):
     """Test that menu links are accessible when menu is opened on inventory page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
-
-    inventory_page = login_page.login(user["username"], user["password"])
+    page = authenticated_page
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Menu should be closed initially
@@ -150,14 +127,13 @@ def test_menu_links_accessible_when_open(page: Page, test_users):
     ), "Reset App link should exist in menu"
 
 
-def test_logout_from_cart_page(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_logout_from_cart_page(authenticated_page: Page):
     """Test logout from the shopping cart page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
+    page = authenticated_page
 
-    # Login and add a product to cart
-    inventory_page = login_page.login(user["username"], user["password"])
+    # Start logged in and add a product to cart
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Add product to cart
@@ -175,20 +151,19 @@ def test_logout_from_cart_page(page: Page, test_users):
     login_page = cart_page.logout()
 
     # Verify we're back on the login page
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    expect(page).to_have_url(LoginPage.PAGE_URL)
     assert (
         login_page.username_input.is_visible()
     ), "Should be on login page after logout from cart"
 
 
-def test_logout_from_checkout_step_one(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_logout_from_checkout_step_one(authenticated_page: Page):
     """Test logout from checkout step one (customer information) page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
+    page = authenticated_page
 
-    # Login, add product to cart, and navigate to checkout
-    inventory_page = login_page.login(user["username"], user["password"])
+    # Start logged in, add product to cart, and navigate to checkout
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Add product to cart
@@ -208,20 +183,19 @@ def test_logout_from_checkout_step_one(page: Page, test_users):
     login_page = checkout_step_one.logout()
 
     # Verify we're back on the login page
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    expect(page).to_have_url(LoginPage.PAGE_URL)
     assert (
         login_page.username_input.is_visible()
     ), "Should be on login page after logout from checkout step one"
 
 
-def test_logout_from_checkout_step_two(page: Page, test_users):
+@pytest.mark.destroys_session
+def test_logout_from_checkout_step_two(authenticated_page: Page):
     """Test logout from checkout step two (order overview) page."""
-    user = test_users["standard_user"]
-    login_page = LoginPage(page)
-    login_page.navigate()
+    page = authenticated_page
 
-    # Login, add product to cart, and navigate through checkout
-    inventory_page = login_page.login(user["username"], user["password"])
+    # Start logged in, add product to cart, and navigate through checkout
+    inventory_page = InventoryPage(page)
     expect(page).to_have_url(re.compile(".*inventory.html"))
 
     # Add product to cart
@@ -247,7 +221,7 @@ def test_logout_from_checkout_step_two(page: Page, test_users):
     login_page = checkout_step_two.logout()
 
     # Verify we're back on the login page
-    expect(page).to_have_url(re.compile(".*saucedemo.com/?$"))
+    expect(page).to_have_url(LoginPage.PAGE_URL)
     assert (
         login_page.username_input.is_visible()
     ), "Should be on login page after logout from checkout step two"
@@ -0,0 +1,29 @@
+import re
+
+import pytest
+from playwright.sync_api import Page, expect
+
+from models import InventoryPage
+
+
+@pytest.mark.cart
+def test_product_details_round_trip(authenticated_page: Page, test_data):
+    """Open a product from the inventory, add it to the cart there and go back."""
+    backpack = test_data.products.sauce_labs_backpack
+    inventory_page = InventoryPage(authenticated_page)
+
+    details_page = inventory_page.click_product_name(backpack.name)
+    expect(authenticated_page).to_have_url(
+        re.compile(rf".*inventory-item\.html\?id={backpack.item_id}$")
+    )
+    assert details_page.is_loaded(), "Product details page should be loaded"
+    assert details_page.get_name() == backpack.name
+    assert details_page.get_description() == backpack.description
+    assert details_page.get_price() == backpack.price
+
+    details_page.add_to_cart()
+    assert details_page.is_in_cart(), "Product should be in the cart"
+
+    inventory_page = details_page.back_to_products()
+    assert inventory_page.is_loaded(), "Inventory page should be loaded"
+    assert inventory_page.get_cart_badge_count() == 1, "Cart badge should show 1 item"
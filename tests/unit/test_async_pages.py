@@ -0,0 +1,187 @@
+"""Unit tests for the async page test protocol of utils.plugins.async_pages."""
+
+import concurrent.futures
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from utils import async_page_tests
+from utils.plugins import async_pages
+
+
+class FakeHooks:
+    """Stands in for ``item.ihook``, logging the phases run and reports made."""
+
+    def __init__(self, log, futures):
+        self.log = log
+        self.futures = futures
+
+    def pytest_runtest_setup(self, item):
+        self.log.append(("setup", item.nodeid))
+
+    def pytest_runtest_teardown(self, item, nextitem):
+        running = sum(not future.done() for future in self.futures)
+        self.log.append(("teardown", item.nodeid, running))
+
+    def pytest_runtest_makereport(self, item, call):
+        return SimpleNamespace(
+            nodeid=item.nodeid,
+            when=call.when,
+            passed=call.excinfo is None,
+            user_properties=[],
+        )
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        pass
+
+    def pytest_runtest_logreport(self, report):
+        self.log.append(("report", report.nodeid, report.when, report.passed))
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        pass
+
+
+async def async_test(async_page):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def pending(monkeypatch):
+    """Give every test an empty queue of pending async page tests."""
+    queue = []
+    monkeypatch.setattr(async_pages, "_pending_async_pages", queue)
+    return queue
+
+
+@pytest.fixture
+def log():
+    return []
+
+
+@pytest.fixture
+def futures():
+    return []
+
+
+def make_item(name, log, futures, pages_per_worker=4):
+    """An async page test whose scheduled call resolves when its future does."""
+    future = concurrent.futures.Future()
+    futures.append(future)
+
+    def schedule(test, args, page_arg):
+        log.append(("scheduled", name))
+        return future
+
+    item = SimpleNamespace(
+        nodeid=name,
+        location=(name, 0, name),
+        ihook=FakeHooks(log, futures),
+        config=SimpleNamespace(getoption=lambda option: pages_per_worker),
+        fixturenames=["async_page"],
+        funcargs={"async_page": schedule},
+        obj=async_test,
+    )
+    return item, future
+
+
+def passed(future, start=0.0):
+    future.set_result({"error": None, "start": start, "duration": 0.1})
+
+
+def reports(log):
+    return [entry[1:] for entry in log if entry[0] == "report"]
+
+
+def test_finished_tests_wait_for_earlier_ones_to_be_reported(log, futures):
+    first, first_future = make_item("test_first", log, futures)
+    second, second_future = make_item("test_second", log, futures)
+    third, _ = make_item("test_third", log, futures)
+    async_pages.pytest_runtest_protocol(first, nextitem=second)
+    async_pages.pytest_runtest_protocol(second, nextitem=third)
+    passed(second_future)
+
+    async_pages._flush_async_pages(1)
+    assert reports(log) == []
+
+    passed(first_future)
+    async_pages._flush_async_pages(1)
+    reported = [nodeid for nodeid, *_ in reports(log)]
+    assert reported == ["test_first"] * 3 + ["test_second"] * 3
+
+
+def test_reports_follow_the_scheduling_order(log, futures):
+    items = [make_item(f"test_{index}", log, futures) for index in range(3)]
+    for (item, _), (nextitem, _) in zip(items, items[1:]):
+        async_pages.pytest_runtest_protocol(item, nextitem=nextitem)
+    # Finish in reverse order, the first one only once the last is waiting
+    passed(items[1][1])
+    threading.Timer(0.05, passed, args=(items[0][1],)).start()
+    passed(items[2][1])
+
+    async_pages.pytest_runtest_protocol(items[2][0], nextitem=None)
+
+    assert reports(log) == [
+        (f"test_{index}", when, True)
+        for index in range(3)
+        for when in ("setup", "call", "teardown")
+    ]
+
+
+def test_the_last_test_waits_for_every_running_test_before_its_teardown(log, futures):
+    first, first_future = make_item("test_first", log, futures)
+    last, last_future = make_item("test_last", log, futures)
+    async_pages.pytest_runtest_protocol(first, nextitem=last)
+    for future in (first_future, last_future):
+        threading.Timer(0.05, passed, args=(future,)).start()
+
+    async_pages.pytest_runtest_protocol(last, nextitem=None)
+
+    teardowns = [entry for entry in log if entry[0] == "teardown"]
+    assert teardowns[-1] == ("teardown", "test_last", 0)
+
+
+def test_earlier_tests_keep_running_through_the_next_teardown(log, futures):
+    first, _ = make_item("test_first", log, futures)
+    second, _ = make_item("test_second", log, futures)
+
+    async_pages.pytest_runtest_protocol(first, nextitem=second)
+
+    assert ("teardown", "test_first", 2) in log
+    assert reports(log) == []
+
+
+def test_a_failing_test_is_reported_as_failed(log, futures):
+    item, future = make_item("test_failing", log, futures)
+    future.set_result(
+        {"error": AssertionError("no products"), "start": 0.0, "duration": 0.1}
+    )
+
+    async_pages.pytest_runtest_protocol(item, nextitem=None)
+
+    assert reports(log) == [
+        ("test_failing", "setup", True),
+        ("test_failing", "call", False),
+        ("test_failing", "teardown", True),
+    ]
+
+
+def test_async_page_tests_are_found_in_the_source(tmp_path):
+    module = tmp_path / "test_module.py"
+    module.write_text(
+        "async def test_async(async_page):\n"
+        "    pass\n"
+        "\n"
+        "def test_sync(page):\n"
+        "    pass\n"
+        "\n"
+        "async def test_without_page(test_data):\n"
+        "    pass\n"
+        "\n"
+        "class TestLogin:\n"
+        "    async def test_login(self, async_page, user):\n"
+        "        pass\n"
+    )
+
+    assert async_page_tests(module) == {"test_async", "TestLogin::test_login"}
+    assert async_page_tests(tmp_path / "missing.py") == set()
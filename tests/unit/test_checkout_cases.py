@@ -0,0 +1,65 @@
+"""Unit tests for utils.checkout_cases: case ranges and generated cases."""
+
+import pytest
+
+from utils import CheckoutCaseGenerator, case_range_id, case_ranges
+from utils.checkout_cases import FORM_FIELDS
+
+PRODUCTS = {
+    "sauce_labs_backpack": None,
+    "sauce_labs_bike_light": None,
+    "sauce_labs_bolt_t_shirt": None,
+    "sauce_labs_fleece_jacket": None,
+}
+
+
+def test_ranges_cover_every_case_once():
+    ranges = case_ranges(10, per_test=4)
+
+    assert ranges == [range(0, 4), range(4, 8), range(8, 10)]
+    assert [index for indices in ranges for index in indices] == list(range(10))
+
+
+def test_ranges_are_a_list_pytest_can_parametrize_with():
+    assert isinstance(case_ranges(3), list)
+    assert case_ranges(3) == [range(0, 1), range(1, 2), range(2, 3)]
+    assert case_ranges(0, per_test=5) == []
+
+
+def test_range_ids_name_the_cases_they_hold():
+    assert case_range_id(range(7, 8)) == "case7"
+    assert case_range_id(range(100, 200)) == "cases100-199"
+
+
+def test_the_same_seed_builds_the_same_cases():
+    first = CheckoutCaseGenerator(PRODUCTS, seed=3)
+    second = CheckoutCaseGenerator(PRODUCTS, seed=3)
+
+    assert list(first.cases(range(50))) == list(second.cases(range(50)))
+
+
+def test_a_case_does_not_depend_on_the_cases_built_before_it():
+    generator = CheckoutCaseGenerator(PRODUCTS, seed=3)
+    in_sequence = list(generator.cases(range(20)))
+
+    assert CheckoutCaseGenerator(PRODUCTS, seed=3).case(17) == in_sequence[17]
+
+
+def test_another_seed_builds_other_cases():
+    first = CheckoutCaseGenerator(PRODUCTS, seed=1).cases(range(20))
+    second = CheckoutCaseGenerator(PRODUCTS, seed=2).cases(range(20))
+
+    assert list(first) != list(second)
+
+
+@pytest.mark.parametrize("invalid_ratio", [0.0, 1.0])
+def test_the_expected_error_matches_the_first_empty_field(invalid_ratio):
+    generator = CheckoutCaseGenerator(PRODUCTS, invalid_ratio=invalid_ratio)
+
+    for case in generator.cases(range(50)):
+        values = [getattr(case.customer, field) for field, _ in FORM_FIELDS]
+        empty = [error for (_, error), value in zip(FORM_FIELDS, values) if not value]
+        assert case.error == (empty[0] if empty else None)
+        assert (case.error is not None) == (invalid_ratio == 1.0)
+        assert case.cart and set(case.cart) <= set(PRODUCTS)
+        assert len(set(case.cart)) == len(case.cart)
@@ -0,0 +1,82 @@
+"""Unit tests for utils.CleanupQueue's batching, retries and leftovers."""
+
+import threading
+
+from utils import CleanupQueue
+
+
+class FakeBackend:
+    """A delete callable that fails chosen resources a number of times."""
+
+    def __init__(self, failures=None, error=None):
+        self.failures = dict(failures or {})
+        self.error = error
+        self.batches = []
+
+    def __call__(self, batch):
+        self.batches.append(list(batch))
+        if self.error is not None:
+            raise self.error
+        failed = [resource for resource in batch if self.failures.get(resource, 0) > 0]
+        for resource in failed:
+            self.failures[resource] -= 1
+        return failed
+
+
+def test_close_deletes_everything_added_in_one_batch():
+    backend = FakeBackend()
+    queue = CleanupQueue(backend, interval=60)
+    for resource in range(3):
+        queue.add(resource)
+
+    assert queue.close() == []
+    assert backend.batches == [[0, 1, 2]]
+    assert queue.deleted == 3
+
+
+def test_a_full_batch_is_flushed_in_the_background():
+    flushed = threading.Event()
+
+    def delete(batch):
+        flushed.set()
+        return []
+
+    queue = CleanupQueue(delete, batch_size=2, interval=60).start()
+    queue.add(1)
+    queue.add(2)
+
+    assert flushed.wait(timeout=5)
+    queue.close()
+    assert queue.deleted == 2
+
+
+def test_failed_resources_are_retried_until_deleted():
+    backend = FakeBackend(failures={"b": 2})
+    queue = CleanupQueue(backend, retries=3, backoff=0)
+    queue.add("a")
+    queue.add("b")
+
+    assert queue.close() == []
+    assert backend.batches == [["a", "b"], ["b"], ["b"]]
+    assert queue.deleted == 2
+
+
+def test_resources_still_failing_after_the_retries_are_left_over():
+    backend = FakeBackend(failures={"b": 10})
+    queue = CleanupQueue(backend, retries=2, backoff=0)
+    queue.add("a")
+    queue.add("b")
+
+    assert queue.close() == ["b"]
+    assert len(backend.batches) == 3
+    assert queue.deleted == 1
+
+
+def test_a_raising_delete_fails_the_whole_batch():
+    backend = FakeBackend(error=ConnectionError("backend down"))
+    queue = CleanupQueue(backend, retries=1, backoff=0)
+    queue.add("a")
+    queue.add("b")
+
+    assert sorted(queue.close()) == ["a", "b"]
+    assert queue.deleted == 0
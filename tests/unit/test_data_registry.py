@@ -0,0 +1,111 @@
+"""Unit tests for the pickle cache of utils.data_registry.load_registry."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from utils import DataError, data_registry, load_registry
+
+TEST_DATA = Path(__file__).resolve().parents[2] / "test_data"
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A copy of test_data/ the test may edit."""
+    return Path(shutil.copytree(TEST_DATA, tmp_path / "test_data"))
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count the registry parses, i.e. the cache misses."""
+    calls = []
+    parse = data_registry.parse_registry
+
+    def counting_parse(raw):
+        calls.append(raw)
+        return parse(raw)
+
+    monkeypatch.setattr(data_registry, "parse_registry", counting_parse)
+    return calls
+
+
+def cached_files(cache_dir):
+    return sorted(path.name for path in cache_dir.glob("registry-*.pickle"))
+
+
+def test_a_miss_parses_the_files_and_writes_the_cache(data_dir, cache_dir, parses):
+    registry = load_registry(data_dir, cache_dir)
+
+    assert len(parses) == 1
+    assert len(cached_files(cache_dir)) == 1
+    assert registry.users.standard_user.username == "standard_user"
+
+
+def test_a_hit_unpickles_without_parsing(data_dir, cache_dir, parses):
+    first = load_registry(data_dir, cache_dir)
+
+    second = load_registry(data_dir, cache_dir)
+
+    assert len(parses) == 1
+    assert second == first
+
+
+def test_changing_a_data_file_invalidates_the_cache(data_dir, cache_dir, parses):
+    load_registry(data_dir, cache_dir)
+    users_file = data_dir / "users.json"
+    users = json.loads(users_file.read_text())
+    users["standard_user"]["password"] = "changed"
+    users_file.write_text(json.dumps(users))
+
+    registry = load_registry(data_dir, cache_dir)
+
+    assert len(parses) == 2
+    assert len(cached_files(cache_dir)) == 2
+    assert registry.users.standard_user.password == "changed"
+
+
+def test_changing_the_record_classes_invalidates_the_cache(
+    data_dir, cache_dir, parses, tmp_path, monkeypatch
+):
+    load_registry(data_dir, cache_dir)
+    # Stands in for an edit of data_registry.py, e.g. a new record field
+    source = tmp_path / "data_registry.py"
+    source.write_text(Path(data_registry.__file__).read_text() + "\n# edited\n")
+    monkeypatch.setattr(data_registry, "__file__", str(source))
+
+    load_registry(data_dir, cache_dir)
+
+    assert len(parses) == 2
+    assert len(cached_files(cache_dir)) == 2
+
+
+def test_an_unreadable_cache_is_parsed_again(data_dir, cache_dir, parses):
+    first = load_registry(data_dir, cache_dir)
+    (cached,) = cache_dir.glob("registry-*.pickle")
+    cached.write_bytes(b"not a pickle")
+
+    second = load_registry(data_dir, cache_dir)
+
+    assert len(parses) == 2
+    assert second == first
+
+
+def test_without_a_cache_dir_every_call_parses(data_dir, parses):
+    load_registry(data_dir)
+    load_registry(data_dir)
+
+    assert len(parses) == 2
+
+
+def test_a_missing_data_file_is_a_data_error(data_dir, cache_dir):
+    (data_dir / "products.json").unlink()
+
+    with pytest.raises(DataError, match="products.json"):
+        load_registry(data_dir, cache_dir)
@@ -0,0 +1,277 @@
+"""Unit tests for utils.durations: duration history and xdist scheduling."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils import DurationHistory, DurationScheduling, durations
+from utils.durations import BROWSER_MEMORY_MB, DEFAULT_ESTIMATE, PREFETCH, size_pools
+from utils.timings import nodeid_browser
+
+
+class FakeConfig:
+    """Just enough of pytest.Config for xdist's LoadScheduling."""
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def getvalue(self, name):
+        return [f"{self.workers}*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class FakeNode:
+    """Stands in for an xdist WorkerController, recording what it is sent."""
+
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.sent = []
+        self.shutting_down = False
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+    def __repr__(self):
+        return self.gateway.id
+
+
+def start(collection, workers, **kwargs):
+    """Build a DurationScheduling over fake workers and schedule the collection."""
+    scheduler = DurationScheduling(FakeConfig(workers), **kwargs)
+    nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+def sent_ids(scheduler, node):
+    return [scheduler.collection[index] for index in node.sent]
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(tmp_path / "durations.json")
+
+
+def test_update_blends_new_durations_into_known_ones(history):
+    history.update({"tests/test_a.py::test_one": 4.0})
+    history.update({"tests/test_a.py::test_one": 2.0, "tests/test_a.py::test_two": 1.0})
+
+    assert history.estimate("tests/test_a.py::test_one") == 3.0
+    assert history.estimate("tests/test_a.py::test_two") == 1.0
+
+
+def test_history_survives_a_save(history):
+    history.update({"tests/test_a.py::test_one": 4.0})
+    history.save()
+
+    assert DurationHistory(history.path).estimate("tests/test_a.py::test_one") == 4.0
+
+
+def test_unknown_tests_take_their_module_median_then_the_suite_median(history):
+    history.update(
+        {
+            "tests/test_a.py::test_one": 1.0,
+            "tests/test_a.py::test_two": 3.0,
+            "tests/test_a.py::test_three": 8.0,
+            "tests/test_b.py::test_one": 10.0,
+        }
+    )
+
+    assert history.estimate("tests/test_a.py::test_new") == 3.0
+    assert history.estimate("tests/test_c.py::test_new") == 5.5
+
+
+def test_an_empty_history_estimates_the_default(history):
+    assert history.estimate("tests/test_a.py::test_one") == DEFAULT_ESTIMATE
+
+
+def test_an_unreadable_history_starts_empty(tmp_path):
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+
+    assert DurationHistory(path).durations == {}
+
+
+def test_workers_get_the_longest_tests_first(history):
+    collection = [f"tests/test_a.py::test_{index}" for index in range(6)]
+    history.update({nodeid: float(index) for index, nodeid in enumerate(collection)})
+
+    scheduler, (first, second) = start(collection, 2, history=history)
+
+    assert sent_ids(scheduler, first) == collection[5:3:-1]
+    assert sent_ids(scheduler, second) == collection[3:1:-1]
+    assert scheduler.pending == [1, 0]
+
+
+def test_a_worker_is_topped_up_to_the_prefetch_as_it_finishes(history):
+    collection = [f"tests/test_a.py::test_{index}" for index in range(6)]
+    history.update({nodeid: float(index) for index, nodeid in enumerate(collection)})
+    scheduler, (first, second) = start(collection, 2, history=history)
+
+    scheduler.mark_test_complete(first, first.sent[0])
+
+    assert len(scheduler.node2pending[first]) == PREFETCH
+    assert sent_ids(scheduler, first)[-1] == collection[1]
+
+
+def test_browserless_workers_never_get_browser_tests():
+    collection = [
+        "tests/api/test_a.py::test_one",
+        "tests/test_ui.py::test_one",
+        "tests/api/test_a.py::test_two",
+        "tests/test_ui.py::test_two",
+    ]
+
+    scheduler, (lane, browser) = start(
+        collection,
+        2,
+        browserless=lambda nodeid: nodeid.startswith("tests/api/"),
+        browserless_workers=1,
+    )
+
+    assert scheduler.lane_nodes == {lane}
+    assert all(nodeid.startswith("tests/api/") for nodeid in sent_ids(scheduler, lane))
+    assert all(
+        nodeid.startswith("tests/test_ui") for nodeid in sent_ids(scheduler, browser)
+    )
+
+
+def test_browser_workers_fall_back_to_browserless_tests():
+    collection = ["tests/test_ui.py::test_ui", "tests/api/test_a.py::test_api"]
+
+    scheduler, (lane, browser) = start(
+        collection,
+        2,
+        browserless=lambda nodeid: nodeid.startswith("tests/api/"),
+        browserless_workers=1,
+    )
+    # The browserless test went to its lane; a browser worker may take one
+    # once nothing of its own is left
+    index = collection.index("tests/api/test_a.py::test_api")
+
+    assert scheduler._fit(lane, index) == 0
+    assert scheduler._fit(browser, index) == 1
+    assert scheduler._fit(lane, collection.index("tests/test_ui.py::test_ui")) is None
+
+
+def test_without_browser_tests_no_worker_is_reserved():
+    collection = [f"tests/api/test_a.py::test_{index}" for index in range(4)]
+
+    scheduler, _ = start(
+        collection,
+        2,
+        browserless=lambda nodeid: nodeid.startswith("tests/api/"),
+        browserless_workers=1,
+    )
+
+    assert scheduler.lane_nodes == set()
+
+
+def test_pools_follow_each_browsers_share_of_the_work():
+    assert size_pools({"chromium": 30.0, "firefox": 10.0}, 4) == {
+        "chromium": 3,
+        "firefox": 1,
+    }
+
+
+def test_every_browser_gets_a_worker():
+    assert size_pools({"chromium": 100.0, "firefox": 1.0}, 4) == {
+        "chromium": 3,
+        "firefox": 1,
+    }
+
+
+def test_requested_pool_sizes_are_shrunk_to_the_workers():
+    sizes = size_pools(
+        {"chromium": 20.0, "firefox": 10.0}, 3, requested={"chromium": 4, "firefox": 2}
+    )
+
+    assert sizes == {"chromium": 2, "firefox": 1}
+
+
+def test_pools_shrink_until_their_browsers_fit_in_memory():
+    memory = 2 * BROWSER_MEMORY_MB["chromium"] + BROWSER_MEMORY_MB["firefox"]
+
+    sizes = size_pools({"chromium": 40.0, "firefox": 10.0}, 5, memory_mb=memory)
+
+    assert sizes == {"chromium": 2, "firefox": 1}
+
+
+def test_pools_keep_one_worker_when_memory_is_short():
+    assert size_pools({"chromium": 1.0, "firefox": 1.0}, 4, memory_mb=0) == {
+        "chromium": 1,
+        "firefox": 1,
+    }
+
+
+def test_pooled_workers_only_run_their_browsers_tests(monkeypatch):
+    monkeypatch.setattr(durations, "available_memory_mb", lambda: None)
+    collection = [
+        f"tests/test_ui.py::test_{index}[{browser}]"
+        for index in range(3)
+        for browser in ("chromium", "firefox")
+    ]
+
+    scheduler, nodes = start(collection, 2, browser_of=nodeid_browser)
+
+    assert scheduler.pools == {"chromium": 1, "firefox": 1}
+    for node in nodes:
+        browser = scheduler.node2browser[node]
+        assert all(
+            nodeid.endswith(f"[{browser}]") for nodeid in sent_ids(scheduler, node)
+        )
+
+
+def test_workers_left_over_by_the_memory_limit_join_the_browserless_lane(monkeypatch):
+    monkeypatch.setattr(durations, "available_memory_mb", lambda: 0)
+    collection = [
+        f"tests/test_ui.py::test_{index}[{browser}]"
+        for index in range(3)
+        for browser in ("chromium", "firefox")
+    ]
+
+    scheduler, nodes = start(collection, 3, browser_of=nodeid_browser)
+
+    assert scheduler.pools == {"chromium": 1, "firefox": 1}
+    assert scheduler.lane_nodes == {nodes[2]}
+    assert nodes[2].sent == []
+
+
+def test_async_page_tests_get_workers_of_their_own(history):
+    collection = [f"tests/test_ui.py::test_{index}" for index in range(6)] + [
+        f"tests/test_async.py::test_{index}" for index in range(12)
+    ]
+
+    scheduler, nodes = start(
+        collection,
+        4,
+        history=history,
+        async_page=lambda nodeid: nodeid.startswith("tests/test_async.py"),
+        pages_per_worker=4,
+    )
+
+    # 12 async tests four at a time weigh like 3 sync ones: 3 of 9 units
+    assert scheduler.async_nodes == {nodes[0]}
+    assert scheduler.sync_nodes == set(nodes[1:])
+    assert all("test_async" in nodeid for nodeid in sent_ids(scheduler, nodes[0]))
+    for node in nodes[1:]:
+        assert all("test_ui" in nodeid for nodeid in sent_ids(scheduler, node))
+
+
+def test_a_run_of_only_async_page_tests_is_not_split(history):
+    collection = [f"tests/test_async.py::test_{index}" for index in range(4)]
+
+    scheduler, nodes = start(
+        collection, 2, history=history, async_page=lambda nodeid: True
+    )
+
+    assert scheduler.async_nodes == scheduler.sync_nodes == set()
+    assert all(node.sent for node in nodes)
@@ -0,0 +1,135 @@
+"""Unit tests for utils.AssetFilter's blocking counts and bytes saved."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utils import AssetFilter, network_filter
+
+APP_URL = "http://app.test"
+
+
+class FakeRequestContext:
+    """Stands in for ``page.request``: answers HEAD with fixed sizes."""
+
+    def __init__(self, sizes):
+        self.sizes = sizes
+        self.heads = []
+
+    def head(self, url):
+        self.heads.append(url)
+        size = self.sizes.get(url)
+        headers = {} if size is None else {"content-length": str(size)}
+        return SimpleNamespace(ok=True, headers=headers, dispose=lambda: None)
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type, requests):
+        page = SimpleNamespace(request=requests)
+        self.request = SimpleNamespace(
+            url=url, resource_type=resource_type, frame=SimpleNamespace(page=page)
+        )
+        self.outcome = None
+
+    def fulfill(self, **kwargs):
+        self.outcome = "fulfill"
+
+    def abort(self, error_code):
+        self.outcome = "abort"
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+@pytest.fixture(autouse=True)
+def known_sizes(monkeypatch):
+    """Give every test an empty worker-wide size table."""
+    sizes = {}
+    monkeypatch.setattr(network_filter, "_known_sizes", sizes)
+    return sizes
+
+
+def handle(asset_filter, requests, url, resource_type):
+    route = FakeRoute(url, resource_type, requests)
+    asset_filter._handle(route)
+    return route.outcome
+
+
+def test_stubbed_images_save_their_content_length():
+    requests = FakeRequestContext({f"{APP_URL}/static/media/bag.jpg": 27_000})
+    asset_filter = AssetFilter(APP_URL)
+
+    outcome = handle(asset_filter, requests, f"{APP_URL}/static/media/bag.jpg", "image")
+
+    assert outcome == "fulfill"
+    summary = asset_filter.summary()
+    assert summary["blocked_requests"] == 1
+    assert summary["blocked_by_type"] == {"image": 1}
+    assert summary["bytes_saved"] == 27_000
+    assert summary["unknown_size"] == 0
+
+
+def test_sizes_are_measured_once_per_worker():
+    url = f"{APP_URL}/static/media/bag.jpg"
+    requests = FakeRequestContext({url: 1_000})
+
+    first, second = AssetFilter(APP_URL), AssetFilter(APP_URL)
+    handle(first, requests, url, "image")
+    handle(second, requests, url, "image")
+    handle(second, requests, url, "image")
+
+    assert requests.heads == [url]
+    assert first.summary()["bytes_saved"] == 1_000
+    assert second.summary()["bytes_saved"] == 2_000
+
+
+def test_third_party_requests_are_blocked_without_measuring():
+    requests = FakeRequestContext({"https://telemetry.test/beacon.js": 500})
+    asset_filter = AssetFilter(APP_URL)
+
+    outcome = handle(
+        asset_filter, requests, "https://telemetry.test/beacon.js", "script"
+    )
+
+    assert outcome == "abort"
+    assert requests.heads == []
+    assert asset_filter.summary()["blocked_by_type"] == {"third_party": 1}
+    assert asset_filter.summary()["unknown_size"] == 1
+
+
+def test_documents_scripts_and_xhr_pass_through():
+    requests = FakeRequestContext({})
+    asset_filter = AssetFilter(APP_URL)
+
+    for resource_type in ("document", "script", "stylesheet", "xhr"):
+        assert (
+            handle(asset_filter, requests, f"{APP_URL}/x", resource_type) == "fallback"
+        )
+
+    assert asset_filter.summary()["blocked_requests"] == 0
+    assert requests.heads == []
+
+
+def test_without_measuring_only_known_sizes_count(known_sizes):
+    known_sizes[f"{APP_URL}/static/media/known.woff2"] = 4_000
+    requests = FakeRequestContext({f"{APP_URL}/static/media/other.woff2": 9_000})
+    asset_filter = AssetFilter(APP_URL, measure=False)
+
+    handle(asset_filter, requests, f"{APP_URL}/static/media/known.woff2", "font")
+    handle(asset_filter, requests, f"{APP_URL}/static/media/other.woff2", "font")
+
+    assert requests.heads == []
+    summary = asset_filter.summary()
+    assert summary["blocked_by_type"] == {"font": 2}
+    assert summary["bytes_saved"] == 4_000
+    assert summary["unknown_size"] == 1
+
+
+def test_missing_content_length_counts_as_unknown_size():
+    requests = FakeRequestContext({})
+    asset_filter = AssetFilter(APP_URL)
+
+    handle(asset_filter, requests, f"{APP_URL}/static/media/clip.mp4", "media")
+
+    assert asset_filter.summary()["bytes_saved"] == 0
+    assert asset_filter.summary()["unknown_size"] == 1
@@ -0,0 +1,114 @@
+"""Unit tests for utils.sleep_guard: reporting, refcounted patches and aliases."""
+
+import importlib.util
+import sys
+import time
+
+import pytest
+
+from utils import SleepGuard
+
+# Keep the suite's own sleep_guard fixture from holding the patches, so each
+# test sees them applied and removed by its guards alone
+pytestmark = pytest.mark.allow_hard_sleep
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path.resolve()
+
+
+@pytest.fixture
+def load_module(root, monkeypatch):
+    """Import a module written under ``root``, as project code would be."""
+
+    def load(name, source):
+        path = root / f"{name}.py"
+        path.write_text(source)
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, name, module)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
+
+
+def make_guard(root, reported=None):
+    def on_sleep(description, location):
+        if reported is not None:
+            reported.append((description, location))
+
+    return SleepGuard(on_sleep, roots=[root])
+
+
+def test_sleeps_under_the_roots_are_reported(root, load_module):
+    module = load_module("waits", "import time\n\ndef wait():\n    time.sleep(0)\n")
+    reported = []
+
+    with make_guard(root, reported) as guard:
+        module.wait()
+
+    assert reported == [("time.sleep(0)", f"{root / 'waits.py'}:4")]
+    assert guard.describe(root) == ["time.sleep(0) at waits.py:4"]
+
+
+def test_sleeps_outside_the_roots_pass_unreported(root):
+    reported = []
+
+    with make_guard(root, reported):
+        time.sleep(0)
+
+    assert reported == []
+
+
+def test_raising_from_on_sleep_stops_the_sleep(root, load_module):
+    module = load_module("waits", "import time\n\ndef wait():\n    time.sleep(60)\n")
+
+    def on_sleep(description, location):
+        raise AssertionError(description)
+
+    with SleepGuard(on_sleep, roots=[root]):
+        with pytest.raises(AssertionError, match=r"time\.sleep\(60\)"):
+            module.wait()
+
+
+def test_patches_stay_until_the_last_guard_is_uninstalled(root):
+    original = time.sleep
+    first = make_guard(root).install()
+    second = make_guard(root).install()
+
+    first.uninstall()
+    assert time.sleep is not original
+    assert time.sleep.__wrapped__ is original
+
+    second.uninstall()
+    assert time.sleep is original
+
+
+def test_uninstalling_twice_does_not_remove_other_guards_patches(root):
+    original = time.sleep
+    first = make_guard(root).install()
+    second = make_guard(root).install()
+
+    first.uninstall()
+    first.uninstall()
+    assert time.sleep is not original
+
+    second.uninstall()
+    assert time.sleep is original
+
+
+def test_sleeps_imported_by_name_are_patched_and_restored(root, load_module):
+    module = load_module(
+        "aliases", "from time import sleep\n\ndef wait():\n    sleep(0)\n"
+    )
+    reported = []
+
+    with make_guard(root, reported):
+        assert module.sleep.__wrapped__ is time.sleep.__wrapped__
+        module.wait()
+
+    assert [description for description, _ in reported] == ["time.sleep(0)"]
+    assert module.sleep is time.sleep
+    assert not hasattr(module.sleep, "__wrapped__")
@@ -0,0 +1,56 @@
+from .action_timer import ActionTimer
+from .auth_state import AuthStateCache
+from .cart_state import CART_STORAGE_KEY, cart_item_ids, with_cart
+from .checkout_cases import (
+    CheckoutCase,
+    CheckoutCaseGenerator,
+    case_range_id,
+    case_ranges,
+)
+from .cleanup_queue import CleanupQueue
+from .context_pool import ContextPool
+from .data_registry import (
+    DataError,
+    DataRegistry,
+    data_references,
+    load_registry,
+    unknown_reference,
+)
+from .durations import DurationHistory, DurationScheduling
+from .har import HarRouter
+from .network_filter import AssetFilter, learn_sizes, record_sizes
+from .page_scheduler import PageScheduler, async_page_tests
+from .rpc_profiler import RpcProfiler, RpcProfilerError
+from .sleep_guard import SleepGuard
+from .timings import TimingStore
+
+__all__ = [
+    "ActionTimer",
+    "AssetFilter",
+    "AuthStateCache",
+    "CART_STORAGE_KEY",
+    "CheckoutCase",
+    "CheckoutCaseGenerator",
+    "CleanupQueue",
+    "ContextPool",
+    "DataError",
+    "DataRegistry",
+    "DurationHistory",
+    "DurationScheduling",
+    "HarRouter",
+    "PageScheduler",
+    "RpcProfiler",
+    "RpcProfilerError",
+    "SleepGuard",
+    "TimingStore",
+    "async_page_tests",
+    "cart_item_ids",
+    "case_range_id",
+    "case_ranges",
+    "data_references",
+    "learn_sizes",
+    "load_registry",
+    "record_sizes",
+    "unknown_reference",
+    "with_cart",
+]
@@ -0,0 +1,202 @@
+import html
+import inspect
+import json
+import os
+import sys
+import time
+import types
+from functools import wraps
+from pathlib import Path
+
+from .timings import percentile
+
+
+def public_methods(base: type):
+    """Yield (class, name, function) for every public method that ``base`` or
+    one of its subclasses defines itself."""
+    classes = [base]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    for cls in dict.fromkeys(classes):
+        for name, function in list(vars(cls).items()):
+            if not name.startswith("_") and isinstance(function, types.FunctionType):
+                yield cls, name, function
+
+
+class ActionTimer:
+    """Times every public method of the page object classes while installed.
+
+    ``install`` replaces each public function a page object class defines
+    with a wrapper that records its duration under ``"<Class>.<method>"``
+    (the class of the instance it was called on) and under the line that
+    called it. Coroutine methods of the async page objects are awaited and
+    timed the same way. ``uninstall`` puts the original functions back, so
+    nothing is wrapped - and nothing costs anything - unless a timer is
+    installed.
+
+    Durations are inclusive: a method calling another timed method counts
+    that call too. ``stats`` returns the raw measurements of one process and
+    ``merge`` adds another process's, which is how xdist workers' numbers
+    reach the controller.
+    """
+
+    def __init__(self, root: Path | None = None):
+        """
+        Args:
+            root: Call sites under this directory are shown relative to it
+        """
+        self.root = str(Path(root).resolve()) if root is not None else None
+        # Seconds of every call, by method
+        self.calls = {}
+        # [calls, total seconds, slowest] by (method, call site)
+        self.sites = {}
+        self._originals = []
+
+    def install(self, base: type, prefix: str = ""):
+        """Start timing the public methods of ``base`` and all its subclasses.
+
+        Args:
+            base: Page object base class, e.g. models.BasePage
+            prefix: Prepended to method names, e.g. "aio." for models.aio
+        """
+        for cls, name, function in public_methods(base):
+            self._originals.append((cls, name, function))
+            setattr(cls, name, self._wrap(function, name, prefix))
+        return self
+
+    def uninstall(self):
+        """Restore the original methods."""
+        while self._originals:
+            cls, name, function = self._originals.pop()
+            setattr(cls, name, function)
+
+    def stats(self) -> dict:
+        """Return this process's measurements, in a form xdist can send."""
+        return {
+            "calls": self.calls,
+            "sites": [
+                [method, site, *totals] for (method, site), totals in self.sites.items()
+            ],
+        }
+
+    def merge(self, stats: dict):
+        """Add the measurements of another process (see stats)."""
+        for method, durations in stats["calls"].items():
+            self.calls.setdefault(method, []).extend(durations)
+        for method, site, calls, total, slowest in stats["sites"]:
+            self._add_site(method, site, calls, total, slowest)
+
+    def summary(self, top: int = 20) -> dict:
+        """Aggregate the measurements per method and pick the slowest call sites.
+
+        Args:
+            top: Number of call sites to keep
+
+        Returns:
+            dict: "methods" (slowest cumulative time first) and "call_sites"
+            (slowest single call first); times in seconds
+        """
+        methods = [
+            {
+                "method": method,
+                "calls": len(durations),
+                "total": sum(durations),
+                "mean": sum(durations) / len(durations),
+                "p95": percentile(durations, 95),
+                "max": max(durations),
+            }
+            for method, durations in self.calls.items()
+            if durations
+        ]
+        methods.sort(key=lambda entry: -entry["total"])
+        sites = sorted(self.sites.items(), key=lambda entry: -entry[1][2])
+        call_sites = [
+            {
+                "method": method,
+                "site": site,
+                "calls": calls,
+                "total": total,
+                "max": slowest,
+            }
+            for (method, site), (calls, total, slowest) in sites[:top]
+        ]
+        return {"methods": methods, "call_sites": call_sites}
+
+    def write_json(self, path, top: int = 20):
+        """Write the summary to ``path`` as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(top), indent=2))
+
+    def html(self, top: int = 20) -> str:
+        """Return the summary as HTML tables, for the pytest-html report."""
+        summary = self.summary(top)
+        rows = "".join(
+            f"<tr><td>{html.escape(entry['method'])}</td><td>{entry['calls']}</td>"
+            f"<td>{entry['total']:.3f}</td><td>{entry['p95'] * 1000:.0f}</td>"
+            f"<td>{entry['max'] * 1000:.0f}</td></tr>"
+            for entry in summary["methods"]
+        )
+        sites = "".join(
+            f"<tr><td>{entry['max'] * 1000:.0f}</td><td>{html.escape(entry['method'])}</td>"
+            f"<td>{html.escape(entry['site'])}</td><td>{entry['calls']}</td></tr>"
+            for entry in summary["call_sites"]
+        )
+        return (
+            "<h2>Page object action timings</h2>"
+            "<table><tr><th>Method</th><th>Calls</th><th>Total (s)</th>"
+            f"<th>p95 (ms)</th><th>Max (ms)</th></tr>{rows}</table>"
+            "<h3>Slowest call sites</h3>"
+            "<table><tr><th>Max (ms)</th><th>Method</th><th>Called from</th>"
+            f"<th>Calls</th></tr>{sites}</table>"
+        )
+
+    def _wrap(self, function, name, prefix):
+        timer = self
+
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def timed_async(page_object, *args, **kwargs):
+                site = timer._site(sys._getframe(1))
+                start = time.perf_counter()
+                try:
+                    return await function(page_object, *args, **kwargs)
+                finally:
+                    timer._record(
+                        f"{prefix}{type(page_object).__name__}.{name}",
+                        site,
+                        time.perf_counter() - start,
+                    )
+
+            return timed_async
+
+        @wraps(function)
+        def timed(page_object, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(page_object, *args, **kwargs)
+            finally:
+                timer._record(
+                    f"{prefix}{type(page_object).__name__}.{name}",
+                    timer._site(sys._getframe(1)),
+                    time.perf_counter() - start,
+                )
+
+        return timed
+
+    def _site(self, frame):
+        filename = frame.f_code.co_filename
+        if self.root is not None and filename.startswith(self.root + os.sep):
+            filename = os.path.relpath(filename, self.root)
+        return f"{filename}:{frame.f_lineno}"
+
+    def _record(self, method, site, seconds):
+        self.calls.setdefault(method, []).append(seconds)
+        self._add_site(method, site, 1, seconds, seconds)
+
+    def _add_site(self, method, site, calls, total, slowest):
+        totals = self.sites.setdefault((method, site), [0, 0.0, 0.0])
+        totals[0] += calls
+        totals[1] += total
+        totals[2] = max(totals[2], slowest)
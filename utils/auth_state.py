@@ -0,0 +1,81 @@
+from playwright.sync_api import Browser
+
+
+class AuthStateCache:
+    """Per-worker cache of logged-in browser storage state, keyed by username.
+
+    Logging in through the UI costs a page load plus three actions. This cache
+    performs that login once per user per worker, captures the resulting
+    cookies and localStorage via ``context.storage_state()``, and hands the
+    snapshot to every later context so tests start already authenticated.
+
+    Under pytest-xdist each worker is its own process with its own session
+    fixtures, so every worker logs in at most once per user.
+    """
+
+    def __init__(self, browser: Browser, context_args: dict, users, setup_context=None):
+        """
+        Args:
+            browser: Session browser used to run the one-off logins
+            context_args: Base context arguments (from browser_context_args)
+            users: User records keyed by name (DataRegistry.users)
+            setup_context: Optional callable applied to each login context
+                before use (e.g. HarRouter.apply)
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.users = users
+        self.setup_context = setup_context
+        self._states = {}
+        self.logins = 0
+
+    def get(self, user: str = "standard_user"):
+        """Return the storage state for a user, logging in on first use.
+
+        Args:
+            user: Key of the user in test_data/users.json
+
+        Returns:
+            dict: Storage state accepted by ``browser.new_context(storage_state=...)``
+        """
+        if user not in self._states:
+            self._states[user] = self._login(user)
+        return self._states[user]
+
+    def invalidate(self, user: str = None):
+        """Drop the cached state for a user, or for every user if none given.
+
+        The next get() call for that user performs a fresh UI login.
+        """
+        if user is None:
+            self._states.clear()
+        else:
+            self._states.pop(user, None)
+
+    def is_cached(self, user: str):
+        """Check if a storage state is cached for the given user."""
+        return user in self._states
+
+    def _login(self, user: str):
+        """Log in through the UI in a throwaway context and capture its state."""
+        from models import LoginPage
+
+        credentials = self.users[user]
+        context = self.browser.new_context(**self.context_args)
+        if self.setup_context is not None:
+            self.setup_context(context)
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.navigate()
+            login_page.login(credentials.username, credentials.password)
+            if login_page.has_error():
+                raise RuntimeError(
+                    f"UI login failed for user '{user}': {login_page.get_error_text()}"
+                )
+            # Session cookie is written by the app once the inventory loads
+            page.wait_for_url("**/inventory.html")
+            self.logins += 1
+            return context.storage_state()
+        finally:
+            context.close()
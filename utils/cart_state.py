@@ -0,0 +1,56 @@
+import copy
+import json
+from urllib.parse import urlsplit
+
+# localStorage key the Sauce Demo app keeps its cart in (a JSON list of item ids)
+CART_STORAGE_KEY = "cart-contents"
+
+
+def cart_item_ids(products, product_keys):
+    """Map product keys from test_data/products.json to the app's cart item ids.
+
+    Args:
+        products: Product records keyed by name (DataRegistry.products)
+        product_keys: Keys of the products to put in the cart, in cart order
+
+    Returns:
+        list: Numeric item ids as stored by the app
+    """
+    return [products[key].item_id for key in product_keys]
+
+
+def with_cart(storage_state: dict, item_ids, url: str):
+    """Return a copy of a storage state whose cart holds the given items.
+
+    The cart is written into the localStorage entry for the origin of ``url``
+    so a context created from the result opens with the cart already filled,
+    without any clicks on the inventory page.
+
+    Args:
+        storage_state: State from ``context.storage_state()`` (not modified)
+        item_ids: Numeric item ids, see cart_item_ids()
+        url: Any URL of the application, used to derive the origin
+
+    Returns:
+        dict: Storage state accepted by ``browser.new_context(storage_state=...)``
+    """
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    state = copy.deepcopy(storage_state)
+
+    origins = state.setdefault("origins", [])
+    entry = next((o for o in origins if o["origin"] == origin), None)
+    if entry is None:
+        entry = {"origin": origin, "localStorage": []}
+        origins.append(entry)
+
+    entry["localStorage"] = [
+        item for item in entry["localStorage"] if item["name"] != CART_STORAGE_KEY
+    ]
+    entry["localStorage"].append(
+        {
+            "name": CART_STORAGE_KEY,
+            "value": json.dumps(list(item_ids), separators=(",", ":")),
+        }
+    )
+    return state
@@ -0,0 +1,164 @@
+import random
+from dataclasses import dataclass
+
+from .data_registry import Customer
+
+# Form fields in the order the app validates them, with the expected error
+# (key of test_data/expected_data.json "errors") when one is left empty
+FORM_FIELDS = (
+    ("first_name", "missing_first_name"),
+    ("last_name", "missing_last_name"),
+    ("postal_code", "missing_postal_code"),
+)
+
+FIRST_NAMES = (
+    "John",
+    "Jane",
+    "Ana",
+    "Li",
+    "Mohammed",
+    "Olga",
+    "Kwame",
+    "Priya",
+    "José",
+    "Zoë",
+    "François",
+    "Søren",
+    "Łukasz",
+    "Nguyễn",
+    "Mary-Kate",
+    "D'Andre",
+    "Jean Luc",
+    "Aleksandr",
+    "Bartholomew",
+    "Ó",
+)
+LAST_NAMES = (
+    "Doe",
+    "Smith",
+    "García",
+    "Müller",
+    "O'Brien",
+    "Nakamura",
+    "Okonkwo",
+    "van der Berg",
+    "Smith-Jones",
+    "Østergaard",
+    "Ng",
+    "Wolfeschlegelsteinhausen",
+    "de la Cruz",
+    "Björk",
+    "Al-Sayed",
+    "X",
+)
+# Postal code formats: "9" is a digit, "A" an upper-case letter
+POSTAL_FORMATS = (
+    "99999",
+    "99999-9999",
+    "A9A 9A9",
+    "AA9A 9AA",
+    "A9 9AA",
+    "9999",
+    "999-9999",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CheckoutCase:
+    """One generated checkout: form input, cart contents and expected outcome.
+
+    Attributes:
+        index: Position of the case in the generator's sequence
+        customer: Checkout step one form input
+        cart: Product keys (test_data/products.json) in cart order
+        error: Key of the expected error in ``expected.errors`` when a field
+            is left empty, None when the form should be accepted
+    """
+
+    index: int
+    customer: Customer
+    cart: tuple[str, ...]
+    error: str | None
+
+    @property
+    def id(self) -> str:
+        """Name of the case in test output, e.g. "case42"."""
+        return f"case{self.index}"
+
+
+class CheckoutCaseGenerator:
+    """Reproducible synthetic checkout cases, built on demand by index.
+
+    Each case is derived from ``(seed, index)`` alone, so any case can be
+    built without the ones before it: the same seed gives every xdist worker
+    (and every later run) the same case for the same index, and nothing has
+    to be generated - let alone kept - until a test asks for its cases.
+    """
+
+    def __init__(self, products, seed: int = 0, invalid_ratio: float = 0.25):
+        """
+        Args:
+            products: Product records keyed by name (DataRegistry.products)
+            seed: Seed of the case sequence
+            invalid_ratio: Share of cases with at least one empty field
+        """
+        self.product_keys = tuple(products)
+        self.seed = seed
+        self.invalid_ratio = invalid_ratio
+
+    def case(self, index: int) -> CheckoutCase:
+        """Build the case at ``index``."""
+        # String seeds are hashed with SHA-512, not hash(), so they do not
+        # depend on PYTHONHASHSEED
+        rng = random.Random(f"{self.seed}:{index}")
+        values = {
+            "first_name": rng.choice(FIRST_NAMES),
+            "last_name": rng.choice(LAST_NAMES),
+            "postal_code": _postal_code(rng),
+        }
+        error = None
+        if rng.random() < self.invalid_ratio:
+            empty = [field for field, _ in FORM_FIELDS if rng.random() < 0.5]
+            if not empty:
+                empty = [rng.choice(FORM_FIELDS)[0]]
+            for field in empty:
+                values[field] = ""
+            error = next(error for field, error in FORM_FIELDS if not values[field])
+        size = rng.randint(1, len(self.product_keys))
+        cart = tuple(rng.sample(self.product_keys, size))
+        return CheckoutCase(index, Customer(**values), cart, error)
+
+    def cases(self, indices):
+        """Yield the cases at ``indices`` (e.g. a range), one at a time."""
+        for index in indices:
+            yield self.case(index)
+
+
+def case_ranges(count: int, per_test: int = 1) -> list[range]:
+    """Split ``count`` case indices into consecutive ranges of ``per_test``.
+
+    Used as the parameter values of a parametrized test: a range object is
+    a few dozen bytes however many cases it covers.
+    """
+    return [
+        range(start, min(start + per_test, count))
+        for start in range(0, count, per_test)
+    ]
+
+
+def case_range_id(indices: range) -> str:
+    """Test id of a case range: "case7", or "cases100-199"."""
+    if len(indices) == 1:
+        return f"case{indices.start}"
+    return f"cases{indices.start}-{indices.stop - 1}"
+
+
+def _postal_code(rng):
+    characters = []
+    for char in rng.choice(POSTAL_FORMATS):
+        if char == "9":
+            char = str(rng.randrange(10))
+        elif char == "A":
+            char = chr(ord("A") + rng.randrange(26))
+        characters.append(char)
+    return "".join(characters)
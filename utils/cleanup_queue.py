@@ -0,0 +1,114 @@
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+
+
+class CleanupQueue:
+    """Deferred, batched deletion of test data, off the tests' clock.
+
+    Fixtures ``add`` the resources they created instead of deleting them in
+    their own teardown. A background thread hands pending resources to
+    ``delete`` in batches - as soon as ``batch_size`` are waiting, or every
+    ``interval`` seconds - and ``close`` drains the rest at session end.
+
+    ``delete`` receives a list of resources and returns the ones it could not
+    delete (raising counts as failing the whole batch). Failed resources are
+    retried up to ``retries`` times with exponential backoff; whatever is
+    still left after that ends up in ``leftovers`` for the run summary.
+    """
+
+    def __init__(
+        self,
+        delete: Callable[[list], Iterable[Hashable]],
+        batch_size: int = 25,
+        interval: float = 1.0,
+        retries: int = 3,
+        backoff: float = 0.2,
+    ):
+        """
+        Args:
+            delete: Deletes a batch, returning the resources that failed
+            batch_size: Pending resources that trigger an immediate flush
+            interval: Seconds between background flushes of smaller batches
+            retries: Attempts per resource after the first failure
+            backoff: Base delay in seconds between retries at close
+        """
+        self._delete = delete
+        self.batch_size = batch_size
+        self.interval = interval
+        self.retries = retries
+        self.backoff = backoff
+        self.deleted = 0
+        self.leftovers = []
+        self._pending = []
+        self._attempts = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="cleanup-queue", daemon=True
+        )
+
+    def start(self):
+        """Start flushing in the background."""
+        self._thread.start()
+        return self
+
+    def add(self, resource: Hashable):
+        """Queue a resource for deletion."""
+        with self._condition:
+            self._pending.append(resource)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def close(self) -> list:
+        """Stop the background thread, drain the queue and return leftovers."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread.is_alive():
+            self._thread.join()
+
+        rounds = 0
+        while batch := self._take():
+            if rounds:
+                time.sleep(self.backoff * 2 ** (rounds - 1))
+            self._flush(batch)
+            rounds += 1
+        return self.leftovers
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    timeout=self.interval,
+                )
+                if self._closed:
+                    return
+            batch = self._take()
+            if batch:
+                self._flush(batch)
+
+    def _take(self) -> list:
+        with self._condition:
+            batch, self._pending = self._pending, []
+        return batch
+
+    def _flush(self, batch):
+        try:
+            failed = set(self._delete(batch))
+        except Exception:
+            # The delete callable talks to an arbitrary backend; whatever it
+            # raised, nothing in the batch is known to be gone
+            failed = set(batch)
+
+        self.deleted += len(batch) - len(failed)
+        for resource in batch:
+            if resource not in failed:
+                continue
+            attempts = self._attempts.get(resource, 0) + 1
+            if attempts > self.retries:
+                self.leftovers.append(resource)
+            else:
+                self._attempts[resource] = attempts
+                self.add(resource)
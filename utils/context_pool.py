@@ -0,0 +1,107 @@
+from playwright.sync_api import Browser, BrowserContext
+from playwright.sync_api import Error as PlaywrightError
+
+# Clears the storage of whatever origin the page is currently on
+_CLEAR_STORAGE_SCRIPT = "() => { localStorage.clear(); sessionStorage.clear(); }"
+
+
+class ContextPool:
+    """Per-worker pool of warm browser contexts with a fast reset between tests.
+
+    Creating a context and page for every test is the dominant cost of short
+    tests under ``-n auto``. The pool keeps released contexts (each with one
+    blank page) and hands them back out after clearing cookies, permissions,
+    routes and the web storage of the origin the page was left on.
+
+    Things the reset cannot undo - init scripts, event listeners, extra
+    origins visited during the test - are the reason tests can opt out with
+    ``@pytest.mark.fresh_context``.
+    """
+
+    def __init__(self, browser: Browser, context_args: dict, max_idle: int = 2):
+        """
+        Args:
+            browser: Session browser the contexts are created from
+            context_args: Context arguments (from browser_context_args)
+            max_idle: Maximum number of idle contexts kept warm
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.max_idle = max_idle
+        self._idle = []
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def acquire(self) -> BrowserContext:
+        """Return a clean context, reusing an idle one when available."""
+        if self._idle:
+            self.reused += 1
+            return self._idle.pop()
+        self.created += 1
+        context = self.browser.new_context(**self.context_args)
+        context.new_page()
+        return context
+
+    def release(self, context: BrowserContext):
+        """Reset a context and return it to the pool.
+
+        Contexts that fail to reset, or that arrive when the pool is full,
+        are closed instead.
+        """
+        if len(self._idle) >= self.max_idle or not self._reset(context):
+            self.discarded += 1
+            self._close(context)
+            return
+        self._idle.append(context)
+
+    def close(self):
+        """Close every idle context."""
+        while self._idle:
+            self._close(self._idle.pop())
+
+    def stats(self):
+        """Return pool counters.
+
+        Returns:
+            dict: Number of contexts created, reused and discarded
+        """
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+    def _reset(self, context: BrowserContext):
+        """Bring a used context back to a blank state.
+
+        Returns:
+            bool: True if the context can be reused
+        """
+        try:
+            pages = context.pages
+            if not pages:
+                return False
+            page = pages[0]
+            for extra_page in pages[1:]:
+                extra_page.close()
+
+            page.unroute_all(behavior="ignoreErrors")
+            if page.url.startswith("http"):
+                page.evaluate(_CLEAR_STORAGE_SCRIPT)
+            page.goto("about:blank")
+
+            context.unroute_all(behavior="ignoreErrors")
+            context.clear_cookies()
+            context.clear_permissions()
+            return True
+        except PlaywrightError:
+            return False
+
+    @staticmethod
+    def _close(context: BrowserContext):
+        """Close a context, ignoring contexts that are already gone."""
+        try:
+            context.close()
+        except PlaywrightError:
+            pass
@@ -0,0 +1,326 @@
+import ast
+import difflib
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import textwrap
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from pathlib import Path
+
+# Test data files (without .json) the registry is built from
+DATA_FILES = ("users", "products", "checkout", "expected_data")
+
+
+class DataError(Exception):
+    """A test data file does not match the records it should hold."""
+
+
+class Section(Mapping):
+    """Records of one kind keyed by name, read as attributes or items.
+
+    ``users.standard_user`` and ``users["standard_user"]`` are the same
+    dict lookup; a missing name raises AttributeError/KeyError listing the
+    closest existing ones.
+    """
+
+    __slots__ = ("_name", "_entries")
+
+    def __init__(self, name: str, entries: dict):
+        self._name = name
+        self._entries = entries
+
+    def __getattr__(self, key):
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            return self._entries[key]
+        except KeyError:
+            raise AttributeError(self._missing(key)) from None
+
+    def __getitem__(self, key):
+        try:
+            return self._entries[key]
+        except KeyError:
+            raise KeyError(self._missing(key)) from None
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<{self._name}: {', '.join(self._entries)}>"
+
+    def _missing(self, key):
+        close = difflib.get_close_matches(str(key), self._entries, n=3)
+        hint = f"; did you mean {', '.join(close)}?" if close else ""
+        return f"{self._name} has no {key!r}{hint}"
+
+
+@dataclass(frozen=True, slots=True)
+class User:
+    """A Sauce Demo account (test_data/users.json)."""
+
+    username: str
+    password: str
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """A product of the inventory (test_data/products.json).
+
+    Attributes:
+        id: Slug used in the app's data-test attributes
+        item_id: Numeric id the app stores in the cart
+        name: Displayed name
+        description: Displayed description
+        price: Price in dollars
+        image: Image file name
+    """
+
+    id: str
+    item_id: int
+    name: str
+    description: str
+    price: float
+    image: str
+
+
+@dataclass(frozen=True, slots=True)
+class Customer:
+    """Checkout step one form input (test_data/checkout.json)."""
+
+    first_name: str
+    last_name: str
+    postal_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class InventoryExpectations:
+    """Expected inventory page values (test_data/expected_data.json)."""
+
+    total_products: int
+    expected_product_count: int
+    sort_options: Section
+
+
+@dataclass(frozen=True, slots=True)
+class CheckoutExpectations:
+    """Expected checkout values (test_data/expected_data.json)."""
+
+    tax_rate: float
+    payment_info: str
+    shipping_info: str
+    success_header: str
+    success_message: str
+
+
+@dataclass(frozen=True, slots=True)
+class Expected:
+    """Expected values of test_data/expected_data.json.
+
+    Attributes:
+        inventory: Product count and sort option values
+        checkout: Tax rate, overview labels and confirmation texts
+        errors: Error messages by situation, e.g. ``errors.locked_out``
+        urls: Page paths by page, e.g. ``urls.inventory``
+        cart_items: Product names of the standard checkout cart
+            ("expected_cart_items" of test_data/checkout.json)
+    """
+
+    inventory: InventoryExpectations
+    checkout: CheckoutExpectations
+    errors: Section
+    urls: Section
+    cart_items: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DataRegistry:
+    """All test data, parsed from test_data/*.json into typed records.
+
+    Attributes:
+        users: User records by key, e.g. ``users.standard_user``
+        products: Product records by key, e.g. ``products.sauce_labs_backpack``
+        customers: Checkout form inputs by key, e.g. ``customers.valid_customer``
+        expected: Expected values (see Expected)
+    """
+
+    users: Section
+    products: Section
+    customers: Section
+    expected: Expected
+
+
+def load_registry(data_dir, cache_dir=None) -> DataRegistry:
+    """Return the test data of ``data_dir``, parsed at most once per content.
+
+    The registry is pickled into ``cache_dir`` under a hash of this module's
+    source (which defines the record classes) and every JSON file's name and
+    bytes. Later calls - every xdist worker of the run, and later runs -
+    unpickle it instead of parsing and validating the files again, until the
+    module or a file changes.
+
+    Args:
+        data_dir: Directory holding users.json, products.json, checkout.json
+            and expected_data.json
+        cache_dir: Directory for the compiled registry (None disables caching)
+
+    Raises:
+        DataError: A file is missing, or an entry has missing, unknown or
+            mistyped fields
+    """
+    data_dir = Path(data_dir)
+    files = {name: data_dir / f"{name}.json" for name in DATA_FILES}
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    for name, path in files.items():
+        try:
+            digest.update(name.encode() + b"\0" + path.read_bytes() + b"\0")
+        except OSError as exc:
+            raise DataError(f"cannot read {path}: {exc}") from None
+
+    cached = None
+    if cache_dir is not None:
+        cached = Path(cache_dir) / f"registry-{digest.hexdigest()[:16]}.pickle"
+    if cached is not None and cached.exists():
+        try:
+            return pickle.loads(cached.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            pass
+
+    registry = parse_registry(
+        {name: json.loads(path.read_text()) for name, path in files.items()}
+    )
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        partial = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        partial.write_bytes(pickle.dumps(registry, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(partial, cached)
+    return registry
+
+
+def parse_registry(raw: dict) -> DataRegistry:
+    """Build the registry from the decoded JSON of DATA_FILES."""
+    checkout = dict(raw["checkout"])
+    cart_items = checkout.pop("expected_cart_items", [])
+    expected = raw["expected_data"]
+    return DataRegistry(
+        users=_section("users", raw["users"], User),
+        products=_section("products", raw["products"], Product),
+        customers=_section("customers", checkout, Customer),
+        expected=Expected(
+            inventory=_record(
+                InventoryExpectations,
+                {
+                    **expected["inventory"],
+                    "sort_options": Section(
+                        "sort_options", expected["inventory"]["sort_options"]
+                    ),
+                },
+                "expected_data.json inventory",
+            ),
+            checkout=_record(
+                CheckoutExpectations,
+                expected["checkout"],
+                "expected_data.json checkout",
+            ),
+            errors=Section("errors", expected["errors"]),
+            urls=Section("urls", expected["urls"]),
+            cart_items=tuple(cart_items),
+        ),
+    )
+
+
+def _section(name, entries, record):
+    for key in entries:
+        if hasattr(Section, key):
+            raise DataError(
+                f"{name} {key!r}: name is reserved by Section, rename the entry"
+            )
+    return Section(
+        name,
+        {
+            key: _record(record, entry, f"{name} {key!r}")
+            for key, entry in entries.items()
+        },
+    )
+
+
+def _record(cls, entry, where):
+    """Build a record, checking that every field is present and well typed."""
+    if not isinstance(entry, dict):
+        raise DataError(f"{where}: expected an object, got {entry!r}")
+    names = {field.name for field in fields(cls)}
+    unknown = entry.keys() - names
+    missing = names - entry.keys()
+    if missing:
+        raise DataError(f"{where}: missing fields {sorted(missing)}")
+    if unknown:
+        raise DataError(f"{where}: unknown fields {sorted(unknown)}")
+    for field in fields(cls):
+        value = entry[field.name]
+        expected = {str: str, int: int, float: (int, float)}.get(field.type)
+        if expected is not None and (
+            not isinstance(value, expected) or isinstance(value, bool)
+        ):
+            raise DataError(
+                f"{where}: {field.name} should be {field.type.__name__}, got {value!r}"
+            )
+    return cls(**entry)
+
+
+def unknown_reference(registry: DataRegistry, path: list[str]) -> str | None:
+    """Check an attribute path such as ["users", "standard_user", "password"].
+
+    Follows the path through the registry's sections and records, and stops
+    at the first plain value (str, list...). Returns the error message of the
+    first name that does not exist, or None if the path is valid.
+    """
+    target = registry
+    for name in path:
+        if not (isinstance(target, Section) or is_dataclass(target)):
+            return None
+        try:
+            target = getattr(target, name)
+        except AttributeError as exc:
+            if isinstance(target, Section):
+                return str(exc)
+            return f"{type(target).__name__} has no field {name!r}"
+    return None
+
+
+def data_references(source, name: str = "test_data"):
+    """Yield every attribute path read from a variable called ``name``.
+
+    ``test_data.users.standard_user.password`` yields
+    ``(["users", "standard_user", "password"], line)``.
+
+    Args:
+        source: Module or function to scan; yields nothing when its source
+            is unavailable
+        name: Name the registry goes by, e.g. the fixture argument
+    """
+    try:
+        lines, first = inspect.getsourcelines(source)
+    except (OSError, TypeError):
+        return
+    # Modules start at line 0, functions at their first line
+    first = max(first, 1)
+    tree = ast.parse(textwrap.dedent("".join(lines)))
+    attributes = [node for node in ast.walk(tree) if isinstance(node, ast.Attribute)]
+    # Only whole chains: test_data.users.standard_user, not test_data.users too
+    inner = {id(node.value) for node in attributes}
+    for node in attributes:
+        if id(node) in inner or not isinstance(node.ctx, ast.Load):
+            continue
+        path = []
+        target = node
+        while isinstance(target, ast.Attribute):
+            path.append(target.attr)
+            target = target.value
+        if isinstance(target, ast.Name) and target.id == name:
+            yield path[::-1], first + node.lineno - 1
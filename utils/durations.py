@@ -0,0 +1,380 @@
+import itertools
+import json
+import os
+import statistics
+from collections.abc import Callable
+from pathlib import Path
+
+from xdist.scheduler import LoadScheduling
+
+# Estimate for a test when neither it nor anything else has history, in seconds
+DEFAULT_ESTIMATE = 1.0
+
+# Tests queued on each worker at a time. xdist workers need two to know the
+# next item; more would commit tests to a worker before it is known to be free.
+PREFETCH = 2
+
+# Approximate resident memory of one worker's browser (process tree plus a
+# context and page of the Sauce Demo app), in MB
+BROWSER_MEMORY_MB = {"chromium": 350, "firefox": 500, "webkit": 400}
+
+
+def available_memory_mb() -> int | None:
+    """Return the memory available for new processes, or None if unknown."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def size_pools(
+    work: dict[str, float],
+    workers: int,
+    requested: dict[str, int] | None = None,
+    memory_mb: int | None = None,
+) -> dict[str, int]:
+    """Split workers into one pool per browser.
+
+    Without ``requested`` sizes, each browser gets workers in proportion to
+    its estimated work, at least one. Pools are then shrunk until they fit
+    in ``workers`` and, if given, until their browsers fit in ``memory_mb``
+    (see BROWSER_MEMORY_MB); each step takes a worker from the pool whose
+    remaining workers would have the least work each, so the pools keep
+    finishing at about the same time.
+
+    Args:
+        work: Estimated seconds of tests per browser
+        workers: Workers available for browser tests
+        requested: Explicit pool sizes by browser (--browser-workers)
+        memory_mb: Memory available for browsers
+
+    Returns:
+        dict: Workers per browser, each at least one
+    """
+    if requested:
+        sizes = {browser: max(requested.get(browser, 1), 1) for browser in work}
+    else:
+        total = sum(work.values()) or 1.0
+        shares = {
+            browser: seconds / total * workers for browser, seconds in work.items()
+        }
+        sizes = {browser: max(int(share), 1) for browser, share in shares.items()}
+        for browser in sorted(shares, key=lambda b: int(shares[b]) - shares[b]):
+            if sum(sizes.values()) >= workers:
+                break
+            sizes[browser] += 1
+
+    def footprint():
+        return sum(
+            size * BROWSER_MEMORY_MB.get(browser, max(BROWSER_MEMORY_MB.values()))
+            for browser, size in sizes.items()
+        )
+
+    while sum(sizes.values()) > workers or (
+        memory_mb is not None and footprint() > memory_mb
+    ):
+        shrinkable = [browser for browser, size in sizes.items() if size > 1]
+        if not shrinkable:
+            break
+        browser = min(shrinkable, key=lambda b: work[b] / (sizes[b] - 1))
+        sizes[browser] -= 1
+    return sizes
+
+
+class DurationHistory:
+    """Per-test durations of earlier runs, kept in a small JSON file.
+
+    Each run's duration of a test (setup + call + teardown) is blended into
+    the stored value with exponential smoothing, so one slow run does not
+    dominate the estimate. Tests without history are estimated from the
+    median of their module, then of the whole suite, then DEFAULT_ESTIMATE.
+    """
+
+    def __init__(self, path, smoothing: float = 0.5):
+        """
+        Args:
+            path: JSON file of {nodeid: seconds}; missing or unreadable
+                files start an empty history
+            smoothing: Weight of the newest run (1 keeps only the last run)
+        """
+        self.path = Path(path)
+        self.smoothing = smoothing
+        try:
+            self.durations = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self.durations = {}
+        self._defaults = None
+
+    def estimate(self, nodeid: str) -> float:
+        """Return the expected duration of a test, in seconds."""
+        known = self.durations.get(nodeid)
+        if known is not None:
+            return known
+        if self._defaults is None:
+            self._defaults = self._module_medians()
+        module = nodeid.split("::", 1)[0]
+        return self._defaults.get(module, self._defaults.get(None, DEFAULT_ESTIMATE))
+
+    def update(self, measured: dict[str, float]):
+        """Blend one run's durations into the history.
+
+        Args:
+            measured: Seconds by test node id
+        """
+        for nodeid, seconds in measured.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = seconds
+            else:
+                self.durations[nodeid] = previous + self.smoothing * (
+                    seconds - previous
+                )
+        self._defaults = None
+
+    def save(self):
+        """Write the history, replacing the file atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps(self.durations, indent=0, sort_keys=True))
+        os.replace(partial, self.path)
+
+    def _module_medians(self):
+        """Median duration per module, plus the suite median under None."""
+        by_module = {}
+        for nodeid, seconds in self.durations.items():
+            by_module.setdefault(nodeid.split("::", 1)[0], []).append(seconds)
+        medians = {
+            module: statistics.median(values) for module, values in by_module.items()
+        }
+        if self.durations:
+            medians[None] = statistics.median(self.durations.values())
+        return medians
+
+
+class DurationScheduling(LoadScheduling):
+    """xdist load scheduling that hands out the longest tests first.
+
+    Pending tests are ordered by their DurationHistory estimate, longest
+    first, and every worker only holds PREFETCH of them at a time; a worker
+    that finishes gets the longest test still pending. Long flows therefore
+    start early instead of landing together at the end of the run, and the
+    run's wall-clock time approaches the total work divided by the number of
+    workers. Tests with equal estimates keep their collection order, which
+    is all that happens without a history.
+
+    When the run mixes browserless tests (``browserless(nodeid)``) with
+    browser tests, up to ``browserless_workers`` workers are reserved for the
+    browserless ones. They never get a browser test, so they never launch a
+    browser, and shut down once the browserless tests are handed out.
+    Browser workers take browserless tests only when no browser test is
+    left. At least one worker always stays a browser worker.
+
+    When the browser tests run in several browsers (``browser_of(nodeid)``,
+    e.g. ``--browser chromium --browser firefox``), the browser workers are
+    split into one pool per browser (see size_pools) and only run that
+    browser's tests, so every worker launches a single browser. Workers left
+    over by the memory limit join the browserless workers.
+
+    Async page tests (``async_page(nodeid)``) launch a second, async browser
+    in their worker (see PageScheduler). When a run or pool mixes them with
+    sync browser tests, its workers are split between the two in proportion
+    to their estimated work, async work divided by ``pages_per_worker`` as
+    that many of those tests run at once, so every worker still launches a
+    single browser. Only a pool of one worker runs both.
+    """
+
+    def __init__(
+        self,
+        config,
+        log=None,
+        history: DurationHistory | None = None,
+        browserless: Callable[[str], bool] | None = None,
+        browserless_workers: int = 0,
+        browser_of: Callable[[str], str | None] | None = None,
+        pool_sizes: dict[str, int] | None = None,
+        async_page: Callable[[str], bool] | None = None,
+        pages_per_worker: int = 1,
+    ):
+        super().__init__(config, log)
+        self.history = history
+        self.browserless = browserless
+        self.browserless_workers = browserless_workers
+        self.browser_of = browser_of
+        self.pool_sizes = pool_sizes
+        self.async_page = async_page
+        self.pages_per_worker = pages_per_worker
+        self.lane_nodes = set()
+        self.lane_tests = set()
+        # Workers per browser, the browser of every pooled worker and the
+        # browser of every test (empty unless the run uses several browsers)
+        self.pools = {}
+        self.node2browser = {}
+        self.test_browsers = []
+        # Async page tests, and the browser workers split off to run them or
+        # the sync browser tests (empty unless the run mixes the two)
+        self.async_tests = set()
+        self.async_nodes = set()
+        self.sync_nodes = set()
+        self.estimated_work = 0.0
+        self.known = 0
+        self.workers = 0
+
+    def schedule(self):
+        """Order the collection by estimated duration and start every worker."""
+        assert self.collection_is_completed
+
+        # Initial distribution already happened (a worker was replaced)
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if self.history is not None:
+            estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+            self.known = sum(
+                nodeid in self.history.durations for nodeid in self.collection
+            )
+        else:
+            estimates = [DEFAULT_ESTIMATE] * len(self.collection)
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda i: -estimates[i]
+        )
+        self.estimated_work = sum(estimates)
+        self.workers = len(self.nodes)
+        if not self.collection:
+            return
+
+        if self.browserless is not None:
+            self.lane_tests = {
+                index
+                for index, nodeid in enumerate(self.collection)
+                if self.browserless(nodeid)
+            }
+        if self.lane_tests and len(self.lane_tests) < len(self.collection):
+            reserved = min(
+                self.browserless_workers, len(self.nodes) - 1, len(self.lane_tests)
+            )
+            self.lane_nodes = set(self.nodes[:reserved])
+
+        if self.browser_of is not None:
+            self._split_pools(estimates)
+        if self.async_page is not None:
+            self._split_async(estimates)
+
+        for node in self.nodes:
+            self._send_tests(node, PREFETCH)
+            if not self.node2pending[node]:
+                node.shutdown()
+        if not self.pending:
+            for node in self.nodes:
+                if not node.shutting_down:
+                    node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        """Top a worker back up to PREFETCH tests, or shut it down when done."""
+        if node.shutting_down:
+            return
+        if any(self._fit(node, index) is not None for index in self.pending):
+            missing = PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        self.log("num items waiting for node:", len(self.pending))
+
+    def _split_pools(self, estimates):
+        """Assign every browser worker to the pool of one browser."""
+        browsers = [self.browser_of(nodeid) for nodeid in self.collection]
+        work = {}
+        for index, browser in enumerate(browsers):
+            if browser is not None and index not in self.lane_tests:
+                work[browser] = work.get(browser, 0.0) + estimates[index]
+        free = [node for node in self.nodes if node not in self.lane_nodes]
+        if len(work) < 2 or len(free) < len(work):
+            return
+        self.test_browsers = browsers
+        self.pools = size_pools(work, len(free), self.pool_sizes, available_memory_mb())
+        assigned = iter(free)
+        for browser, size in sorted(self.pools.items()):
+            for node in itertools.islice(assigned, size):
+                self.node2browser[node] = browser
+        self.lane_nodes.update(assigned)
+
+    def _split_async(self, estimates):
+        """Split the browser workers of every pool (or of the whole run)
+        between async page tests and sync browser tests."""
+        self.async_tests = {
+            index
+            for index, nodeid in enumerate(self.collection)
+            if index not in self.lane_tests and self.async_page(nodeid)
+        }
+        if not self.async_tests:
+            return
+        groups = {}
+        for node in self.nodes:
+            if node not in self.lane_nodes:
+                groups.setdefault(self.node2browser.get(node), []).append(node)
+        for browser, nodes in groups.items():
+            async_work = sync_work = 0.0
+            for index in range(len(self.collection)):
+                if index in self.lane_tests:
+                    continue
+                if browser is not None and self.test_browsers[index] not in (
+                    None,
+                    browser,
+                ):
+                    continue
+                if index in self.async_tests:
+                    async_work += estimates[index] / self.pages_per_worker
+                else:
+                    sync_work += estimates[index]
+            if not async_work or not sync_work or len(nodes) < 2:
+                continue
+            count = round(len(nodes) * async_work / (async_work + sync_work))
+            count = min(max(count, 1), len(nodes) - 1)
+            self.async_nodes.update(nodes[:count])
+            self.sync_nodes.update(nodes[count:])
+
+    def _fit(self, node, index):
+        """0 if the node should run the test, 1 if it may once nothing of
+        its own is left, None if it must not."""
+        if index in self.lane_tests:
+            return 0 if node in self.lane_nodes else 1
+        if node in self.lane_nodes:
+            return None
+        if node in self.async_nodes and index not in self.async_tests:
+            return None
+        if node in self.sync_nodes and index in self.async_tests:
+            return None
+        browser = self.node2browser.get(node)
+        if browser is None or self.test_browsers[index] in (None, browser):
+            return 0
+        return None
+
+    def _send_tests(self, node, num):
+        """Send the node the longest ``num`` pending tests of its lane.
+
+        Browser workers fall back to browserless tests once none of their
+        own are pending; browserless workers never get a browser test,
+        pooled workers never get another browser's, and workers split off
+        for async page tests or sync browser tests never get the other kind.
+        """
+        fits = [(index, self._fit(node, index)) for index in self.pending]
+        chosen = [index for index, fit in fits if fit == 0][:num]
+        if len(chosen) < num:
+            chosen += [index for index, fit in fits if fit == 1][: num - len(chosen)]
+        if not chosen:
+            return
+        taken = set(chosen)
+        self.pending[:] = [index for index in self.pending if index not in taken]
+        self.node2pending[node].extend(chosen)
+        node.send_runtest_some(chosen)
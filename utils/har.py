@@ -0,0 +1,149 @@
+import json
+import os
+import uuid
+from pathlib import Path
+
+from playwright.sync_api import BrowserContext, Route
+
+
+class HarRouter:
+    """Record the application's traffic into a HAR archive, or replay it.
+
+    Record mode attaches a HAR recorder to every context. Each context writes
+    its own fragment into a ``<archive>.parts`` directory when it closes (so
+    xdist workers never write the same file), and merge_fragments() folds the
+    fragments into the archive at the end of the session.
+
+    Replay mode serves every request from the archive through
+    ``context.route_from_har``. Requests the archive cannot answer are not
+    passed through to the network: they are aborted and listed in
+    ``unmatched`` so the run can report them.
+    """
+
+    def __init__(self, path, mode: str):
+        """
+        Args:
+            path: HAR archive to record into or replay from
+            mode: "record" or "replay"
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown HAR mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.unmatched = []
+
+    @property
+    def parts_dir(self) -> Path:
+        """Directory holding the per-context fragments of a recording."""
+        return self.path.with_name(self.path.name + ".parts")
+
+    def apply(self, context: BrowserContext):
+        """Attach recording or replay routing to a context."""
+        if self.mode == "record":
+            self.parts_dir.mkdir(parents=True, exist_ok=True)
+            fragment = self.parts_dir / f"{os.getpid()}-{uuid.uuid4().hex}.har"
+            context.route_from_har(
+                fragment, update=True, update_content="embed", update_mode="minimal"
+            )
+            return
+
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"HAR archive {self.path} not found - record it first with "
+                f"--record-har {self.path}"
+            )
+        # Routes run in reverse registration order: the archive is consulted
+        # first and only falls back to the catch-all for unknown requests.
+        context.route("**/*", self._unmatched)
+        context.route_from_har(self.path, not_found="fallback")
+
+    async def apply_async(self, context) -> list[str]:
+        """Attach recording or replay routing to a ``playwright.async_api``
+        context.
+
+        Returns:
+            list: The requests of this context the archive could not answer
+            (filled while it runs; also added to ``unmatched``)
+        """
+        unmatched = []
+        if self.mode == "record":
+            self.parts_dir.mkdir(parents=True, exist_ok=True)
+            fragment = self.parts_dir / f"{os.getpid()}-{uuid.uuid4().hex}.har"
+            await context.route_from_har(
+                fragment, update=True, update_content="embed", update_mode="minimal"
+            )
+            return unmatched
+
+        if not self.path.exists():
+            raise FileNotFoundError(
+                f"HAR archive {self.path} not found - record it first with "
+                f"--record-har {self.path}"
+            )
+
+        async def abort_unmatched(route):
+            request = route.request
+            unmatched.append(f"{request.method} {request.url}")
+            self.unmatched.append(unmatched[-1])
+            await route.abort("internetdisconnected")
+
+        await context.route("**/*", abort_unmatched)
+        await context.route_from_har(self.path, not_found="fallback")
+        return unmatched
+
+    def _unmatched(self, route: Route):
+        """Abort and remember a request the archive has no entry for."""
+        request = route.request
+        self.unmatched.append(f"{request.method} {request.url}")
+        route.abort("internetdisconnected")
+
+    def sizes(self) -> dict:
+        """Return the response body size in bytes of every archived URL.
+
+        Returns:
+            dict: Size by URL, for GET requests whose size the archive records
+        """
+        with open(self.path) as f:
+            entries = json.load(f)["log"]["entries"]
+        sizes = {}
+        for entry in entries:
+            response = entry["response"]
+            size = response.get("bodySize", -1)
+            if size < 0:
+                size = response.get("content", {}).get("size", -1)
+            if entry["request"]["method"] == "GET" and size >= 0:
+                sizes[entry["request"]["url"]] = size
+        return sizes
+
+    def merge_fragments(self):
+        """Merge every recorded fragment into the archive and remove them.
+
+        Later recordings of the same request replace earlier ones.
+
+        Returns:
+            int: Number of entries in the merged archive
+        """
+        fragments = sorted(self.parts_dir.glob("*.har"))
+        if not fragments:
+            return 0
+
+        merged = None
+        entries = {}
+        for fragment in fragments:
+            with open(fragment) as f:
+                har = json.load(f)
+            if merged is None:
+                merged = har
+            for entry in har["log"]["entries"]:
+                request = entry["request"]
+                post_data = request.get("postData", {}).get("text")
+                entries[(request["method"], request["url"], post_data)] = entry
+
+        merged["log"]["entries"] = list(entries.values())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(merged, f)
+
+        for fragment in fragments:
+            fragment.unlink()
+        self.parts_dir.rmdir()
+        return len(entries)
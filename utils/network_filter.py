@@ -0,0 +1,194 @@
+import base64
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import Page, Response, Route
+
+# Smallest valid image: a 1x1 transparent GIF. Stubbed images keep a non-empty
+# bounding box, so visibility checks on <img> elements still pass.
+STUB_IMAGE = base64.b64decode(
+    "R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+)
+
+# Resource types answered with a stub instead of going to the network
+STUBBED_TYPES = ("image",)
+
+# Resource types aborted outright
+BLOCKED_TYPES = ("font", "media")
+
+# Sizes of assets in bytes by URL, shared by every filter in this worker and
+# used for the bytes a blocked request would have cost: measured with a HEAD
+# request the first time a filter blocks the URL, taken from a HAR archive
+# (learn_sizes) or seen in an unfiltered test (record_sizes)
+_known_sizes = {}
+
+
+class AssetFilter:
+    """Request filtering profile for UI tests that never look at pixels.
+
+    Installed with ``page.route`` on every URL. Images are answered with a
+    1x1 GIF, fonts and media are aborted, and any non-document request to a
+    host other than the application's (telemetry, analytics) is aborted.
+    Everything else - documents, scripts, stylesheets, XHR - goes through.
+
+    Blocked requests are counted per resource type, and bytes saved from the
+    size of each blocked asset (stubs are served from memory, so the whole
+    asset is saved). The first time a worker blocks a first-party URL whose
+    size is not known yet, its Content-Length is read with a HEAD request
+    through the page's request context; with ``measure=False`` (replaying a
+    HAR archive, where nothing may reach the network) only sizes already
+    known are used. Third-party requests are never measured; they and
+    assets without a Content-Length are counted as unknown_size.
+    """
+
+    def __init__(self, app_url: str, measure: bool = True):
+        """
+        Args:
+            app_url: Any URL of the application under test, used to tell
+                first-party hosts from third-party ones
+            measure: Read unknown asset sizes with a HEAD request
+        """
+        self.app_host = urlsplit(app_url).hostname
+        self.measure = measure
+        self.blocked = {}
+        self.bytes_saved = 0
+        self.unknown_size = 0
+
+    def install(self, page: Page):
+        """Start filtering the page's requests."""
+        page.route("**/*", self._handle)
+        return self
+
+    async def install_async(self, page):
+        """Start filtering the requests of a ``playwright.async_api`` page."""
+        await page.route("**/*", self._handle_async)
+        return self
+
+    def summary(self):
+        """Return the filter counters for reporting.
+
+        Returns:
+            dict: Total blocked requests, per-type counts, bytes saved and
+            number of blocked requests of unknown size
+        """
+        return {
+            "blocked_requests": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "bytes_saved": self.bytes_saved,
+            "unknown_size": self.unknown_size,
+        }
+
+    def _handle(self, route: Route):
+        """Stub, abort or continue a single request."""
+        request = route.request
+        action = self._action(request)
+        if action == "stub":
+            route.fulfill(status=200, content_type="image/gif", body=STUB_IMAGE)
+        elif action == "abort":
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+            return
+        # Measured after answering the route, so the page does not wait for it
+        if self._should_measure(request.url):
+            try:
+                response = request.frame.page.request.head(request.url)
+                self._learn_size(request.url, response)
+                response.dispose()
+            except PlaywrightError:
+                # Size is best effort; the page may already be closing
+                _known_sizes[request.url] = None
+        self._add_size(request.url)
+
+    async def _handle_async(self, route):
+        """Stub, abort or continue a single request of an async page."""
+        request = route.request
+        action = self._action(request)
+        if action == "stub":
+            await route.fulfill(status=200, content_type="image/gif", body=STUB_IMAGE)
+        elif action == "abort":
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+            return
+        if self._should_measure(request.url):
+            try:
+                response = await request.frame.page.request.head(request.url)
+                self._learn_size(request.url, response)
+                await response.dispose()
+            except PlaywrightError:
+                _known_sizes[request.url] = None
+        self._add_size(request.url)
+
+    def _action(self, request):
+        """Decide what happens to a request and count it if it is blocked.
+
+        Returns:
+            str: "stub", "abort" or "continue"
+        """
+        resource_type = request.resource_type
+        third_party = (
+            resource_type != "document"
+            and urlsplit(request.url).hostname != self.app_host
+        )
+
+        if resource_type in STUBBED_TYPES and not third_party:
+            self._count(resource_type)
+            return "stub"
+        if third_party or resource_type in BLOCKED_TYPES:
+            self._count("third_party" if third_party else resource_type)
+            return "abort"
+        return "continue"
+
+    def _count(self, category: str):
+        """Record one blocked request."""
+        self.blocked[category] = self.blocked.get(category, 0) + 1
+
+    def _should_measure(self, url: str) -> bool:
+        """Whether a blocked URL's size should be read with a HEAD request."""
+        return (
+            self.measure
+            and url not in _known_sizes
+            and urlsplit(url).hostname == self.app_host
+        )
+
+    def _learn_size(self, url: str, response):
+        """Remember the Content-Length of a HEAD response (None if it has
+        none or failed)."""
+        length = response.headers.get("content-length", "") if response.ok else ""
+        _known_sizes[url] = int(length) if length.isdigit() else None
+
+    def _add_size(self, url: str):
+        """Add what a blocked request would have cost to bytes_saved."""
+        size = _known_sizes.get(url)
+        if size is None:
+            self.unknown_size += 1
+        else:
+            self.bytes_saved += size
+
+
+def learn_sizes(sizes: dict):
+    """Add asset sizes in bytes by URL (e.g. HarRouter.sizes()) to the ones
+    every filter of this worker uses."""
+    _known_sizes.update(sizes)
+
+
+def record_sizes(page: Page):
+    """Learn asset sizes from an unfiltered page for later bytes-saved reports.
+
+    Returns:
+        Callable: The response listener, for ``page.remove_listener("response", ...)``
+    """
+
+    def _on_response(response: Response):
+        if response.request.resource_type in STUBBED_TYPES + BLOCKED_TYPES:
+            try:
+                _known_sizes[response.url] = response.request.sizes()[
+                    "responseBodySize"
+                ]
+            except PlaywrightError:
+                # Size is best effort; the page may already be closing
+                pass
+
+    page.on("response", _on_response)
+    return _on_response
@@ -0,0 +1,197 @@
+import ast
+import asyncio
+import concurrent.futures
+import contextlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from playwright.async_api import Page, async_playwright
+
+from .har import HarRouter
+from .network_filter import AssetFilter
+from .sleep_guard import SleepGuard
+
+
+class PageScheduler:
+    """Runs async page tests of one worker concurrently on a single browser.
+
+    Owns an asyncio event loop on a background thread, with one
+    ``playwright.async_api`` browser launched on it. Every submitted test
+    gets its own browser context and page, so tests stay isolated while
+    sharing the browser process; up to ``concurrency`` of them run at once.
+    Raising the concurrency adds contexts, which cost far less memory than
+    the extra browser of another xdist worker.
+
+    ``submit`` is called from the pytest thread and returns a
+    ``concurrent.futures.Future`` with the test's outcome.
+    """
+
+    def __init__(
+        self,
+        browser_name: str,
+        launch_args: dict,
+        context_args: dict,
+        concurrency: int = 1,
+        default_timeout: float = 10_000,
+        har_router: HarRouter | None = None,
+    ):
+        """
+        Args:
+            browser_name: "chromium", "firefox" or "webkit"
+            launch_args: Browser launch arguments (from browser_type_launch_args)
+            context_args: Context arguments (from browser_context_args)
+            concurrency: Maximum tests in flight at once
+            default_timeout: Default action timeout of every page, in ms
+            har_router: Records or replays every context's traffic, if given
+        """
+        self.browser_name = browser_name
+        self.launch_args = launch_args
+        self.context_args = context_args
+        self.concurrency = concurrency
+        self.default_timeout = default_timeout
+        self.har_router = har_router
+        self.ran = 0
+        self.peak = 0
+        self._running = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="page-scheduler", daemon=True
+        )
+        self._playwright = None
+        self._browser = None
+
+    def start(self):
+        """Start the event loop and launch the browser."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._launch(), self._loop).result()
+        return self
+
+    def submit(
+        self,
+        test: Callable[..., Awaitable],
+        kwargs: dict,
+        page_arg: str = "async_page",
+        asset_filter: AssetFilter | None = None,
+        sleep_guard: SleepGuard | None = None,
+    ) -> concurrent.futures.Future:
+        """Schedule one test on a fresh context and page.
+
+        Args:
+            test: The coroutine test function
+            kwargs: Its other arguments (already resolved fixture values)
+            page_arg: Argument that receives the page
+            asset_filter: Filter installed on the page before the test, if any
+            sleep_guard: Guard installed in the test's task while it runs, if any
+
+        Returns:
+            Future: Resolves to a dict with the exception the test raised
+            ("error", None if it passed), its start time and duration, the
+            filter's summary ("assets", None without a filter) and the
+            requests a replayed HAR archive could not answer
+            ("har_unmatched", None without a HAR router); the guard keeps
+            the sleeps it caught. Fails only if the context or page could
+            not be created.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._run(test, kwargs, page_arg, asset_filter, sleep_guard), self._loop
+        )
+
+    def close(self):
+        """Close the browser and stop the event loop."""
+        if self._browser is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def stats(self):
+        """Return scheduler counters.
+
+        Returns:
+            dict: Tests run and the most tests that were in flight at once
+        """
+        return {"ran": self.ran, "peak": self.peak}
+
+    async def _launch(self):
+        self._playwright = await async_playwright().start()
+        browser_type = getattr(self._playwright, self.browser_name)
+        self._browser = await browser_type.launch(**self.launch_args)
+
+    async def _shutdown(self):
+        await self._browser.close()
+        await self._playwright.stop()
+
+    async def _run(self, test, kwargs, page_arg, asset_filter, sleep_guard):
+        context = await self._browser.new_context(**self.context_args)
+        try:
+            unmatched = None
+            if self.har_router is not None:
+                unmatched = await self.har_router.apply_async(context)
+            page: Page = await context.new_page()
+            page.set_default_timeout(self.default_timeout)
+            if asset_filter is not None:
+                await asset_filter.install_async(page)
+
+            self._running += 1
+            self.peak = max(self.peak, self._running)
+            start, started = time.time(), time.perf_counter()
+            error = None
+            try:
+                # Installed in this task only, so concurrent tests each see
+                # their own sleeps
+                with sleep_guard or contextlib.nullcontext():
+                    await test(**kwargs, **{page_arg: page})
+            except asyncio.CancelledError:
+                raise
+            except BaseException as exc:  # includes pytest.fail() / pytest.skip()
+                error = exc
+            finally:
+                self._running -= 1
+                self.ran += 1
+            return {
+                "error": error,
+                "start": start,
+                "duration": time.perf_counter() - started,
+                "assets": asset_filter.summary() if asset_filter is not None else None,
+                "har_unmatched": unmatched,
+            }
+        finally:
+            await context.close()
+
+
+def async_page_tests(path) -> set[str]:
+    """Return the async page tests defined in a test module.
+
+    The xdist controller only sees test ids, so they are found in the
+    source: ``async def`` functions, at module level or in a class, that
+    take an ``async_page`` argument.
+
+    Args:
+        path: Test module; a missing or unparsable file has none
+
+    Returns:
+        set: Test names as they appear in node ids, e.g. "test_login" or
+        "TestLogin::test_login", without parameter ids
+    """
+    try:
+        tree = ast.parse(Path(path).read_text())
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    names = set()
+
+    def scan(body, prefix):
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                scan(node.body, f"{prefix}{node.name}::")
+            elif isinstance(node, ast.AsyncFunctionDef):
+                arguments = (
+                    node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+                )
+                if any(argument.arg == "async_page" for argument in arguments):
+                    names.add(f"{prefix}{node.name}")
+
+    scan(tree.body, "")
+    return names
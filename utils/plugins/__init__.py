@@ -0,0 +1,5 @@
+"""pytest plugins of the suite, registered by conftest.py through pytest_plugins.
+
+Each module owns one feature's options, fixtures, hooks and terminal
+summary section, so conftest.py keeps only the shared fixtures.
+"""
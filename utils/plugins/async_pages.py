@@ -0,0 +1,282 @@
+"""Async page tests: ``async def`` tests using ``async_page`` run several at a
+time per worker on the page scheduler (see utils.PageScheduler)."""
+
+import concurrent.futures
+import inspect
+
+import pytest
+
+# Function-scoped fixtures that do nothing for an async page test
+# (pytest-playwright's _pw_trace_api_requests only acts for tests using the
+# sync ``playwright`` fixture); any other fixture that is not session-scoped
+# could be torn down while the test is still running
+ASYNC_PAGE_INERT_FIXTURES = (
+    "async_page",
+    "sleep_guard",
+    "configure_page",
+    "asset_filter",
+    "_pw_trace_api_requests",
+)
+
+# Async page tests of this worker that were set up and torn down but whose
+# call phase has not been reported yet: (item, setup, future, teardown)
+_pending_async_pages = []
+
+# Tests run and peak concurrency of the page schedulers (merged across xdist
+# workers on the controller)
+_page_scheduler_counts = {"ran": 0, "peak": 0}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "Sauce Demo test options")
+    group.addoption(
+        "--pages-per-worker",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Run up to N async page tests (tests using async_page) at once "
+        "in each worker, each in its own context on the worker's one browser.",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--pages-per-worker") < 1:
+        raise pytest.UsageError("--pages-per-worker must be at least 1")
+
+
+def _uses_async_page(item):
+    return "async_page" in getattr(item, "fixturenames", ())
+
+
+@pytest.fixture(scope="session")
+def page_scheduler(
+    pytestconfig,
+    browser_name,
+    browser_type_launch_args,
+    browser_context_args,
+    har_router,
+):
+    """Per-worker async browser that runs async page tests concurrently.
+
+    Started the first time a worker runs a test using async_page; see
+    utils.PageScheduler. --pages-per-worker sets how many of those tests
+    run at once. Every context records or replays --record-har /
+    --replay-har like the sync context fixture.
+    """
+    from utils import PageScheduler
+
+    scheduler = PageScheduler(
+        browser_name,
+        browser_type_launch_args,
+        browser_context_args,
+        concurrency=pytestconfig.getoption("--pages-per-worker"),
+        har_router=har_router,
+    ).start()
+    yield scheduler
+    stats = scheduler.stats()
+    _page_scheduler_counts["ran"] += stats["ran"]
+    _page_scheduler_counts["peak"] = max(_page_scheduler_counts["peak"], stats["peak"])
+    scheduler.close()
+
+
+@pytest.fixture
+def async_page(page_scheduler, asset_filter, sleep_guard):
+    """A ``playwright.async_api`` page in a fresh context, for ``async def`` tests.
+
+    Tests using it are run by the page scheduler rather than pytest's call
+    phase, so up to --pages-per-worker of them run at the same time in one
+    worker. They drive the page with the async page objects in models.aio:
+
+        async def test_login(async_page, test_data):
+            login_page = await LoginPage(async_page).navigate()
+
+    Besides async_page they may only use session-scoped fixtures, which stay
+    up until every test that holds them has finished. The test's asset
+    filter and sleep guard (see the asset_filter and sleep_guard fixtures)
+    are installed on its page and in its task. The fixture value itself is
+    the function that schedules the test; the test receives the page.
+    """
+    from functools import partial
+
+    return partial(
+        page_scheduler.submit, asset_filter=asset_filter, sleep_guard=sleep_guard
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Reject async page tests the page scheduler cannot run."""
+    fixtures = config.pluginmanager.get_plugin("funcmanage")
+    for item in items:
+        if not _uses_async_page(item):
+            continue
+        if not inspect.iscoroutinefunction(item.obj):
+            raise pytest.UsageError(
+                f"{item.nodeid}: async_page needs an async def test"
+            )
+        # Parametrized arguments are plain values, not fixtures to tear down
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        for name in item.fixturenames:
+            if name in params or name in ASYNC_PAGE_INERT_FIXTURES:
+                continue
+            fixturedefs = fixtures.getfixturedefs(name, item)
+            if fixturedefs and fixturedefs[-1].scope != "session":
+                raise pytest.UsageError(
+                    f"{item.nodeid}: async page tests can only use session-scoped "
+                    f"fixtures besides async_page, not {fixturedefs[-1].scope}-"
+                    f"scoped {name!r}"
+                )
+
+
+def _run_phase(item, when, **kwargs):
+    """Run the setup or teardown phase of a test and build its report."""
+    hook = getattr(item.ihook, f"pytest_runtest_{when}")
+    call = pytest.CallInfo.from_call(
+        lambda: hook(item=item, **kwargs),
+        when=when,
+        reraise=(pytest.exit.Exception, KeyboardInterrupt),
+    )
+    return item.ihook.pytest_runtest_makereport(item=item, call=call)
+
+
+def _report_async_page(item, setup, future, teardown):
+    """Log the setup, call and teardown reports of a finished async page test."""
+    ihook = item.ihook
+    ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = [setup]
+    if future is not None:
+        result = {}
+
+        def outcome():
+            result.update(future.result())
+            if result["error"] is not None:
+                raise result["error"]
+
+        call = pytest.CallInfo.from_call(
+            outcome, when="call", reraise=(pytest.exit.Exception, KeyboardInterrupt)
+        )
+        if result:
+            # Time the test itself, not the wait for its result
+            call.start = result["start"]
+            call.duration = result["duration"]
+            call.stop = result["start"] + result["duration"]
+        reports.append(ihook.pytest_runtest_makereport(item=item, call=call))
+        if result.get("assets") is not None:
+            assets = result["assets"]
+            teardown.user_properties.append(
+                ("blocked_requests", assets["blocked_requests"])
+            )
+            teardown.user_properties.append(("bytes_saved", assets["bytes_saved"]))
+        if result.get("har_unmatched"):
+            teardown.user_properties.append(("har_unmatched", result["har_unmatched"]))
+        guard = item.funcargs.get("sleep_guard")
+        if guard is not None and guard.reported:
+            teardown.user_properties.append(
+                ("hard_sleeps", guard.describe(item.config.rootpath))
+            )
+    reports.append(teardown)
+    for report in reports:
+        ihook.pytest_runtest_logreport(report=report)
+    ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+
+def _wait_for_async_pages(running: int, futures=()):
+    """Wait until at most ``running`` async page tests are in flight.
+
+    Args:
+        running: Tests that may still be running afterwards
+        futures: Futures of tests that were scheduled but not queued yet
+    """
+    while True:
+        in_flight = [
+            future
+            for future in [*futures, *(pending[2] for pending in _pending_async_pages)]
+            if future is not None and not future.done()
+        ]
+        if len(in_flight) <= running:
+            break
+        concurrent.futures.wait(
+            in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+
+
+def _flush_async_pages(running: int):
+    """Wait until at most ``running`` async page tests are in flight, then
+    report every finished one in the order they were scheduled."""
+    _wait_for_async_pages(running)
+    while _pending_async_pages:
+        item, setup, future, teardown = _pending_async_pages[0]
+        if future is not None and not future.done():
+            break
+        _pending_async_pages.pop(0)
+        _report_async_page(item, setup, future, teardown)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Run async page tests on the page scheduler, several at a time.
+
+    Setup and teardown run in order like any other test; since an async page
+    test only holds session-scoped fixtures, its teardown does not wait for
+    the test. The test itself runs on the worker's page scheduler, and its
+    reports are logged once it finishes. The next test starts while up to
+    --pages-per-worker are still running. Before any other kind of test and
+    at the end of the worker's queue, every running test is waited for
+    before the teardown, which may tear down the fixtures they hold (the
+    page scheduler among them), and the queue is drained.
+    """
+    if not _uses_async_page(item):
+        return None
+
+    setup = _run_phase(item, "setup")
+    future = None
+    if setup.passed:
+        args = {
+            name: item.funcargs[name] for name in inspect.signature(item.obj).parameters
+        }
+        schedule = args.pop("async_page")
+        future = schedule(item.obj, args, page_arg="async_page")
+
+    last = nextitem is None or not _uses_async_page(nextitem)
+    if last:
+        _wait_for_async_pages(0, futures=[future])
+    teardown = _run_phase(item, "teardown", nextitem=nextitem)
+    _pending_async_pages.append((item, setup, future, teardown))
+
+    if last:
+        _flush_async_pages(0)
+    else:
+        _flush_async_pages(item.config.getoption("--pages-per-worker") - 1)
+    return True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtestloop(session):
+    """Report async page tests still running when the loop stops early (-x)."""
+    yield
+    _flush_async_pages(0)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """On an xdist worker, hand the page scheduler counts to the controller."""
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["page_scheduler"] = _page_scheduler_counts
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the page scheduler counts of a finished xdist worker."""
+    scheduler = node.workeroutput.get("page_scheduler", {})
+    _page_scheduler_counts["ran"] += scheduler.get("ran", 0)
+    _page_scheduler_counts["peak"] = max(
+        _page_scheduler_counts["peak"], scheduler.get("peak", 0)
+    )
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report how many async page tests ran and their peak concurrency."""
+    if _page_scheduler_counts["ran"]:
+        terminalreporter.write_sep("-", "page scheduler")
+        terminalreporter.write_line(
+            f"{_page_scheduler_counts['ran']} async page tests, up to "
+            f"{_page_scheduler_counts['peak']} at once in one worker"
+        )
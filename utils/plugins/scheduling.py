@@ -0,0 +1,215 @@
+"""Worker scheduling of -n runs: longest tests first from the duration
+history, browserless tests on their own workers, one worker pool per browser
+and async page tests apart from sync browser tests (see
+utils.DurationScheduling)."""
+
+import pytest
+
+# Fixtures that launch a browser; a test whose fixture closure contains one
+# of them is a browser test (page, context, async_page... all lead to one)
+BROWSER_FIXTURES = ("browser", "page_scheduler")
+
+# Seconds per test (all phases) in this run, for the duration history
+_test_durations = {}
+
+# The duration scheduler of this run (xdist controller only)
+_duration_schedulers = []
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("saucedemo", "Sauce Demo test options")
+    group.addoption(
+        "--duration-scheduling",
+        choices=("on", "off"),
+        default="on",
+        help="With -n, hand out the longest tests first based on earlier "
+        "runs' durations (default: on). off keeps the collection order.",
+    )
+    group.addoption(
+        "--browserless-workers",
+        metavar="N",
+        type=int,
+        default=1,
+        help="With -n, reserve up to N workers for the browserless tests "
+        "(browserless_paths in pytest.ini); they never launch a browser "
+        "(default: 1; 0 runs them on browser workers).",
+    )
+    group.addoption(
+        "--browser-workers",
+        metavar="SPEC",
+        default="auto",
+        help="With -n and several --browser values, the worker pool of each "
+        "browser, e.g. chromium=4,firefox=2. auto (default) sizes pools by "
+        "each browser's estimated work within the available memory.",
+    )
+    group.addoption(
+        "--durations-file",
+        metavar="PATH",
+        default=".test-durations.json",
+        help="Per-test duration history used and updated by duration "
+        "scheduling (default: .test-durations.json).",
+    )
+
+    parser.addini(
+        "browserless_paths",
+        type="linelist",
+        default=[],
+        help="Test directories or files whose tests run without a browser "
+        "(e.g. tests/api); requesting a browser fixture there is an error.",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--browserless-workers") < 0:
+        raise pytest.UsageError("--browserless-workers must be at least 0")
+    _browser_pool_sizes(config)
+
+
+def _duration_history(config):
+    """Load the duration history of --durations-file (relative to the rootdir)."""
+    from utils import DurationHistory
+
+    return DurationHistory(config.rootpath / config.getoption("--durations-file"))
+
+
+def _is_browserless(config):
+    """Return a predicate telling whether a node id is under browserless_paths."""
+    paths = tuple(path.strip("/") for path in config.getini("browserless_paths"))
+
+    def browserless(nodeid):
+        path = nodeid.split("::", 1)[0]
+        return any(path == prefix or path.startswith(f"{prefix}/") for prefix in paths)
+
+    return browserless
+
+
+def _is_async_page_test(config):
+    """Return a predicate telling whether a node id is an async page test."""
+    from utils import async_page_tests
+
+    modules = {}
+
+    def is_async_page_test(nodeid):
+        path, _, name = nodeid.partition("::")
+        if path not in modules:
+            modules[path] = async_page_tests(config.rootpath / path)
+        return name.split("[", 1)[0] in modules[path]
+
+    return is_async_page_test
+
+
+def _browser_pool_sizes(config):
+    """Parse --browser-workers into {browser: workers}, or None for auto."""
+    from utils.timings import BROWSERS
+
+    spec = config.getoption("--browser-workers")
+    if spec == "auto":
+        return None
+    sizes = {}
+    for entry in spec.split(","):
+        browser, _, workers = entry.partition("=")
+        if browser.strip() not in BROWSERS or not workers.strip().isdigit():
+            raise pytest.UsageError(
+                f"--browser-workers expects browser=N pairs (or auto), not {entry!r}"
+            )
+        sizes[browser.strip()] = int(workers)
+    return sizes
+
+
+def pytest_collection_modifyitems(config, items):
+    """Reject browser fixtures in browserless tests."""
+    browserless = _is_browserless(config)
+    for item in items:
+        if not browserless(item.nodeid):
+            continue
+        for name in BROWSER_FIXTURES:
+            if name in getattr(item, "fixturenames", ()):
+                raise pytest.UsageError(
+                    f"{item.nodeid}: tests under browserless_paths run without "
+                    f"a browser, but its fixtures need {name!r}"
+                )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Schedule -n runs longest-test-first from the duration history, with
+    browserless tests on their own workers, one worker pool per browser and
+    async page tests apart from sync browser tests."""
+    from utils import DurationScheduling
+    from utils.timings import nodeid_browser
+
+    if config.getoption("dist") != "load":
+        return None
+    by_duration = config.getoption("--duration-scheduling") == "on"
+    lane_workers = config.getoption("--browserless-workers")
+    browsers = config.getoption("--browser") or []
+    if not by_duration and not lane_workers and len(browsers) < 2:
+        return None
+    scheduler = DurationScheduling(
+        config,
+        log,
+        history=_duration_history(config) if by_duration else None,
+        browserless=_is_browserless(config),
+        browserless_workers=lane_workers,
+        browser_of=nodeid_browser,
+        pool_sizes=_browser_pool_sizes(config),
+        async_page=_is_async_page_test(config),
+        pages_per_worker=config.getoption("--pages-per-worker"),
+    )
+    _duration_schedulers.append(scheduler)
+    return scheduler
+
+
+def pytest_runtest_logreport(report):
+    """Accumulate test durations for the duration history."""
+    _test_durations[report.nodeid] = (
+        _test_durations.get(report.nodeid, 0) + report.duration
+    )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Add this run's test durations to the duration history.
+
+    Runs on the xdist controller, which sees every report, or in the only
+    process when running without xdist.
+    """
+    if hasattr(session.config, "workerinput") or not _test_durations:
+        return
+    history = _duration_history(session.config)
+    history.update(_test_durations)
+    history.save()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report the estimated work per worker and how the workers were split."""
+    for scheduler in _duration_schedulers:
+        if not scheduler.collection:
+            continue
+        workers = scheduler.workers or 1
+        terminalreporter.write_sep("-", "duration scheduling")
+        if scheduler.history is not None:
+            terminalreporter.write_line(
+                f"{scheduler.known}/{len(scheduler.collection)} tests had history; "
+                f"estimated {scheduler.estimated_work:.1f}s of work, "
+                f"{scheduler.estimated_work / workers:.1f}s per worker across {workers}"
+            )
+        if scheduler.lane_nodes:
+            terminalreporter.write_line(
+                f"{len(scheduler.lane_tests)} browserless tests; the "
+                f"{len(scheduler.lane_nodes)} of {workers} workers reserved for them "
+                "launched no browser"
+            )
+        if scheduler.async_nodes:
+            terminalreporter.write_line(
+                f"{len(scheduler.async_tests)} async page tests on "
+                f"{len(scheduler.async_nodes)} workers, sync browser tests on "
+                f"{len(scheduler.sync_nodes)}"
+            )
+        if scheduler.pools:
+            terminalreporter.write_line(
+                "browser pools: "
+                + ", ".join(
+                    f"{browser} {size} workers"
+                    for browser, size in sorted(scheduler.pools.items())
+                )
+            )
@@ -0,0 +1,328 @@
+import asyncio
+import contextvars
+import inspect
+import json
+import os
+import sys
+import time
+from collections.abc import Iterable
+from functools import wraps
+from pathlib import Path
+
+try:
+    from playwright._impl._connection import Channel
+except ImportError:
+    # Private Playwright module; install() reports it missing
+    Channel = None
+
+from .action_timer import public_methods
+from .timings import percentile
+
+# Round trips per page object method call from which it is flagged as a
+# batching candidate (e.g. five separate is_visible checks)
+CHATTY_ROUND_TRIPS = 4
+
+# The running test and the page object methods it is inside, outermost first.
+# Context variables follow the sync API into Playwright's dispatcher task and
+# each async page test into its own task on the page scheduler.
+_current_test = contextvars.ContextVar("rpc_test", default="<session>")
+_current_methods = contextvars.ContextVar("rpc_methods", default=())
+
+
+class RpcProfilerError(Exception):
+    """The installed Playwright lacks the internals the profiler patches."""
+
+
+class RpcProfiler:
+    """Counts and times every Playwright driver round trip while installed.
+
+    Every protocol call that waits for a reply (``Frame.isVisible``,
+    ``Frame.innerText``, ``Frame.queryCount``...) passes through Playwright's
+    ``Channel._inner_send``; while installed, the profiler times each one and
+    attributes it to the running test (see ``begin_test``), the innermost page
+    object method it was issued from and the line in ``roots`` that issued
+    it. Page object methods are wrapped only to track which one is running
+    and how often it was called. ``uninstall`` restores everything, so the
+    profiler costs nothing unless installed.
+
+    ``stats`` / ``merge`` carry measurements from xdist workers to the
+    controller; ``summary`` aggregates them and ``write_speedscope`` exports a
+    profile for https://www.speedscope.app with one stack per
+    test > page object methods > protocol call, weighted by latency.
+    """
+
+    def __init__(self, root: Path, roots: Iterable[Path]):
+        """
+        Args:
+            root: Call sites are shown relative to this directory
+            roots: Directories (or files) whose lines count as call sites,
+                e.g. tests/, models/, utils/ and conftest.py
+        """
+        self.root = Path(root).resolve()
+        self.roots = tuple(
+            f"{path}{os.sep}" if path.is_dir() else str(path)
+            for path in (Path(root).resolve() for root in roots)
+        )
+        # [round trips, seconds] by test
+        self.tests = {}
+        # [calls, round trips, seconds] by page object method
+        self.methods = {}
+        # Latency of every round trip, by protocol call
+        self.rpcs = {}
+        # [round trips, seconds] by (call site, page object method, protocol call)
+        self.sites = {}
+        # [round trips, seconds] by stack (test, methods..., protocol call)
+        self.stacks = {}
+        self._originals = []
+
+    def install(self, base: type, prefix: str = ""):
+        """Start counting round trips, and track the page object methods of
+        ``base`` and its subclasses.
+
+        Call once per page object hierarchy; the Playwright channel is only
+        patched the first time.
+
+        Args:
+            base: Page object base class, e.g. models.BasePage
+            prefix: Prepended to method names, e.g. "aio." for models.aio
+
+        Raises:
+            RpcProfilerError: Playwright has no ``Channel._inner_send`` to
+                patch (a private API that may change between versions)
+        """
+        if not self._originals:
+            inner_send = getattr(Channel, "_inner_send", None)
+            if not inspect.iscoroutinefunction(inner_send):
+                raise RpcProfilerError(
+                    "this Playwright version has no coroutine "
+                    "playwright._impl._connection.Channel._inner_send to time; "
+                    "use the version pinned in uv.lock or update "
+                    "utils/rpc_profiler.py"
+                )
+            self._originals.append((Channel, "_inner_send", Channel._inner_send))
+            Channel._inner_send = self._wrap_send(Channel._inner_send)
+        for cls, name, function in public_methods(base):
+            self._originals.append((cls, name, function))
+            setattr(cls, name, self._wrap_method(function, name, prefix))
+        return self
+
+    def uninstall(self):
+        """Restore Playwright's channel and the page object methods."""
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    def begin_test(self, nodeid: str):
+        """Attribute round trips from now on to a test, until the next one
+        begins. Async tasks started meanwhile keep the test they started in."""
+        _current_test.set(nodeid)
+
+    def stats(self) -> dict:
+        """Return this process's measurements, in a form xdist can send."""
+        return {
+            "tests": self.tests,
+            "methods": self.methods,
+            "rpcs": self.rpcs,
+            "sites": [[*key, *totals] for key, totals in self.sites.items()],
+            "stacks": [[list(stack), *totals] for stack, totals in self.stacks.items()],
+        }
+
+    def merge(self, stats: dict):
+        """Add the measurements of another process (see stats)."""
+        for test, (count, seconds) in stats["tests"].items():
+            _add(self.tests, test, count, seconds)
+        for method, (calls, count, seconds) in stats["methods"].items():
+            totals = self.methods.setdefault(method, [0, 0, 0.0])
+            totals[0] += calls
+            totals[1] += count
+            totals[2] += seconds
+        for rpc, durations in stats["rpcs"].items():
+            self.rpcs.setdefault(rpc, []).extend(durations)
+        for site, method, rpc, count, seconds in stats["sites"]:
+            _add(self.sites, (site, method, rpc), count, seconds)
+        for stack, count, seconds in stats["stacks"]:
+            _add(self.stacks, tuple(stack), count, seconds)
+
+    def summary(self, top: int = 20, chatty: int = CHATTY_ROUND_TRIPS) -> dict:
+        """Aggregate round trips per test, page object method, protocol call
+        and call site.
+
+        Args:
+            top: Number of tests and call sites to keep
+            chatty: Round trips per method call from which a method is flagged
+
+        Returns:
+            dict: "tests" and "call_sites" (most round trips first),
+            "methods" (most round trips per call first), "rpcs" (most time
+            first) and "chatty" (names of flagged methods); times in seconds
+        """
+        tests = sorted(self.tests.items(), key=lambda entry: -entry[1][0])
+        methods = [
+            {
+                "method": method,
+                "calls": calls,
+                "round_trips": count,
+                "per_call": count / calls if calls else float(count),
+                "seconds": seconds,
+            }
+            for method, (calls, count, seconds) in self.methods.items()
+            if count
+        ]
+        methods.sort(key=lambda entry: (-entry["per_call"], -entry["round_trips"]))
+        rpcs = [
+            {
+                "rpc": rpc,
+                "round_trips": len(durations),
+                "seconds": sum(durations),
+                "p95": percentile(durations, 95),
+            }
+            for rpc, durations in self.rpcs.items()
+            if durations
+        ]
+        rpcs.sort(key=lambda entry: -entry["seconds"])
+        sites = sorted(self.sites.items(), key=lambda entry: -entry[1][0])
+        return {
+            "tests": [
+                {"test": test, "round_trips": count, "seconds": seconds}
+                for test, (count, seconds) in tests[:top]
+            ],
+            "methods": methods,
+            "rpcs": rpcs,
+            "call_sites": [
+                {
+                    "site": site,
+                    "method": method,
+                    "rpc": rpc,
+                    "round_trips": count,
+                    "seconds": seconds,
+                }
+                for (site, method, rpc), (count, seconds) in sites[:top]
+            ],
+            "chatty": [
+                entry["method"] for entry in methods if entry["per_call"] >= chatty
+            ],
+        }
+
+    def write_json(self, path, top: int = 20):
+        """Write the summary to ``path`` as JSON."""
+        _write(path, self.summary(top))
+
+    def write_speedscope(self, path):
+        """Write a speedscope profile of the round trips to ``path``."""
+        frames = {}
+        samples = []
+        weights = []
+        for stack, (_, seconds) in sorted(self.stacks.items()):
+            samples.append([frames.setdefault(name, len(frames)) for name in stack])
+            weights.append(seconds)
+        _write(
+            path,
+            {
+                "$schema": "https://www.speedscope.app/file-format-schema.json",
+                "name": "Playwright round trips",
+                "exporter": "utils.RpcProfiler",
+                "shared": {"frames": [{"name": name} for name in frames]},
+                "profiles": [
+                    {
+                        "type": "sampled",
+                        "name": "round trips by test and page object method",
+                        "unit": "seconds",
+                        "startValue": 0,
+                        "endValue": sum(weights),
+                        "samples": samples,
+                        "weights": weights,
+                    }
+                ],
+            },
+        )
+
+    def _wrap_method(self, function, name, prefix):
+        profiler = self
+
+        if inspect.iscoroutinefunction(function):
+
+            @wraps(function)
+            async def tracked_async(page_object, *args, **kwargs):
+                token = profiler._enter(f"{prefix}{type(page_object).__name__}.{name}")
+                try:
+                    return await function(page_object, *args, **kwargs)
+                finally:
+                    _current_methods.reset(token)
+
+            return tracked_async
+
+        @wraps(function)
+        def tracked(page_object, *args, **kwargs):
+            token = profiler._enter(f"{prefix}{type(page_object).__name__}.{name}")
+            try:
+                return function(page_object, *args, **kwargs)
+            finally:
+                _current_methods.reset(token)
+
+        return tracked
+
+    def _wrap_send(self, inner_send):
+        profiler = self
+
+        @wraps(inner_send)
+        async def timed_send(channel, method, *args, **kwargs):
+            site = profiler._site()
+            start = time.perf_counter()
+            try:
+                return await inner_send(channel, method, *args, **kwargs)
+            finally:
+                profiler._record(
+                    f"{channel._object._type}.{method}",
+                    site,
+                    time.perf_counter() - start,
+                )
+
+        return timed_send
+
+    def _enter(self, method):
+        totals = self.methods.setdefault(method, [0, 0, 0.0])
+        totals[0] += 1
+        return _current_methods.set(_current_methods.get() + (method,))
+
+    def _site(self):
+        # The sync API runs each call in a task on Playwright's dispatcher and
+        # keeps the caller's stack on it (Playwright's own trace metadata);
+        # the async API awaits the call, so the caller's frames are on the stack
+        captured = getattr(asyncio.current_task(), "__pw_stack__", None)
+        if captured is not None:
+            frames = ((info.filename, info.lineno) for info in captured)
+        else:
+            frames = _walk(sys._getframe(2))
+        for filename, lineno in frames:
+            if filename.startswith(self.roots):
+                return f"{os.path.relpath(filename, self.root)}:{lineno}"
+        return "<playwright>"
+
+    def _record(self, rpc, site, seconds):
+        methods = _current_methods.get()
+        method = methods[-1] if methods else "-"
+        _add(self.tests, _current_test.get(), 1, seconds)
+        if methods:
+            self.methods[method][1] += 1
+            self.methods[method][2] += seconds
+        self.rpcs.setdefault(rpc, []).append(seconds)
+        _add(self.sites, (site, method, rpc), 1, seconds)
+        _add(self.stacks, (_current_test.get(), *methods, rpc), 1, seconds)
+
+
+def _walk(frame):
+    while frame is not None:
+        yield frame.f_code.co_filename, frame.f_lineno
+        frame = frame.f_back
+
+
+def _add(table, key, count, seconds):
+    totals = table.setdefault(key, [0, 0.0])
+    totals[0] += count
+    totals[1] += seconds
+
+
+def _write(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
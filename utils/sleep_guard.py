@@ -0,0 +1,151 @@
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from playwright.async_api import Frame as AsyncFrame
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Frame, Page
+
+# Hard sleep functions: (owner, name, label, duration argument), the argument
+# as (position counting self, keyword)
+SLEEP_FUNCTIONS = (
+    (Page, "wait_for_timeout", "page.wait_for_timeout", (1, "timeout")),
+    (Frame, "wait_for_timeout", "frame.wait_for_timeout", (1, "timeout")),
+    (AsyncPage, "wait_for_timeout", "page.wait_for_timeout", (1, "timeout")),
+    (AsyncFrame, "wait_for_timeout", "frame.wait_for_timeout", (1, "timeout")),
+    (time, "sleep", "time.sleep", (0, "secs")),
+    (asyncio, "sleep", "asyncio.sleep", (0, "delay")),
+)
+
+# The guard of the running test. Context variables follow a sync test on the
+# main thread and each async page test into its own task on the page
+# scheduler; threads a test starts (stand-in servers, cleanup) have none.
+_active_guard = contextvars.ContextVar("sleep_guard", default=None)
+
+# Patches shared by every installed guard: the first install applies them and
+# the last uninstall removes them, in whatever order guards come and go
+_patch_lock = threading.Lock()
+_installed = 0
+_originals = []
+
+
+class SleepGuard:
+    """Intercepts hard sleeps made directly by project code.
+
+    While installed, ``wait_for_timeout`` of sync and async pages and frames,
+    ``time.sleep`` and ``asyncio.sleep`` report every call whose caller lives
+    under one of ``roots`` to ``on_sleep`` before sleeping. Sleeps made by
+    libraries - urllib3 retry backoff, stand-in server latency threads - are
+    not the suite's and pass through unreported.
+
+    Guards are active in the context they were installed in: the main thread
+    for a sync test, or the task of an async page test (see PageScheduler),
+    so concurrent tests each see only their own sleeps. Modules under
+    ``roots`` that imported a sleep function by name (``from time import
+    sleep``) are patched as well when a guard is installed.
+
+    ``on_sleep`` receives a description such as ``"page.wait_for_timeout(300)"``
+    and the caller's ``path:line``; raising from it stops the sleep. Every
+    reported sleep is also kept in ``reported``.
+    """
+
+    def __init__(self, on_sleep: Callable[[str, str], None], roots: Iterable[Path]):
+        """
+        Args:
+            on_sleep: Called with (description, location) for each hard sleep
+            roots: Directories whose code is guarded (e.g. tests/ and models/)
+        """
+        self.on_sleep = on_sleep
+        self.roots = tuple(f"{Path(root).resolve()}/" for root in roots)
+        self.reported = []
+        self._token = None
+
+    def install(self):
+        """Start intercepting hard sleeps in the current context."""
+        global _installed
+        with _patch_lock:
+            if not _installed:
+                for owner, name, label, argument in SLEEP_FUNCTIONS:
+                    _patch(owner, name, _guarded(getattr(owner, name), label, argument))
+            _installed += 1
+            _patch_aliases(self.roots)
+        self._token = _active_guard.set(self)
+        return self
+
+    def uninstall(self):
+        """Stop intercepting, restoring the sleep functions after the last guard."""
+        global _installed
+        if self._token is None:
+            return
+        _active_guard.reset(self._token)
+        self._token = None
+        with _patch_lock:
+            _installed -= 1
+            if not _installed:
+                while _originals:
+                    owner, name, original = _originals.pop()
+                    setattr(owner, name, original)
+
+    def describe(self, root: Path) -> list[str]:
+        """Return the reported sleeps as "description at path:line", with
+        paths relative to ``root``."""
+        return [
+            f"{description} at {os.path.relpath(location, root)}"
+            for description, location in self.reported
+        ]
+
+    def __enter__(self):
+        return self.install()
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+
+    def _check(self, label, duration, frame):
+        caller = frame.f_code.co_filename
+        if caller.startswith(self.roots):
+            location = f"{caller}:{frame.f_lineno}"
+            description = f"{label}({duration})"
+            self.reported.append((description, location))
+            self.on_sleep(description, location)
+
+
+def _guarded(original, label, argument):
+    position, keyword = argument
+
+    def guarded(*args, **kwargs):
+        guard = _active_guard.get()
+        if guard is not None:
+            duration = args[position] if len(args) > position else kwargs.get(keyword)
+            guard._check(label, duration, sys._getframe(1))
+        return original(*args, **kwargs)
+
+    guarded.__wrapped__ = original
+    return guarded
+
+
+def _patch(owner, name, replacement):
+    _originals.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _patch_aliases(roots):
+    """Patch sleep functions that modules under ``roots`` imported by name."""
+    patched = {
+        getattr(owner, name).__wrapped__: getattr(owner, name)
+        for owner, name, _, _ in SLEEP_FUNCTIONS
+    }
+    for module in list(sys.modules.values()):
+        if not (getattr(module, "__file__", None) or "").startswith(roots):
+            continue
+        for name, value in list(vars(module).items()):
+            try:
+                replacement = patched.get(value)
+            except TypeError:  # unhashable module attribute
+                continue
+            if replacement is not None:
+                _patch(module, name, replacement)
@@ -0,0 +1,232 @@
+import math
+import sqlite3
+import time
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    duration REAL NOT NULL,
+    revision TEXT,
+    workers INTEGER NOT NULL,
+    exitstatus INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    browser TEXT,
+    phase TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS phases_run ON phases(run_id);
+CREATE INDEX IF NOT EXISTS phases_nodeid ON phases(nodeid);
+CREATE TABLE IF NOT EXISTS fixtures (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    name TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    total REAL NOT NULL,
+    slowest REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fixtures_run ON fixtures(run_id);
+"""
+
+# Browser parameters pytest-playwright adds to test ids (and report keywords)
+BROWSERS = ("chromium", "firefox", "webkit")
+
+
+def percentile(values, q: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence (q from 0 to 100)."""
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def report_browser(report) -> str | None:
+    """Return the browser a test report belongs to, from its keywords."""
+    for browser in BROWSERS:
+        if browser in report.keywords:
+            return browser
+    return None
+
+
+def nodeid_browser(nodeid: str) -> str | None:
+    """Return the browser a test id is parametrized with, e.g. "test_x[firefox]".
+
+    The xdist controller only sees test ids, not report keywords.
+    """
+    if not nodeid.endswith("]") or "[" not in nodeid:
+        return None
+    params = nodeid[nodeid.index("[", nodeid.rfind("::") + 1) + 1 : -1].split("-")
+    for browser in BROWSERS:
+        if browser in params:
+            return browser
+    return None
+
+
+class TimingStore:
+    """SQLite history of test timings, one row set per test run.
+
+    Every run appends the duration and outcome of each test phase (setup,
+    call, teardown) with the browser it ran on, plus per-fixture setup
+    totals. The query methods return plain rows for scripts/timing_report.py.
+    A test's duration in a run is the sum of its phases.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: Database file, created on first use
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def record_run(
+        self,
+        started: float,
+        phases: list[tuple],
+        fixtures: dict[str, list],
+        revision: str | None = None,
+        workers: int = 1,
+        exitstatus: int = 0,
+    ) -> int:
+        """Append one test run.
+
+        Args:
+            started: Epoch time the run started
+            phases: (nodeid, browser, phase, outcome, duration) per report
+            fixtures: [scope, calls, total, slowest] by fixture name
+            revision: Commit the run tested, if known
+            workers: Number of xdist workers (1 without xdist)
+            exitstatus: pytest exit status
+
+        Returns:
+            int: The new run's id
+        """
+        with self._db:
+            run_id = self._db.execute(
+                "INSERT INTO runs (started, duration, revision, workers, exitstatus)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (started, time.time() - started, revision, workers, exitstatus),
+            ).lastrowid
+            self._db.executemany(
+                "INSERT INTO phases VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, *phase) for phase in phases],
+            )
+            self._db.executemany(
+                "INSERT INTO fixtures VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id, name, *totals) for name, totals in fixtures.items()],
+            )
+        return run_id
+
+    def prune(self, keep: int) -> int:
+        """Delete every run but the latest ``keep``, with their phases and fixtures.
+
+        Args:
+            keep: Number of most recent runs to keep
+
+        Returns:
+            int: Number of runs deleted
+        """
+        with self._db:
+            stale = [
+                run_id
+                for (run_id,) in self._db.execute(
+                    "SELECT id FROM runs ORDER BY id DESC LIMIT -1 OFFSET ?", (keep,)
+                )
+            ]
+            if not stale:
+                return 0
+            marks = ", ".join("?" * len(stale))
+            for table in ("phases", "fixtures"):
+                self._db.execute(
+                    f"DELETE FROM {table} WHERE run_id IN ({marks})", stale
+                )
+            self._db.execute(f"DELETE FROM runs WHERE id IN ({marks})", stale)
+        return len(stale)
+
+    def runs(self, limit: int = 10) -> list[tuple]:
+        """Return the latest runs, oldest first.
+
+        Returns:
+            list: (id, started, duration, revision, workers, exitstatus) rows
+        """
+        rows = self._db.execute(
+            "SELECT id, started, duration, revision, workers, exitstatus"
+            " FROM runs ORDER BY id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return rows[::-1]
+
+    def test_durations(self, run_ids) -> dict[int, dict[str, float]]:
+        """Return each test's duration (all phases) per run.
+
+        Returns:
+            dict: {run_id: {nodeid: seconds}}
+        """
+        run_ids = list(run_ids)
+        result = {run_id: {} for run_id in run_ids}
+        if not run_ids:
+            return result
+        marks = ", ".join("?" * len(run_ids))
+        for run_id, nodeid, seconds in self._db.execute(
+            f"SELECT run_id, nodeid, SUM(duration) FROM phases"
+            f" WHERE run_id IN ({marks}) GROUP BY run_id, nodeid",
+            run_ids,
+        ):
+            result[run_id][nodeid] = seconds
+        return result
+
+    def phase_durations(
+        self, run_ids
+    ) -> dict[tuple[str, str | None, str], list[float]]:
+        """Return every recorded duration of each test phase across runs.
+
+        Returns:
+            dict: {(nodeid, browser, phase): [seconds, ...]}
+        """
+        run_ids = list(run_ids)
+        result = {}
+        if not run_ids:
+            return result
+        marks = ", ".join("?" * len(run_ids))
+        for nodeid, browser, phase, seconds in self._db.execute(
+            f"SELECT nodeid, browser, phase, duration FROM phases"
+            f" WHERE run_id IN ({marks})",
+            run_ids,
+        ):
+            result.setdefault((nodeid, browser, phase), []).append(seconds)
+        return result
+
+    def fixture_totals(self, run_ids) -> dict[tuple[str, str], list[tuple]]:
+        """Return each fixture's per-run setup totals across runs.
+
+        Returns:
+            dict: {(name, scope): [(calls, total, slowest), ...]}
+        """
+        run_ids = list(run_ids)
+        result = {}
+        if not run_ids:
+            return result
+        marks = ", ".join("?" * len(run_ids))
+        for name, scope, calls, total, slowest in self._db.execute(
+            f"SELECT name, scope, calls, total, slowest FROM fixtures"
+            f" WHERE run_id IN ({marks})",
+            run_ids,
+        ):
+            result.setdefault((name, scope), []).append((calls, total, slowest))
+        return result